@@ -0,0 +1,14 @@
+"""
+인증 백엔드
+"""
+from django.contrib.auth.backends import ModelBackend
+
+from .user_cache import get_cached_user
+
+
+class CachedModelBackend(ModelBackend):
+    """세션의 사용자를 account.user_cache 에서 가져오는 ModelBackend"""
+
+    def get_user(self, user_id):
+        user = get_cached_user(user_id)
+        return user if user is not None and self.user_can_authenticate(user) else None
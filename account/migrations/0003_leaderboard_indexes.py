@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0002_alter_user_options_user_created_at_alter_user_table'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='total_points',
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+    ]
@@ -30,7 +30,7 @@ class UserManager(BaseUserManager):
 class User(AbstractUser):
     email = models.EmailField(_('email address'), unique=True)
     username = models.CharField(_('username'), max_length=30, unique=True)
-    total_points = models.IntegerField(default=0)
+    total_points = models.IntegerField(default=0, db_index=True)  # 리더보드 정렬용
     created_at = models.DateTimeField(auto_now_add=True, db_column='created_at')
 
     USERNAME_FIELD = 'email'
@@ -43,4 +43,12 @@ class User(AbstractUser):
         ordering = ['-created_at']
 
     def __str__(self):
-        return self.email
\ No newline at end of file
+        return self.email
+
+    def get_session_auth_hash(self):
+        # account.user_cache 의 사용자는 password 없이 캐시되고 세션 해시만 함께 온다.
+        # set_password() 등으로 password 가 채워지면 새로 계산한다.
+        cached = getattr(self, '_session_auth_hash', None)
+        if cached is not None and 'password' in self.get_deferred_fields():
+            return cached
+        return super().get_session_auth_hash()
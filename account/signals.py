@@ -0,0 +1,16 @@
+"""
+사용자 캐시 무효화 시그널
+
+User 가 저장/삭제되면 account.user_cache 의 버전을 올린다. total_points 를 update() 로 바꾸는
+bulk 경로(community.tasks 등)는 시그널이 없으므로 bump_user_version 을 직접 부른다.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import User
+from .user_cache import bump_user_version
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    bump_user_version(instance.pk)
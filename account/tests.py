@@ -1,3 +1,60 @@
+from django.core.cache import cache
+from django.db.models import F
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from .models import User
+from .user_cache import _user_key, bump_user_version, get_cached_user
+
+
+class CachedUserTests(TestCase):
+    """세션 사용자 캐시 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='c@example.com', username='cached', password='pw')
+        self.client.force_login(self.user)
+        self.url = reverse('home_api')
+
+    def points(self):
+        return self.client.get(self.url).json()['user']['points']
+
+    def test_balance_follows_save_and_bulk_update(self):
+        self.assertEqual(self.points(), 0)
+
+        self.user.total_points = 50
+        self.user.save()
+        self.assertEqual(self.points(), 50)
+
+        # update() 경로는 버전을 직접 올려야 한다.
+        User.objects.filter(pk=self.user.pk).update(total_points=F('total_points') + 30)
+        self.assertEqual(self.points(), 50)
+        bump_user_version(self.user.pk)
+        self.assertEqual(self.points(), 80)
+
+    def test_deactivated_user_is_logged_out(self):
+        self.points()
+        self.user.is_active = False
+        self.user.save()
+        self.assertIsNone(self.client.get(self.url).json()['user'])
+
+    def test_password_hash_is_not_cached(self):
+        self.points()
+        entry = cache.get(_user_key(self.user.pk))
+        self.assertNotIn('password', entry[1])
+        self.assertNotIn(self.user.password, entry[2])
+
+        cached = get_cached_user(self.user.pk)
+        self.assertEqual(cached.get_session_auth_hash(), self.user.get_session_auth_hash())
+        # 비밀번호를 바꾸면 캐시된 해시 대신 새로 계산한다. (update_session_auth_hash)
+        cached.set_password('new-pw')
+        self.assertNotEqual(cached.get_session_auth_hash(), self.user.get_session_auth_hash())
+
+    def test_password_change_ends_existing_sessions(self):
+        self.assertEqual(self.points(), 0)
+        with self.assertNumQueries(4):  # 캐시된 사용자의 세션 해시로 검증 (User 조회 없음)
+            self.assertEqual(self.points(), 0)
+
+        self.user.set_password('new-pw')
+        self.user.save()
+        self.assertIsNone(self.client.get(self.url).json()['user'])
@@ -0,0 +1,91 @@
+"""
+로그인 사용자 캐시
+
+인증된 요청마다 하던 User 조회를 캐시로 대신한다. 사용자마다 버전을 두고
+User 가 바뀌면(save 시그널, total_points 를 update() 하는 bulk 경로) 버전을 올려
+다음 요청에서 DB 에서 다시 읽는다. 포인트 잔액이 버전보다 오래된 값으로 보이지 않도록
+버전은 DB 를 읽기 전에 확인하고, 캐시 항목에 함께 저장해 비교한다.
+
+버전과 캐시 항목은 get_many 한 번으로 읽으므로 캐시 왕복은 요청당 한 번이다.
+
+공유 캐시에 비밀번호 해시를 두지 않도록 password 필드는 빼고, 세션 검증에 필요한
+get_session_auth_hash() 값만 함께 저장한다. (비밀번호를 바꾸면 save 시그널로 버전이 올라
+새 해시와 비교되므로 기존 세션은 끝난다)
+"""
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+from myproject.db_router import primary_reads
+
+USER_TIMEOUT = 60 * 60
+CACHE_EXCLUDED_FIELDS = ('password',)
+
+
+def _version_key(user_id):
+    return f'account:user:version:{user_id}'
+
+
+def _user_key(user_id):
+    return f'account:user:{user_id}'
+
+
+def _bump(user_ids):
+    for user_id in user_ids:
+        try:
+            cache.incr(_version_key(user_id))
+        except ValueError:
+            cache.set(_version_key(user_id), time.time_ns(), None)
+
+
+def bump_user_version(*user_ids):
+    """
+    사용자 캐시를 무효화 (다음 요청 시 DB 에서 다시 읽음)
+
+    트랜잭션 안이면 커밋 직후에도 한 번 더 올린다. 커밋 전에 다른 요청이 이전 값을
+    새 버전으로 캐시하더라도 커밋 후에는 다시 읽게 된다.
+    """
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if not user_ids:
+        return
+    _bump(user_ids)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _bump(user_ids))
+
+
+def get_cached_user(user_id):
+    """캐시된 User 인스턴스 (없는 사용자면 None)"""
+    from django.contrib.auth import get_user_model
+
+    User = get_user_model()
+    version_key, user_key = _version_key(user_id), _user_key(user_id)
+    cached = cache.get_many([version_key, user_key])
+    version = cached.get(version_key)
+    entry = cached.get(user_key)
+    if version is not None and entry is not None and entry[0] == version:
+        _, field_names, values, session_auth_hash = entry
+        user = User.from_db('default', field_names, values)  # password 는 지연 필드
+        user._session_auth_hash = session_auth_hash
+        return user
+
+    if version is None:
+        cache.add(version_key, time.time_ns(), None)
+        version = cache.get(version_key)
+    # 복제 지연된 행이 새 버전으로 캐시되지 않도록 기본 DB 에서 읽는다.
+    with primary_reads():
+        user = User._default_manager.filter(pk=user_id).first()
+    if user is None:
+        return None
+    fields = [field for field in User._meta.concrete_fields if field.attname not in CACHE_EXCLUDED_FIELDS]
+    cache.set(
+        user_key,
+        (
+            version,
+            [field.attname for field in fields],
+            [getattr(user, field.attname) for field in fields],
+            user.get_session_auth_hash(),
+        ),
+        USER_TIMEOUT,
+    )
+    return user
@@ -1,33 +1,47 @@
 from django.contrib import admin
-from .models import CommunityMeeting, MeetingParticipant, MeetingSubmission, SubmissionMedia
-from .tasks import grant_points_for_meeting
-from notification.models import Notification
+from django.db.models import Count
+from .models import CommunityMeeting, LifecycleSweepRun, MeetingParticipant, MeetingSubmission, SubmissionMedia
+from .tasks import approve_submissions, reject_submissions
 
 # Register your models here.
 
 @admin.register(CommunityMeeting)
 class CommunityMeetingAdmin(admin.ModelAdmin):
-    list_display = ['meeting_id', 'title', 'host_id', 'meeting_date', 'capacity', 'created_at']
-    list_filter = ['meeting_date', 'created_at']
+    list_display = ['meeting_id', 'title', 'host_id', 'meeting_date', 'status', 'capacity', 'participant_count', 'get_submission_count', 'created_at']
+    list_filter = ['status', 'meeting_date', 'created_at']
+    list_select_related = ['host_id']
     search_fields = ['title', 'description', 'location_name']
-    readonly_fields = ['meeting_id', 'created_at']
+    readonly_fields = ['meeting_id', 'participant_count', 'reminder_sent_at', 'created_at']
+    autocomplete_fields = ['host_id']
     date_hierarchy = 'meeting_date'
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_submission_count=Count('submissions'))
+    
+    def get_submission_count(self, obj):
+        return obj._submission_count
+    get_submission_count.short_description = '제출 수'
+    get_submission_count.admin_order_field = '_submission_count'
 
 
 @admin.register(MeetingParticipant)
 class MeetingParticipantAdmin(admin.ModelAdmin):
     list_display = ['participant_id', 'meeting_id', 'user_id', 'joined_at']
     list_filter = ['joined_at']
+    list_select_related = ['meeting_id', 'user_id']
     search_fields = ['meeting_id__title', 'user_id__username', 'user_id__email']
     readonly_fields = ['participant_id', 'joined_at']
+    autocomplete_fields = ['meeting_id', 'user_id']
 
 
 @admin.register(MeetingSubmission)
 class MeetingSubmissionAdmin(admin.ModelAdmin):
-    list_display = ['submission_id', 'meeting_id', 'host_id', 'status', 'created_at']
+    list_display = ['submission_id', 'meeting_id', 'host_id', 'status', 'get_media_count', 'created_at']
     list_filter = ['status', 'created_at']
+    list_select_related = ['meeting_id', 'host_id']
     search_fields = ['meeting_id__title', 'host_id__username', 'text_summary']
     readonly_fields = ['submission_id', 'created_at']
+    autocomplete_fields = ['meeting_id', 'host_id']
     actions = ['approve_submission', 'reject_submission']
     
     fieldsets = (
@@ -39,50 +53,37 @@ class MeetingSubmissionAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_media_count=Count('media_files'))
+    
+    def get_media_count(self, obj):
+        return obj._media_count
+    get_media_count.short_description = '미디어 수'
+    get_media_count.admin_order_field = '_media_count'
+    
     def approve_submission(self, request, queryset):
-        """관리자 승인 처리"""
-        for submission in queryset:
-            if submission.status == 'pending':
-                submission.status = 'admin_pass'
-                submission.save()
-                
-                # 포인트 지급
-                grant_points_for_meeting(submission.meeting_id)
-                
-                # 알림 전송
-                Notification.objects.create(
-                    user_id=submission.host_id,
-                    notification_type='ai_approved',
-                    title='인증 승인',
-                    message=f"'{submission.meeting_id.title}' 모임 인증이 승인되었습니다.",
-                    related_meeting_id=submission.meeting_id
-                )
+        """관리자 승인 처리 (청크 단위 트랜잭션으로 일괄 처리)"""
+        submission_ids = list(queryset.values_list('submission_id', flat=True))
+        approved = approve_submissions(submission_ids)
+        skipped = len(submission_ids) - approved
         
-        self.message_user(request, f'{queryset.count()}개의 제출물이 승인되었습니다.')
+        message = f'{approved}개의 제출물이 승인되었습니다.'
+        if skipped:
+            message += f' (검토 대기 상태가 아닌 {skipped}개는 건너뛰었습니다.)'
+        self.message_user(request, message)
     approve_submission.short_description = '선택된 제출물 승인'
     
     def reject_submission(self, request, queryset):
         """관리자 반려 처리"""
-        # 반려 사유 입력을 위한 별도 페이지로 리다이렉트하거나
-        # 여기서 직접 처리할 수 있습니다.
-        # 간단한 구현을 위해 admin_feedback 필드를 사용합니다.
-        for submission in queryset:
-            if submission.status == 'pending':
-                submission.status = 'rejected'
-                if not submission.admin_feedback:
-                    submission.admin_feedback = '관리자에 의해 반려되었습니다.'
-                submission.save()
-                
-                # 알림 전송
-                Notification.objects.create(
-                    user_id=submission.host_id,
-                    notification_type='admin_rejected',
-                    title='인증 반려',
-                    message=f"'{submission.meeting_id.title}' 모임 인증이 반려되었습니다. (사유: {submission.admin_feedback})",
-                    related_meeting_id=submission.meeting_id
-                )
+        # 반려 사유는 admin_feedback 필드를 사용하고, 비어 있으면 기본 사유를 채웁니다.
+        submission_ids = list(queryset.values_list('submission_id', flat=True))
+        rejected = reject_submissions(submission_ids)
+        skipped = len(submission_ids) - rejected
         
-        self.message_user(request, f'{queryset.count()}개의 제출물이 반려되었습니다.')
+        message = f'{rejected}개의 제출물이 반려되었습니다.'
+        if skipped:
+            message += f' (검토 대기 상태가 아닌 {skipped}개는 건너뛰었습니다.)'
+        self.message_user(request, message)
     reject_submission.short_description = '선택된 제출물 반려'
 
 
@@ -90,5 +91,20 @@ class MeetingSubmissionAdmin(admin.ModelAdmin):
 class SubmissionMediaAdmin(admin.ModelAdmin):
     list_display = ['media_id', 'submission_id', 'media_type', 'user_id', 'created_at']
     list_filter = ['media_type', 'created_at']
+    list_select_related = ['submission_id__meeting_id', 'user_id']  # __str__ 이 submission → meeting 을 따라감
     search_fields = ['submission_id__meeting_id__title', 'user_id__username']
     readonly_fields = ['media_id', 'created_at']
+    autocomplete_fields = ['submission_id', 'user_id']
+
+
+@admin.register(LifecycleSweepRun)
+class LifecycleSweepRunAdmin(admin.ModelAdmin):
+    list_display = ['run_id', 'started_at', 'duration_ms', 'meetings_closed', 'reminders_sent', 'submissions_expired', 'meetings_archived']
+    date_hierarchy = 'started_at'
+    
+    def has_add_permission(self, request):
+        # sweep_meetings 명령으로만 생성
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,53 @@
+"""
+커뮤니티 이벤트 핸들러 (outbox)
+"""
+from notification.models import Notification
+from outbox.events import handler
+
+
+@handler('points_granted', name='community.points_notifications')
+def send_points_notifications(events):
+    """모임 포인트 지급 알림 (참여자)"""
+    Notification.objects.bulk_create([
+        Notification(
+            user_id_id=user_id,
+            notification_type='points_earned',
+            title='포인트 지급',
+            message=f"'{event.payload['meeting_title']}' 모임 활동으로 {event.payload['points_per_person']} 포인트가 지급되었습니다.",
+            related_meeting_id_id=event.payload['meeting_id']
+        )
+        for event in events
+        for user_id in event.payload['participant_ids']
+    ])
+
+
+@handler('submission_approved', 'submission_rejected', 'submission_needs_review', name='community.review_notifications')
+def send_review_notifications(events):
+    """인증 승인/반려/검토 대기 알림 (호스트)"""
+    notifications = []
+    for event in events:
+        payload = event.payload
+        if event.event_type == 'submission_needs_review':
+            notification_type = 'admin_review'
+            title = '관리자 검토 대기'
+            message = f"'{payload['meeting_title']}' 모임 인증이 관리자 검토 대기 중입니다."
+        elif event.event_type == 'submission_rejected':
+            notification_type = 'admin_rejected'
+            title = '인증 반려'
+            message = f"'{payload['meeting_title']}' 모임 인증이 반려되었습니다. (사유: {payload['feedback']})"
+        elif payload.get('mode') == 'ai':
+            notification_type = 'ai_approved'
+            title = '인증 자동 승인'
+            message = f"'{payload['meeting_title']}' 모임 인증이 자동 승인되었습니다."
+        else:
+            notification_type = 'ai_approved'
+            title = '인증 승인'
+            message = f"'{payload['meeting_title']}' 모임 인증이 승인되었습니다."
+        notifications.append(Notification(
+            user_id_id=payload['host_id'],
+            notification_type=notification_type,
+            title=title,
+            message=message,
+            related_meeting_id_id=payload['meeting_id']
+        ))
+    Notification.objects.bulk_create(notifications)
@@ -0,0 +1,139 @@
+"""
+모임 라이프사이클 스윕
+
+sweep_meetings 명령이 주기적으로 호출한다. 각 단계는 (status, meeting_date) /
+(status, created_at) 인덱스 범위만 읽고 batch_size 단위로 처리하므로
+누적된 모임 수와 관계없이 한 번의 스윕 비용은 "이번에 상태가 바뀌는 건수"에 비례한다.
+
+    open ──(meeting_date 경과)──▶ closed ──(ARCHIVE_AFTER_DAYS 경과)──▶ archived
+    closed 이고 인증 제출이 없으면 호스트에게 한 번 알림
+    pending 제출물이 SUBMISSION_EXPIRE_DAYS 동안 검토되지 않으면 expired
+"""
+import time
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from myproject.conditional import bump_version
+from notification.models import Notification
+
+from .models import CommunityMeeting, LifecycleSweepRun, MeetingSubmission
+
+DEFAULT_BATCH_SIZE = 500
+SUBMISSION_EXPIRE_DAYS = 7
+ARCHIVE_AFTER_DAYS = 30
+# 종료 후 이 기간 안의 모임에만 인증 제출 알림을 보낸다. (오래된 모임은 알림 대상 아님)
+REMINDER_WINDOW_DAYS = 3
+
+
+def _in_batches(queryset, batch_size, apply):
+    """queryset 의 pk 를 batch_size 씩 잘라 apply(pks) 를 트랜잭션으로 실행. 처리 건수 반환."""
+    total = 0
+    while True:
+        with transaction.atomic():
+            pks = list(queryset.values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                return total
+            apply(pks)
+        total += len(pks)
+        if len(pks) < batch_size:
+            return total
+
+
+def close_past_meetings(now, batch_size=DEFAULT_BATCH_SIZE):
+    """일시가 지난 모집 중 모임을 종료 상태로 전환"""
+    queryset = CommunityMeeting.objects.filter(status='open', meeting_date__lte=now).order_by('meeting_date')
+    return _in_batches(
+        queryset, batch_size,
+        lambda pks: CommunityMeeting.objects.filter(pk__in=pks, status='open').update(status='closed'),
+    )
+
+
+def send_submission_reminders(now, batch_size=DEFAULT_BATCH_SIZE):
+    """종료됐지만 인증을 제출하지 않은 모임의 호스트에게 알림 (모임당 한 번)"""
+    queryset = (
+        CommunityMeeting.objects.filter(
+            status='closed',
+            reminder_sent_at__isnull=True,
+            meeting_date__gte=now - timedelta(days=REMINDER_WINDOW_DAYS),
+        )
+        .exclude(Exists(MeetingSubmission.objects.filter(meeting_id=OuterRef('pk'))))
+        .order_by('meeting_date')
+    )
+
+    def remind(pks):
+        meetings = list(CommunityMeeting.objects.filter(pk__in=pks).values_list('pk', 'host_id', 'title'))
+        Notification.objects.bulk_create([
+            Notification(
+                user_id_id=host_id,
+                notification_type='submission_reminder',
+                title='인증 제출 요청',
+                message=f"'{title}' 모임이 종료되었습니다. 모임 인증을 제출해주세요.",
+                related_meeting_id_id=meeting_pk,
+            )
+            for meeting_pk, host_id, title in meetings
+        ])
+        CommunityMeeting.objects.filter(pk__in=pks).update(reminder_sent_at=now)
+
+    return _in_batches(queryset, batch_size, remind)
+
+
+def expire_stale_submissions(now, batch_size=DEFAULT_BATCH_SIZE):
+    """오래 검토되지 않은 pending 제출물을 만료 처리 (호스트는 다시 제출할 수 있다)"""
+    queryset = MeetingSubmission.objects.filter(
+        status='pending',
+        created_at__lt=now - timedelta(days=SUBMISSION_EXPIRE_DAYS),
+    ).order_by('created_at')
+
+    def expire(pks):
+        submissions = list(
+            MeetingSubmission.objects.filter(pk__in=pks, status='pending')
+            .values_list('pk', 'host_id', 'meeting_id', 'meeting_id__title')
+        )
+        MeetingSubmission.objects.filter(pk__in=[row[0] for row in submissions]).update(status='expired')
+        Notification.objects.bulk_create([
+            Notification(
+                user_id_id=host_id,
+                notification_type='submission_expired',
+                title='인증 기한 만료',
+                message=f"'{title}' 모임 인증이 검토 기한을 넘겨 만료되었습니다. 다시 제출해주세요.",
+                related_meeting_id_id=meeting_pk,
+            )
+            for _, host_id, meeting_pk, title in submissions
+        ])
+
+    return _in_batches(queryset, batch_size, expire)
+
+
+def archive_old_meetings(now, batch_size=DEFAULT_BATCH_SIZE):
+    """종료 후 오래된 모임을 보관 상태로 전환"""
+    queryset = CommunityMeeting.objects.filter(
+        status='closed',
+        meeting_date__lt=now - timedelta(days=ARCHIVE_AFTER_DAYS),
+    ).order_by('meeting_date')
+    return _in_batches(
+        queryset, batch_size,
+        lambda pks: CommunityMeeting.objects.filter(pk__in=pks, status='closed').update(status='archived'),
+    )
+
+
+def sweep(batch_size=DEFAULT_BATCH_SIZE, now=None):
+    """스윕 한 번 실행 후 실행 기록(LifecycleSweepRun)을 남기고 반환"""
+    now = now or timezone.now()
+    started = time.monotonic()
+    run = LifecycleSweepRun(
+        started_at=now,
+        meetings_closed=close_past_meetings(now, batch_size),
+        reminders_sent=send_submission_reminders(now, batch_size),
+        submissions_expired=expire_stale_submissions(now, batch_size),
+        meetings_archived=archive_old_meetings(now, batch_size),
+    )
+    run.duration_ms = int((time.monotonic() - started) * 1000)
+    run.save()
+    if run.meetings_closed or run.meetings_archived:
+        bump_version('meetings')
+    if run.submissions_expired:
+        bump_version('submissions')
+    return run
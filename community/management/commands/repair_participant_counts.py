@@ -0,0 +1,24 @@
+"""
+모임 참여자 수 정합성 점검/보정 (매일 밤 cron 실행용)
+
+    python manage.py repair_participant_counts
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from community.tasks import repair_participant_counts
+
+
+class Command(BaseCommand):
+    help = 'CommunityMeeting.participant_count 를 실제 참여자 수와 비교해 어긋난 값을 보정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='한 번에 갱신할 모임 수')
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        repaired = repair_participant_counts(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f'{repaired}개 모임의 참여자 수를 보정했습니다. ({time.monotonic() - started:.2f}s)'
+        ))
@@ -0,0 +1,59 @@
+"""
+검토 대기 제출물 일괄 승인/반려
+
+    python manage.py review_submissions approve
+    python manage.py review_submissions reject --meeting 12 --meeting 15
+    python manage.py review_submissions approve --before 2025-12-01 --chunk-size 200
+
+관리자 화면에서 처리하기 어려운 대량의 pending 제출물을 청크 단위 트랜잭션으로 처리하고
+진행 상황을 출력한다.
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from community.models import MeetingSubmission
+from community.tasks import REVIEW_CHUNK_SIZE, approve_submissions, reject_submissions
+
+
+class Command(BaseCommand):
+    help = '검토 대기(pending) 제출물을 일괄 승인하거나 반려합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['approve', 'reject'])
+        parser.add_argument('--meeting', type=int, action='append', dest='meetings', help='대상 모임 ID (여러 번 지정 가능)')
+        parser.add_argument('--before', help='이 날짜(YYYY-MM-DD) 이전에 제출된 것만 처리')
+        parser.add_argument('--chunk-size', type=int, default=REVIEW_CHUNK_SIZE, help='트랜잭션 하나에서 처리할 제출물 수')
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size 는 1 이상이어야 합니다.')
+
+        queryset = MeetingSubmission.objects.filter(status='pending')
+        if options['meetings']:
+            queryset = queryset.filter(meeting_id__in=options['meetings'])
+        if options['before']:
+            before = parse_date(options['before'])
+            if before is None:
+                raise CommandError('--before 는 YYYY-MM-DD 형식이어야 합니다.')
+            queryset = queryset.filter(created_at__date__lt=before)
+
+        submission_ids = list(queryset.order_by('submission_id').values_list('submission_id', flat=True))
+        if not submission_ids:
+            self.stdout.write('처리할 제출물이 없습니다.')
+            return
+
+        started = time.monotonic()
+
+        def report(done, total):
+            elapsed = time.monotonic() - started
+            self.stdout.write(f'  {done}/{total} ({done / elapsed if elapsed else 0:.0f}건/s)')
+
+        engine = approve_submissions if options['action'] == 'approve' else reject_submissions
+        processed = engine(submission_ids, chunk_size=options['chunk_size'], progress=report)
+
+        label = '승인' if options['action'] == 'approve' else '반려'
+        self.stdout.write(self.style.SUCCESS(
+            f'{processed}개 {label} 완료 ({time.monotonic() - started:.1f}s)'
+        ))
@@ -0,0 +1,34 @@
+"""
+모임 라이프사이클 스윕 (cron 또는 상시 실행)
+
+    python manage.py sweep_meetings                      # 한 번 실행 (cron: */5 * * * *)
+    python manage.py sweep_meetings --loop --interval 60
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from community.lifecycle import DEFAULT_BATCH_SIZE, sweep
+
+
+class Command(BaseCommand):
+    help = '지난 모임 종료, 인증 제출 알림, 오래된 pending 제출물 만료, 모임 보관을 일괄 처리합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='트랜잭션 하나에서 처리할 건수')
+        parser.add_argument('--loop', action='store_true', help='종료하지 않고 계속 실행')
+        parser.add_argument('--interval', type=float, default=60.0, help='--loop 에서 스윕 사이 대기 시간(초)')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size 는 1 이상이어야 합니다.')
+
+        while True:
+            run = sweep(batch_size=options['batch_size'])
+            self.stdout.write(
+                f'[{run.started_at:%Y-%m-%d %H:%M:%S}] 종료 {run.meetings_closed}, 알림 {run.reminders_sent}, '
+                f'제출 만료 {run.submissions_expired}, 보관 {run.meetings_archived} ({run.duration_ms}ms)'
+            )
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:22
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_participant_count(apps, schema_editor):
+    CommunityMeeting = apps.get_model('community', 'CommunityMeeting')
+    MeetingParticipant = apps.get_model('community', 'MeetingParticipant')
+    db_alias = schema_editor.connection.alias
+    counts = (
+        MeetingParticipant.objects.using(db_alias).filter(meeting_id=OuterRef('pk'))
+        .order_by()
+        .values('meeting_id')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    CommunityMeeting.objects.using(db_alias).update(participant_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='communitymeeting',
+            name='participant_count',
+            field=models.IntegerField(default=0, editable=False, help_text='참여자 수 (MeetingParticipant 시그널로 유지, repair_participant_counts 로 보정)'),
+        ),
+        migrations.RunPython(fill_participant_count, migrations.RunPython.noop),
+    ]
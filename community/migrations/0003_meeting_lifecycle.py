@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0002_communitymeeting_participant_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LifecycleSweepRun',
+            fields=[
+                ('run_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('started_at', models.DateTimeField()),
+                ('duration_ms', models.IntegerField(default=0)),
+                ('meetings_closed', models.IntegerField(default=0)),
+                ('reminders_sent', models.IntegerField(default=0)),
+                ('submissions_expired', models.IntegerField(default=0)),
+                ('meetings_archived', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'lifecycle_sweep_run',
+                'ordering': ['-started_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='communitymeeting',
+            name='reminder_sent_at',
+            field=models.DateTimeField(blank=True, help_text='호스트 인증 제출 알림 발송 시각', null=True),
+        ),
+        migrations.AddField(
+            model_name='communitymeeting',
+            name='status',
+            field=models.CharField(choices=[('open', '모집 중'), ('closed', '종료 (인증 대기)'), ('archived', '보관')], default='open', help_text='sweep_meetings 명령이 meeting_date 기준으로 전환', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='meetingsubmission',
+            name='status',
+            field=models.CharField(choices=[('pending', '검토 대기'), ('ai_pass', 'AI 승인'), ('admin_pass', '관리자 승인'), ('rejected', '반려'), ('expired', '기한 만료')], default='pending', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='communitymeeting',
+            index=models.Index(fields=['status', 'meeting_date'], name='community_m_status_b664fa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='meetingsubmission',
+            index=models.Index(fields=['status', 'created_at'], name='meeting_sub_status_ea7235_idx'),
+        ),
+    ]
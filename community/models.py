@@ -5,6 +5,12 @@ from account.models import User
 
 class CommunityMeeting(models.Model):
     """커뮤니티 모임 모델"""
+    STATUS_CHOICES = [
+        ('open', '모집 중'),
+        ('closed', '종료 (인증 대기)'),
+        ('archived', '보관'),
+    ]
+    
     meeting_id = models.AutoField(primary_key=True)
     host_id = models.ForeignKey(User, on_delete=models.CASCADE, related_name='hosted_meetings', db_column='host_id')
     title = models.CharField(max_length=200)
@@ -13,14 +19,26 @@ class CommunityMeeting(models.Model):
     location_coords = models.CharField(max_length=100, help_text="Latitude,Longitude 형식")
     meeting_date = models.DateTimeField()
     capacity = models.IntegerField(default=10)
+    participant_count = models.IntegerField(default=0, editable=False,
+                                            help_text="참여자 수 (MeetingParticipant 시그널로 유지, repair_participant_counts 로 보정)")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='open',
+                              help_text="sweep_meetings 명령이 meeting_date 기준으로 전환")
+    reminder_sent_at = models.DateTimeField(null=True, blank=True, help_text="호스트 인증 제출 알림 발송 시각")
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
         db_table = 'community_meeting'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'meeting_date']),  # 라이프사이클 스윕 범위 조회
+        ]
     
     def __str__(self):
         return self.title
+    
+    @property
+    def is_full(self):
+        return self.participant_count >= self.capacity
 
 
 class MeetingParticipant(models.Model):
@@ -46,6 +64,7 @@ class MeetingSubmission(models.Model):
         ('ai_pass', 'AI 승인'),
         ('admin_pass', '관리자 승인'),
         ('rejected', '반려'),
+        ('expired', '기한 만료'),
     ]
     
     submission_id = models.AutoField(primary_key=True)
@@ -59,6 +78,9 @@ class MeetingSubmission(models.Model):
     class Meta:
         db_table = 'meeting_submission'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),  # 오래된 pending 만료 스윕
+        ]
     
     def __str__(self):
         return f"{self.meeting_id.title} - {self.get_status_display()}"
@@ -85,3 +107,21 @@ class SubmissionMedia(models.Model):
     
     def __str__(self):
         return f"{self.submission_id.meeting_id.title} - {self.get_media_type_display()}"
+
+
+class LifecycleSweepRun(models.Model):
+    """모임 라이프사이클 스윕 실행 기록 (실행 시간/처리 건수)"""
+    run_id = models.BigAutoField(primary_key=True)
+    started_at = models.DateTimeField()
+    duration_ms = models.IntegerField(default=0)
+    meetings_closed = models.IntegerField(default=0)
+    reminders_sent = models.IntegerField(default=0)
+    submissions_expired = models.IntegerField(default=0)
+    meetings_archived = models.IntegerField(default=0)
+    
+    class Meta:
+        db_table = 'lifecycle_sweep_run'
+        ordering = ['-started_at']
+    
+    def __str__(self):
+        return f"{self.started_at:%Y-%m-%d %H:%M} ({self.duration_ms}ms)"
@@ -0,0 +1,46 @@
+"""
+참여자 수(CommunityMeeting.participant_count) 유지 시그널
+
+참여/취소 시 F() 로 원자적으로 증감한다.
+시그널을 거치지 않는 경로(bulk_create, raw SQL 등)로 생긴 오차는
+repair_participant_counts 명령이 보정한다.
+
+모임 목록/상세/홈 API 의 ETag 가 바뀌도록 모임 관련 변경마다 'meetings' 버전을,
+제출물 변경마다 'submissions' 버전을 올린다.
+"""
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from myproject.conditional import bump_version
+
+from .models import CommunityMeeting, MeetingParticipant, MeetingSubmission
+
+
+@receiver(post_save, sender=MeetingParticipant)
+def increment_participant_count(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        CommunityMeeting.objects.filter(pk=instance.meeting_id_id).update(
+            participant_count=F('participant_count') + 1
+        )
+        bump_version('meetings')
+
+
+@receiver(post_delete, sender=MeetingParticipant)
+def decrement_participant_count(sender, instance, **kwargs):
+    CommunityMeeting.objects.filter(pk=instance.meeting_id_id, participant_count__gt=0).update(
+        participant_count=F('participant_count') - 1
+    )
+    bump_version('meetings')
+
+
+@receiver(post_save, sender=CommunityMeeting)
+@receiver(post_delete, sender=CommunityMeeting)
+def bump_meetings_version(sender, **kwargs):
+    bump_version('meetings')
+
+
+@receiver(post_save, sender=MeetingSubmission)
+@receiver(post_delete, sender=MeetingSubmission)
+def bump_submissions_version(sender, **kwargs):
+    bump_version('submissions')
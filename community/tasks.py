@@ -1,9 +1,21 @@
 """
 AI 인증 및 포인트 지급 로직
+
+상태 변경(제출 상태, 포인트 원장, 사용자 포인트, 펫 XP)은 여기서 트랜잭션으로 처리하고,
+알림·기부 풀 갱신·명예의 전당 같은 후속 작업은 outbox 이벤트로 발행한다.
+(핸들러: community/handlers.py, donation/handlers.py, growth/handlers.py)
 """
+from collections import defaultdict
+
 from .models import MeetingSubmission, SubmissionMedia
 from growth.models import PointsHistory, UserPet
+from account.user_cache import bump_user_version
+from growth.progression import apply_xp, grant_pet_xp_bulk
+from mypage.summary import bump_summary_version
+from myproject.conditional import bump_version
+from outbox.events import publish, publish_many
 from notification.models import Notification
+from django.db import transaction
 from django.utils import timezone
 
 
@@ -16,33 +28,24 @@ def process_ai_verification(submission_id):
     ai_result = simulate_ai_verification(submission)
     
     if ai_result['approved']:
-        # AI 승인
-        submission.status = 'ai_pass'
-        submission.save()
-        
-        # 포인트 지급
-        grant_points_for_meeting(submission.meeting_id)
-        
-        # 알림 전송
-        Notification.objects.create(
-            user_id=submission.host_id,
-            notification_type='ai_approved',
-            title='인증 자동 승인',
-            message=f"'{submission.meeting_id.title}' 모임 인증이 자동 승인되었습니다."
-        )
+        with transaction.atomic():
+            # AI 승인
+            submission.status = 'ai_pass'
+            submission.save()
+            
+            # 포인트 지급
+            grant_points_for_meeting(submission.meeting_id)
+            
+            # 알림은 이벤트 핸들러에서 전송
+            publish('submission_approved', **_submission_payload(submission, mode='ai'))
     else:
-        # 관리자 검토 필요
-        submission.status = 'pending'
-        submission.save()
-        
-        # 알림 전송
-        Notification.objects.create(
-            user_id=submission.host_id,
-            notification_type='admin_review',
-            title='관리자 검토 대기',
-            message=f"'{submission.meeting_id.title}' 모임 인증이 관리자 검토 대기 중입니다.",
-            related_meeting_id=submission.meeting_id
-        )
+        with transaction.atomic():
+            # 관리자 검토 필요
+            submission.status = 'pending'
+            submission.save()
+            
+            # 알림은 이벤트 핸들러에서 전송
+            publish('submission_needs_review', **_submission_payload(submission))
 
 
 def simulate_ai_verification(submission):
@@ -57,95 +60,260 @@ def simulate_ai_verification(submission):
     }
 
 
+POINTS_PER_PERSON = 100
+REVIEW_CHUNK_SIZE = 100
+DEFAULT_REJECT_FEEDBACK = '관리자에 의해 반려되었습니다.'
+
+
 def grant_points_for_meeting(meeting):
     """모임 완료 시 포인트 지급"""
+    grant_points_for_meetings([meeting])
+
+
+def _submission_payload(submission, **extra):
+    """submission_approved / submission_rejected / submission_needs_review 이벤트 payload"""
+    return {
+        'submission_id': submission.pk,
+        'meeting_id': submission.meeting_id_id,
+        'meeting_title': submission.meeting_id.title,
+        'host_id': submission.host_id_id,
+        **extra,
+    }
+
+
+def grant_points_for_meetings(meetings):
+    """
+    여러 모임의 포인트를 한 번에 지급 (set-based)
+
+    - PointsHistory 는 bulk_create
+    - User.total_points 는 F() 로 증가분이 같은 사용자끼리 묶어 UPDATE
+    - 펫 XP 는 growth.progression.grant_pet_xp_bulk 로 일괄 반영
+    - 알림/기부 풀 갱신은 모임별 points_granted 이벤트로 발행
+    같은 모임이 여러 번 들어오면 들어온 횟수만큼 지급한다.
+    """
     from community.models import MeetingParticipant
+    from account.models import User
+    from django.db.models import F
     
-    # 호스트와 참여자에게 포인트 지급
-    participants = MeetingParticipant.objects.filter(meeting_id=meeting)
-    points_per_person = 100
-    
-    # 호스트 포인트 지급
-    host = meeting.host_id
-    PointsHistory.objects.create(
-        user_id=host,
-        meeting_id=meeting,
-        points_change=points_per_person,
-        reason='admin_approval'  # 또는 'ai_approval'
-    )
-    host.total_points += points_per_person
-    host.save()
+    meetings = list(meetings)
+    if not meetings:
+        return 0
     
-    # 참여자 포인트 지급
-    for participant in participants:
-        user = participant.user_id
-        PointsHistory.objects.create(
-            user_id=user,
+    participants_by_meeting = defaultdict(list)
+    for meeting_pk, user_pk in MeetingParticipant.objects.filter(
+        meeting_id__in=[meeting.pk for meeting in meetings]
+    ).values_list('meeting_id', 'user_id'):
+        participants_by_meeting[meeting_pk].append(user_pk)
+    
+    history = []
+    events = []
+    points_by_user = defaultdict(int)
+    xp_by_user = defaultdict(int)
+    
+    for meeting in meetings:
+        # 호스트 포인트 지급
+        history.append(PointsHistory(
+            user_id_id=meeting.host_id_id,
             meeting_id=meeting,
-            points_change=points_per_person,
-            reason='meeting_participation'
-        )
-        user.total_points += points_per_person
-        user.save()
+            points_change=POINTS_PER_PERSON,
+            reason='admin_approval'  # 또는 'ai_approval'
+        ))
+        points_by_user[meeting.host_id_id] += POINTS_PER_PERSON
         
-        # XP 업데이트 및 레벨업 체크
-        update_user_pet_xp(user, points_per_person)
+        # 참여자 포인트 지급
+        for user_pk in participants_by_meeting[meeting.pk]:
+            history.append(PointsHistory(
+                user_id_id=user_pk,
+                meeting_id=meeting,
+                points_change=POINTS_PER_PERSON,
+                reason='meeting_participation'
+            ))
+            points_by_user[user_pk] += POINTS_PER_PERSON
+            xp_by_user[user_pk] += POINTS_PER_PERSON
         
-        # 알림 전송
-        Notification.objects.create(
-            user_id=user,
-            notification_type='points_earned',
-            title='포인트 지급',
-            message=f"'{meeting.title}' 모임 활동으로 {points_per_person} 포인트가 지급되었습니다.",
-            related_meeting_id=meeting
-        )
+        participant_ids = participants_by_meeting[meeting.pk]
+        events.append({
+            'meeting_id': meeting.pk,
+            'meeting_title': meeting.title,
+            'host_id': meeting.host_id_id,
+            'participant_ids': participant_ids,
+            'points_per_person': POINTS_PER_PERSON,
+            'total_points': POINTS_PER_PERSON * (len(participant_ids) + 1),
+        })
+    
+    PointsHistory.objects.bulk_create(history)
+    
+    # 증가분이 같은 사용자끼리 묶어 UPDATE 한 번씩
+    users_by_delta = defaultdict(list)
+    for user_pk, delta in points_by_user.items():
+        users_by_delta[delta].append(user_pk)
+    for delta, user_pks in users_by_delta.items():
+        User.objects.filter(pk__in=user_pks).update(total_points=F('total_points') + delta)
+    
+    # bulk 경로는 시그널이 없으므로 사용자 캐시와 마이페이지 요약을 직접 무효화
+    bump_user_version(*points_by_user)
+    bump_summary_version(*points_by_user)
+    
+    # XP 업데이트 및 레벨업 체크 (참여자 전체를 한 번에 계산)
+    grant_pet_xp_bulk(dict(xp_by_user))
+    
+    # 알림 / Donation Pool 업데이트는 이벤트 핸들러에서 처리
+    publish_many('points_granted', events)
+    return len(history) * POINTS_PER_PERSON
+
+
+def _chunked(items, size):
+    for index in range(0, len(items), size):
+        yield items[index:index + size]
+
+
+def approve_submissions(submission_ids, chunk_size=REVIEW_CHUNK_SIZE, progress=None):
+    """
+    검토 대기(pending) 제출물 일괄 승인
+
+    chunk_size 개씩 나눠 각 청크를 하나의 트랜잭션으로 처리한다.
+    progress(처리한 개수, 전체 개수) 콜백으로 진행 상황을 알린다.
+    반환값은 실제로 승인된 제출물 수 (pending 이 아니던 것은 제외).
+    """
+    submission_ids = list(submission_ids)
+    approved = 0
+    for index, chunk in enumerate(_chunked(submission_ids, chunk_size)):
+        with transaction.atomic():
+            submissions = list(
+                MeetingSubmission.objects.select_for_update(of=('self',))
+                .filter(pk__in=chunk, status='pending')
+                .select_related('meeting_id')
+            )
+            if submissions:
+                MeetingSubmission.objects.filter(
+                    pk__in=[submission.pk for submission in submissions]
+                ).update(status='admin_pass')
+                
+                # 포인트 지급
+                grant_points_for_meetings([submission.meeting_id for submission in submissions])
+                
+                # 알림은 이벤트 핸들러에서 전송
+                publish_many('submission_approved', [
+                    _submission_payload(submission, mode='admin') for submission in submissions
+                ])
+                approved += len(submissions)
+        
+        if progress:
+            progress(min((index + 1) * chunk_size, len(submission_ids)), len(submission_ids))
+    if approved:
+        bump_version('submissions')
+    return approved
+
+
+def reject_submissions(submission_ids, chunk_size=REVIEW_CHUNK_SIZE, progress=None):
+    """
+    검토 대기(pending) 제출물 일괄 반려
+
+    반려 사유가 비어 있으면 기본 사유를 채운다.
+    반환값은 실제로 반려된 제출물 수.
+    """
+    from django.db.models import Q
     
-    # Donation Pool 업데이트
-    update_donation_pool(points_per_person * (participants.count() + 1))
+    submission_ids = list(submission_ids)
+    rejected = 0
+    for index, chunk in enumerate(_chunked(submission_ids, chunk_size)):
+        with transaction.atomic():
+            submissions = list(
+                MeetingSubmission.objects.select_for_update(of=('self',))
+                .filter(pk__in=chunk, status='pending')
+                .select_related('meeting_id')
+            )
+            if submissions:
+                pks = [submission.pk for submission in submissions]
+                no_feedback = Q(admin_feedback__isnull=True) | Q(admin_feedback='')
+                MeetingSubmission.objects.filter(Q(pk__in=pks) & no_feedback).update(
+                    status='rejected', admin_feedback=DEFAULT_REJECT_FEEDBACK
+                )
+                MeetingSubmission.objects.filter(pk__in=pks).exclude(no_feedback).update(status='rejected')
+                
+                # 알림은 이벤트 핸들러에서 전송
+                publish_many('submission_rejected', [
+                    _submission_payload(submission, feedback=submission.admin_feedback or DEFAULT_REJECT_FEEDBACK)
+                    for submission in submissions
+                ])
+                rejected += len(submissions)
+        
+        if progress:
+            progress(min((index + 1) * chunk_size, len(submission_ids)), len(submission_ids))
+    if rejected:
+        bump_version('submissions')
+    return rejected
 
 
 def update_user_pet_xp(user, points):
     """사용자 펫 XP 업데이트 및 레벨업"""
     try:
         user_pet = UserPet.objects.get(user_id=user)
-        user_pet.current_xp += points
-        
-        # 레벨업 체크 (간단한 로직: 레벨당 100 XP 필요)
-        xp_needed = user_pet.current_level * 100
-        while user_pet.current_xp >= xp_needed:
-            user_pet.current_xp -= xp_needed
-            user_pet.current_level += 1
-            xp_needed = user_pet.current_level * 100
-        
+        # 레벨업 체크 (growth.progression 의 누적 XP 표 기준)
+        user_pet.current_level, user_pet.current_xp = apply_xp(
+            user_pet.current_level, user_pet.current_xp, points
+        )
         user_pet.save()
     except UserPet.DoesNotExist:
         # UserPet이 없으면 생성
+        current_level, current_xp = apply_xp(1, 0, points)
         UserPet.objects.create(
             user_id=user,
             pet_type='otter',
-            current_level=1,
-            current_xp=points
+            current_level=current_level,
+            current_xp=current_xp
         )
 
 
-def update_donation_pool(points):
-    """기부 풀 업데이트"""
+def update_donation_pool(points, on_date=None):
+    """
+    오늘(또는 on_date) 적립 대상인 기부 풀에 포인트 누적
+
+    대상 풀 선택과 배분은 donation.routing 의 정책을 따르고, 누적은
+    UPDATE ... SET current_points = current_points + X 로 DB 에서 처리한다.
+    목표 달성은 claim_completed_pools() 의 조건부 UPDATE 로 판단하므로
+    동시에 지급돼도 완료 처리는 정확히 한 번만 일어난다. 이번에 완료된 pool_id 목록을 반환.
+    """
+    from donation.routing import allocate, apply_credits, eligible_pools
+    
+    return apply_credits(allocate(points, eligible_pools(on_date)))
+
+
+def claim_completed_pools():
+    """
+    목표에 도달한 open 풀을 completed 로 전환하고, 이번 호출이 전환한 pool_id 목록을 반환
+
+    WHERE status='open' AND current_points >= goal_points 조건의 UPDATE 이므로 같은 풀을 두 워커가
+    동시에 전환하려 해도 한쪽만 행을 바꾼다. RETURNING 을 지원하는 DB 는 문장 하나로 처리한다.
+    """
+    from django.db import connection
+    from django.db.models import F
     from donation.models import DonationPool
     
-    # 현재 진행 중인 풀에 포인트 추가
-    active_pools = DonationPool.objects.filter(status='open')
-    for pool in active_pools:
-        pool.current_points += points
-        pool.save()
-        
-        # 목표 달성 체크
-        if pool.current_points >= pool.goal_points:
-            pool.status = 'completed'
-            pool.completed_at = timezone.now()
-            pool.save()
-            
-            # DonationHistory 생성
-            create_donation_history(pool)
+    now = timezone.now()
+    if connection.vendor in ('postgresql', 'sqlite') and connection.features.can_return_rows_from_bulk_insert:
+        qn = connection.ops.quote_name
+        opts = DonationPool._meta
+        completed_at = opts.get_field('completed_at').get_db_prep_value(now, connection)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {qn(opts.db_table)} SET {qn("status")} = %s, {qn("completed_at")} = %s '
+                f'WHERE {qn("status")} = %s AND {qn("current_points")} >= {qn("goal_points")} '
+                f'RETURNING {qn(opts.pk.column)}',
+                ['completed', completed_at, 'open'],
+            )
+            claimed = [row[0] for row in cursor.fetchall()]
+    else:
+        # RETURNING 이 없는 DB: 후보마다 조건부 UPDATE 후 바뀐 행 수로 선점 여부 판단
+        reached = DonationPool.objects.filter(status='open', current_points__gte=F('goal_points'))
+        claimed = [
+            pool_id for pool_id in reached.values_list('pk', flat=True)
+            if DonationPool.objects.filter(pk=pool_id, status='open').update(status='completed', completed_at=now)
+        ]
+    if claimed:
+        # 완료된 풀은 적립 대상 목록(donation.routing)에서도 빠진다.
+        bump_version('donation_pools', 'active_pools')
+    return claimed
 
 
 def create_donation_history(pool):
@@ -167,11 +335,14 @@ def create_donation_history(pool):
         ).aggregate(total=models.Sum('points_change'))['total'] or 0
         
         if contributed > 0:
-            DonationHistory.objects.get_or_create(
+            _, created = DonationHistory.objects.get_or_create(
                 pool_id=pool,
                 user_id=user,
                 defaults={'contributed_points': contributed}
             )
+            if not created:
+                # 같은 pool_completed 이벤트가 다시 전달됨 (at-least-once): 알림도 이미 보냈다.
+                continue
             
             # 알림 전송
             Notification.objects.create(
@@ -182,3 +353,40 @@ def create_donation_history(pool):
                 related_pool_id=pool
             )
 
+
+
+def repair_participant_counts(batch_size=1000):
+    """
+    participant_count 와 실제 참여자 수가 어긋난 모임을 보정
+
+    시그널을 거치지 않은 경로로 생긴 오차만 찾아 고치므로 평소에는 UPDATE 가 거의 없다.
+    반환값은 보정한 모임 수.
+    """
+    from community.models import CommunityMeeting, MeetingParticipant
+    from django.db.models import Count, F, OuterRef, Subquery
+    from django.db.models.functions import Coalesce
+    
+    actual_counts = (
+        MeetingParticipant.objects.filter(meeting_id=OuterRef('pk'))
+        .order_by()
+        .values('meeting_id')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    drifted = (
+        CommunityMeeting.objects.annotate(actual_count=Coalesce(Subquery(actual_counts), 0))
+        .exclude(participant_count=F('actual_count'))
+        .values_list('meeting_id', 'actual_count')
+    )
+    
+    # 어긋난 모임은 소수이므로 먼저 모아 두고 갱신한다. (읽는 중인 커서에 쓰지 않도록)
+    drifted = list(drifted)
+    repaired = 0
+    for index in range(0, len(drifted), batch_size):
+        repaired += CommunityMeeting.objects.bulk_update(
+            [CommunityMeeting(meeting_id=pk, participant_count=count) for pk, count in drifted[index:index + batch_size]],
+            ['participant_count']
+        )
+    if repaired:
+        bump_version('meetings')
+    return repaired
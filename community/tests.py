@@ -1,3 +1,284 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from account.models import User
+from growth.models import PointsHistory, UserPet
+from notification.models import Notification
+from outbox.dispatcher import dispatch_pending
+from myproject.ratelimit import consume, get_throttle_stats
+from outbox.models import OutboxEvent
+
+from .lifecycle import sweep
+from .models import CommunityMeeting, LifecycleSweepRun, MeetingParticipant, MeetingSubmission
+from .tasks import approve_submissions, process_ai_verification, reject_submissions, repair_participant_counts
+
+
+def make_user(name):
+    return User.objects.create_user(email=f'{name}@example.com', username=name, password='pw')
+
+
+def make_meeting(host, title='모임', **kwargs):
+    defaults = {
+        'description': '설명',
+        'location_name': '장소',
+        'location_coords': '37.5,127.0',
+        'meeting_date': timezone.now() + timedelta(days=1),
+    }
+    defaults.update(kwargs)
+    return CommunityMeeting.objects.create(host_id=host, title=title, **defaults)
+
+
+class SubmissionReviewTests(TestCase):
+    """제출물 일괄 승인/반려 테스트"""
+
+    def setUp(self):
+        self.host = make_user('host')
+        self.members = [make_user(f'member{i}') for i in range(3)]
+        self.meetings = [make_meeting(self.host, title=f'모임{i}') for i in range(2)]
+        for meeting in self.meetings:
+            for member in self.members:
+                MeetingParticipant.objects.create(meeting_id=meeting, user_id=member)
+        self.submissions = [
+            MeetingSubmission.objects.create(meeting_id=meeting, host_id=self.host)
+            for meeting in self.meetings
+        ]
+
+    def test_approve_grants_points_once_per_submission(self):
+        done = MeetingSubmission.objects.create(
+            meeting_id=self.meetings[0], host_id=self.host, status='admin_pass'
+        )
+        progress = []
+
+        approved = approve_submissions(
+            [s.pk for s in self.submissions] + [done.pk],
+            chunk_size=2,
+            progress=lambda n, total: progress.append((n, total)),
+        )
+
+        self.assertEqual(approved, 2)
+        self.assertEqual(progress, [(2, 3), (3, 3)])
+        self.assertEqual(MeetingSubmission.objects.filter(status='admin_pass').count(), 3)
+        self.host.refresh_from_db()
+        self.assertEqual(self.host.total_points, 200)
+        for member in self.members:
+            member.refresh_from_db()
+            self.assertEqual(member.total_points, 200)
+            self.assertEqual(UserPet.objects.get(user_id=member).current_level, 2)
+        self.assertEqual(PointsHistory.objects.count(), 8)
+        # 알림은 outbox 이벤트로 발행되고 디스패처가 전달한다.
+        self.assertEqual(Notification.objects.count(), 0)
+        self.assertEqual(OutboxEvent.objects.filter(event_type='points_granted').count(), 2)
+        dispatch_pending()
+        self.assertEqual(Notification.objects.filter(notification_type='points_earned').count(), 6)
+        self.assertEqual(Notification.objects.filter(notification_type='ai_approved').count(), 2)
+
+    def _count_approval_queries(self, participants):
+        """새 모임 2개(각각 참여자 participants 명)의 제출물을 승인할 때의 쿼리 수"""
+        host = make_user(f'host{participants}')
+        submissions = []
+        for index in range(2):
+            meeting = make_meeting(host, title=f'모임{participants}-{index}')
+            for member_index in range(participants):
+                MeetingParticipant.objects.create(
+                    meeting_id=meeting, user_id=make_user(f'p{participants}-{index}-{member_index}')
+                )
+            submissions.append(MeetingSubmission.objects.create(meeting_id=meeting, host_id=host))
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(approve_submissions([s.pk for s in submissions]), 2)
+        return len(queries)
+
+    def test_query_count_is_independent_of_participants(self):
+        self.assertEqual(self._count_approval_queries(2), self._count_approval_queries(8))
+
+    def test_reject_fills_default_feedback(self):
+        self.submissions[1].admin_feedback = '사진 불일치'
+        self.submissions[1].save()
+
+        rejected = reject_submissions([s.pk for s in self.submissions])
+
+        self.assertEqual(rejected, 2)
+        feedback = dict(MeetingSubmission.objects.values_list('submission_id', 'admin_feedback'))
+        self.assertEqual(feedback[self.submissions[0].pk], '관리자에 의해 반려되었습니다.')
+        self.assertEqual(feedback[self.submissions[1].pk], '사진 불일치')
+        dispatch_pending()
+        self.assertEqual(
+            sorted(Notification.objects.values_list('message', flat=True)),
+            ["'모임0' 모임 인증이 반려되었습니다. (사유: 관리자에 의해 반려되었습니다.)",
+             "'모임1' 모임 인증이 반려되었습니다. (사유: 사진 불일치)"],
+        )
+        self.assertEqual(PointsHistory.objects.count(), 0)
+
+    def test_ai_rejection_notifies_through_outbox(self):
+        submission = self.submissions[0]
+        with mock.patch('community.tasks.simulate_ai_verification', return_value={'approved': False}):
+            process_ai_verification(submission.pk)
+
+        submission.refresh_from_db()
+        self.assertEqual(submission.status, 'pending')
+        self.assertEqual(Notification.objects.count(), 0)
+        self.assertEqual(OutboxEvent.objects.filter(event_type='submission_needs_review').count(), 1)
+        dispatch_pending()
+        notification = Notification.objects.get()
+        self.assertEqual(
+            (notification.user_id, notification.notification_type, notification.related_meeting_id),
+            (self.host, 'admin_review', self.meetings[0]),
+        )
+        self.assertEqual(notification.message, "'모임0' 모임 인증이 관리자 검토 대기 중입니다.")
+
+
+class MeetingDetailViewTests(TestCase):
+    """모임 상세 페이지 쿼리 수 테스트"""
+
+    def setUp(self):
+        self.host = make_user('host')
+        self.meeting = make_meeting(self.host)
+
+    def _assert_flat_queries(self, viewer):
+        self.client.force_login(viewer)
+        url = f'/community/meeting/{self.meeting.pk}/'
+        self.client.get(reverse('community'))  # 세션/사용자 캐시 적재
+        # 모임(annotate) + 참여자 prefetch
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_query_count_is_flat_regardless_of_size(self):
+        for i in range(15):
+            MeetingParticipant.objects.create(meeting_id=self.meeting, user_id=make_user(f'p{i}'))
+        MeetingSubmission.objects.create(meeting_id=self.meeting, host_id=self.host, status='rejected', admin_feedback='흐림')
+
+        response = self._assert_flat_queries(self.host)
+        self.assertEqual(response.context['participant_count'], 15)
+        self.assertEqual(response.context['submission'].get_status_display(), '반려')
+        self.assertContains(response, '흐림')
+        self.assertContains(response, '재제출하기')
+
+    def test_expired_submission_can_be_resubmitted(self):
+        MeetingSubmission.objects.create(meeting_id=self.meeting, host_id=self.host, status='expired')
+
+        response = self._assert_flat_queries(self.host)
+        self.assertContains(response, reverse('submission_create', args=[self.meeting.pk]))
+
+    def test_viewer_participation(self):
+        viewer = make_user('viewer')
+        MeetingParticipant.objects.create(meeting_id=self.meeting, user_id=viewer)
+
+        response = self._assert_flat_queries(viewer)
+        self.assertTrue(response.context['is_participant'])
+        self.assertFalse(response.context['is_host'])
+        self.assertIsNone(response.context['submission'])
+
+    def test_conditional_get(self):
+        url = f'/community/meeting/{self.meeting.pk}/'
+        self.client.force_login(self.host)
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertIn('Cookie', response['Vary'])
+
+        with self.assertNumQueries(0):  # 세션/사용자는 캐시, 모임 쿼리셋은 만들지 않음
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # 다른 사용자에게는 같은 ETag 가 통하지 않는다.
+        self.client.force_login(make_user('viewer'))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        # 제출물이 바뀌면 새로 렌더링
+        self.client.force_login(self.host)
+        MeetingSubmission.objects.create(meeting_id=self.meeting, host_id=self.host)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class ParticipantCountTests(TestCase):
+    """참여자 수 컬럼 유지/보정 테스트"""
+
+    def test_signals_keep_count_and_repair_fixes_drift(self):
+        meeting = make_meeting(make_user('host'), capacity=2)
+        first = MeetingParticipant.objects.create(meeting_id=meeting, user_id=make_user('a'))
+        MeetingParticipant.objects.create(meeting_id=meeting, user_id=make_user('b'))
+        meeting.refresh_from_db()
+        self.assertEqual(meeting.participant_count, 2)
+        self.assertTrue(meeting.is_full)
+
+        first.delete()
+        meeting.refresh_from_db()
+        self.assertEqual(meeting.participant_count, 1)
+
+        CommunityMeeting.objects.filter(pk=meeting.pk).update(participant_count=7)
+        self.assertEqual(repair_participant_counts(), 1)
+        self.assertEqual(repair_participant_counts(), 0)
+        meeting.refresh_from_db()
+        self.assertEqual(meeting.participant_count, 1)
+
+
+class LifecycleSweepTests(TestCase):
+    """모임 라이프사이클 스윕 테스트"""
+
+    def test_sweep_transitions_and_reminds_once(self):
+        now = timezone.now()
+        host = make_user('host')
+        upcoming = make_meeting(host, title='예정', meeting_date=now + timedelta(days=1))
+        finished = make_meeting(host, title='종료', meeting_date=now - timedelta(hours=2))
+        submitted = make_meeting(host, title='제출함', meeting_date=now - timedelta(hours=3))
+        old = make_meeting(host, title='오래됨', meeting_date=now - timedelta(days=40))
+        stale = MeetingSubmission.objects.create(meeting_id=submitted, host_id=host)
+        MeetingSubmission.objects.filter(pk=stale.pk).update(created_at=now - timedelta(days=8))
+
+        run = sweep(batch_size=2, now=now)
+
+        self.assertEqual(
+            (run.meetings_closed, run.reminders_sent, run.submissions_expired, run.meetings_archived),
+            (3, 1, 1, 1),
+        )
+        statuses = dict(CommunityMeeting.objects.values_list('title', 'status'))
+        self.assertEqual(statuses, {'예정': 'open', '종료': 'closed', '제출함': 'closed', '오래됨': 'archived'})
+        self.assertEqual(MeetingSubmission.objects.get(pk=stale.pk).status, 'expired')
+        self.assertEqual(
+            Notification.objects.filter(notification_type='submission_reminder', related_meeting_id=finished).count(), 1
+        )
+
+        rerun = sweep(now=now)
+        self.assertEqual((rerun.meetings_closed, rerun.reminders_sent), (0, 0))
+        self.assertEqual(LifecycleSweepRun.objects.count(), 2)
+        self.assertEqual(CommunityMeeting.objects.get(pk=upcoming.pk).status, 'open')
+
+
+@override_settings(RATE_LIMITS={'meeting_join': {'user': '2/m', 'ip': '3/m'}})
+class RateLimitTests(TestCase):
+    """참여 요청 토큰 버킷 제한 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.meeting = make_meeting(make_user('host'))
+        self.url = f'/community/meeting/{self.meeting.pk}/join/'
+
+    def test_user_then_ip_buckets(self):
+        self.client.force_login(make_user('a'))
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+
+        # 거절은 사용자/모임 쿼리 전에 끝난다. (세션은 캐시)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '30')
+
+        # 다른 사용자라도 같은 IP 의 버킷(3/m)은 공유한다.
+        self.client.force_login(make_user('b'))
+        self.assertEqual(self.client.get(self.url, HTTP_ACCEPT='application/json').status_code, 429)
+        self.assertEqual(get_throttle_stats()['meeting_join'], {'ip': 1, 'user': 1})
+
+    def test_bucket_refills_over_time(self):
+        key = 'ratelimit:test'
+        self.assertEqual(consume(key, '2/m', now=0), (True, 0))
+        self.assertEqual(consume(key, '2/m', now=0), (True, 0))
+        self.assertEqual(consume(key, '2/m', now=15), (False, 15))
+        self.assertEqual(consume(key, '2/m', now=30), (True, 0))
@@ -1,14 +1,19 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.db.models import Q, Count
+from django.db.models import Q, Exists, OuterRef, Prefetch, Subquery
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 from .models import CommunityMeeting, MeetingParticipant, MeetingSubmission, SubmissionMedia
 from account.models import User
+from myproject.conditional import conditional_page
+from myproject.db_router import replica_reads
+from myproject.ratelimit import rate_limit
 
 # Create your views here.
 
+@replica_reads
+@conditional_page('meetings')
 def community_list(request):
     """커뮤니티 모임 목록"""
     meetings = []
@@ -16,9 +21,8 @@ def community_list(request):
     search_query = request.GET.get('search', '')
     
     try:
-        meetings = CommunityMeeting.objects.all().annotate(
-            participant_count=Count('participants')
-        ).order_by('-created_at')
+        # participant_count 는 시그널로 유지되는 컬럼 (GROUP BY 불필요)
+        meetings = CommunityMeeting.objects.select_related('host_id').order_by('-created_at')
         
         # 필터링
         if search_query:
@@ -45,31 +49,56 @@ def community_list(request):
     return render(request, 'community.html', context)
 
 
+@replica_reads
 @login_required
+@conditional_page('meetings', 'submissions')
 def meeting_detail(request, meeting_id):
     """모임 상세 페이지"""
-    meeting = get_object_or_404(CommunityMeeting, meeting_id=meeting_id)
+    # 호스트 조인 + 조회자 참여 여부(Exists) + 최신 제출 상태(Subquery)를 한 번에 조회하고
+    # 참여자 목록은 사용자까지 붙여 한 번에 prefetch 한다. (모임 규모와 무관하게 쿼리 2개)
+    viewer_participation = MeetingParticipant.objects.filter(
+        meeting_id=OuterRef('pk'),
+        user_id=request.user
+    )
+    latest_submission = MeetingSubmission.objects.filter(
+        meeting_id=OuterRef('pk'),
+        host_id=request.user
+    ).order_by('-created_at')
+    
+    meeting = get_object_or_404(
+        CommunityMeeting.objects.select_related('host_id').annotate(
+            viewer_is_participant=Exists(viewer_participation),
+            latest_submission_id=Subquery(latest_submission.values('submission_id')[:1]),
+            latest_submission_status=Subquery(latest_submission.values('status')[:1]),
+            latest_submission_feedback=Subquery(latest_submission.values('admin_feedback')[:1]),
+        ).prefetch_related(
+            Prefetch(
+                'participants',
+                queryset=MeetingParticipant.objects.select_related('user_id'),
+                to_attr='participant_list'
+            )
+        ),
+        meeting_id=meeting_id
+    )
     
     # 참여자 목록
-    participants = MeetingParticipant.objects.filter(meeting_id=meeting)
-    participant_count = participants.count()
+    participants = meeting.participant_list
+    participant_count = meeting.participant_count
     
     # 참여 여부
-    is_participant = False
-    is_host = meeting.host_id == request.user
-    if request.user.is_authenticated:
-        is_participant = MeetingParticipant.objects.filter(
-            meeting_id=meeting,
-            user_id=request.user
-        ).exists()
+    is_host = meeting.host_id_id == request.user.pk
+    is_participant = meeting.viewer_is_participant
     
     # 인증 제출 상태 (호스트만)
     submission = None
-    if is_host:
-        submission = MeetingSubmission.objects.filter(
+    if is_host and meeting.latest_submission_id is not None:
+        submission = MeetingSubmission(
+            submission_id=meeting.latest_submission_id,
             meeting_id=meeting,
-            host_id=request.user
-        ).order_by('-created_at').first()
+            host_id=request.user,
+            status=meeting.latest_submission_status,
+            admin_feedback=meeting.latest_submission_feedback
+        )
     
     context = {
         'meeting': meeting,
@@ -131,6 +160,7 @@ def meeting_create(request):
     return render(request, 'community/meeting_create.html')
 
 
+@rate_limit('meeting_join')
 @login_required
 def meeting_join(request, meeting_id):
     """모임 참여"""
@@ -147,21 +177,13 @@ def meeting_join(request, meeting_id):
         return redirect('meeting_detail', meeting_id=meeting_id)
     
     # 정원 확인
-    participant_count = MeetingParticipant.objects.filter(meeting_id=meeting).count()
-    if participant_count >= meeting.capacity:
+    if meeting.is_full:
         messages.error(request, '모임 정원이 가득 찼습니다.')
         return redirect('meeting_detail', meeting_id=meeting_id)
     
-    # 모임 날짜 확인 (ensure timezone-aware comparison)
-    try:
-        meeting_dt = meeting.meeting_date
-        if timezone.is_naive(meeting_dt):
-            meeting_dt = timezone.make_aware(meeting_dt)
-        if meeting_dt < timezone.now():
-            messages.error(request, '이미 지난 모임입니다.')
-            return redirect('meeting_detail', meeting_id=meeting_id)
-    except Exception:
-        messages.error(request, '모임 일시를 확인할 수 없습니다.')
+    # 모임 상태/날짜 확인 (sweep_meetings 가 돌기 전이라도 지난 모임은 막는다)
+    if meeting.status != 'open' or meeting.meeting_date < timezone.now():
+        messages.error(request, '이미 지난 모임입니다.')
         return redirect('meeting_detail', meeting_id=meeting_id)
     
     try:
@@ -176,6 +198,7 @@ def meeting_join(request, meeting_id):
     return redirect('meeting_detail', meeting_id=meeting_id)
 
 
+@rate_limit('meeting_cancel')
 @login_required
 def meeting_cancel(request, meeting_id):
     """모임 참여 취소"""
@@ -195,6 +218,7 @@ def meeting_cancel(request, meeting_id):
     return redirect('meeting_detail', meeting_id=meeting_id)
 
 
+@rate_limit('submission_create', methods=('POST',))
 @login_required
 def submission_create(request, meeting_id):
     """인증 제출 (모임 종료 후 호스트만)"""
@@ -0,0 +1,12 @@
+from django.contrib import admin
+
+from .models import ImportCheckpoint
+
+# Register your models here.
+
+@admin.register(ImportCheckpoint)
+class ImportCheckpointAdmin(admin.ModelAdmin):
+    list_display = ['name', 'kind', 'rows_done', 'imported', 'skipped', 'completed_at', 'updated_at']
+    list_filter = ['kind']
+    search_fields = ['name', 'source']
+    readonly_fields = ['updated_at']
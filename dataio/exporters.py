@@ -0,0 +1,165 @@
+"""
+원장/기부 내역 스트리밍 내보내기 (CSV / JSONL, 선택적 gzip)
+
+PK 기준 keyset 페이지(batch_size 행)를 차례로 읽고, 각 페이지는 .iterator(chunk_size) 로
+서버 측 커서에서 조금씩 가져오므로 전체 행 수와 관계없이 메모리 사용량이 일정하다.
+OFFSET 을 쓰지 않아 뒤쪽 페이지도 앞쪽과 같은 비용으로 읽는다.
+
+    for chunk in export_chunks('points', since=date(2024, 1, 1), fmt='csv', compress=True):
+        out.write(chunk)
+"""
+import csv
+import io
+import json
+import zlib
+from collections import namedtuple
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+
+DEFAULT_BATCH_SIZE = 10000
+ITERATOR_CHUNK_SIZE = 2000
+FORMATS = ('csv', 'jsonl')
+# 이 크기 이상 모이면 한 번에 내보낸다. (응답/파일 쓰기 호출 수를 줄임)
+FLUSH_BYTES = 64 * 1024
+
+Dataset = namedtuple('Dataset', ['model_path', 'columns', 'pool_field'])
+
+# columns: (출력 이름, values_list 경로)
+DATASETS = {
+    'points': Dataset('growth.PointsHistory', [
+        ('point_id', 'point_id'),
+        ('user_id', 'user_id'),
+        ('username', 'user_id__username'),
+        ('points_change', 'points_change'),
+        ('reason', 'reason'),
+        ('meeting_id', 'meeting_id'),
+        ('item_id', 'item_id'),
+        ('created_at', 'created_at'),
+    ], None),
+    'transactions': Dataset('donation.DonationTransaction', [
+        ('transaction_id', 'transaction_id'),
+        ('pool_id', 'pool_id'),
+        ('user_id', 'user_id'),
+        ('username', 'user_id__username'),
+        ('amount', 'amount'),
+        ('created_at', 'created_at'),
+    ], 'pool_id'),
+    'donation_history': Dataset('donation.DonationHistory', [
+        ('donation_id', 'donation_id'),
+        ('pool_id', 'pool_id'),
+        ('pool_title', 'pool_id__title'),
+        ('user_id', 'user_id'),
+        ('username', 'user_id__username'),
+        ('contributed_points', 'contributed_points'),
+        ('created_at', 'created_at'),
+    ], 'pool_id'),
+}
+
+
+def _day_start(value):
+    return timezone.make_aware(datetime.combine(value, time.min))
+
+
+def get_queryset(dataset, since=None, until=None, pool_id=None):
+    """필터를 적용한 쿼리셋 (since/until 은 TIME_ZONE 기준 날짜, 둘 다 포함)"""
+    from django.apps import apps
+
+    if dataset not in DATASETS:
+        raise ValueError(f'알 수 없는 데이터셋입니다: {dataset}')
+    spec = DATASETS[dataset]
+    queryset = apps.get_model(spec.model_path).objects.all()
+    if since:
+        queryset = queryset.filter(created_at__gte=_day_start(since))
+    if until:
+        queryset = queryset.filter(created_at__lt=_day_start(until + timedelta(days=1)))
+    if pool_id is not None:
+        if spec.pool_field is None:
+            raise ValueError(f'{dataset} 데이터셋은 기부 풀 필터를 지원하지 않습니다.')
+        queryset = queryset.filter(**{spec.pool_field: pool_id})
+    return queryset
+
+
+def iter_rows(dataset, since=None, until=None, pool_id=None, batch_size=DEFAULT_BATCH_SIZE):
+    """PK 오름차순으로 values_list 튜플을 하나씩 생성 (첫 컬럼이 PK 이므로 keyset 위치로 사용)"""
+    spec = DATASETS[dataset]
+    queryset = get_queryset(dataset, since, until, pool_id).order_by('pk')
+    paths = [path for _, path in spec.columns]
+    last_pk = None
+    while True:
+        page = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        count = 0
+        for row in page.values_list(*paths)[:batch_size].iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+            count += 1
+            last_pk = row[0]
+            yield row
+        if count < batch_size:
+            return
+
+
+def _format_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def iter_lines(dataset, rows, fmt):
+    """행 → 텍스트 줄 (CSV 는 헤더 포함)"""
+    names = [name for name, _ in DATASETS[dataset].columns]
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(names)
+        for row in rows:
+            writer.writerow([_format_value(value) for value in row])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        yield buffer.getvalue()
+    else:
+        for row in rows:
+            yield json.dumps(
+                {name: _format_value(value) for name, value in zip(names, row)}, ensure_ascii=False
+            ) + '\n'
+
+
+def export_chunks(dataset, since=None, until=None, pool_id=None, fmt='csv', compress=False,
+                  batch_size=DEFAULT_BATCH_SIZE, counter=None):
+    """
+    내보낼 바이트 조각을 생성 (StreamingHttpResponse / 파일 쓰기에 그대로 사용)
+
+    compress=True 이면 gzip 스트림. counter 리스트가 주어지면 counter[0] 에 내보낸 행 수를 누적한다.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f'지원하지 않는 형식입니다: {fmt}')
+    # 인자 검증은 스트리밍을 시작하기 전에 끝낸다. (응답 헤더를 보낸 뒤에는 오류를 알릴 수 없음)
+    get_queryset(dataset, since, until, pool_id)
+    rows = iter_rows(dataset, since, until, pool_id, batch_size)
+    return _encode(iter_lines(dataset, _counted(rows, counter), fmt), compress)
+
+
+def _counted(rows, counter):
+    for row in rows:
+        if counter is not None:
+            counter[0] += 1
+        yield row
+
+
+def _encode(lines, compress):
+    compressor = zlib.compressobj(wbits=31) if compress else None  # wbits=31: gzip 헤더
+    pending = []
+    pending_size = 0
+    for line in lines:
+        data = line.encode('utf-8')
+        if compressor:
+            data = compressor.compress(data)
+        if data:
+            pending.append(data)
+            pending_size += len(data)
+        if pending_size >= FLUSH_BYTES:
+            yield b''.join(pending)
+            pending, pending_size = [], 0
+    if compressor:
+        pending.append(compressor.flush())
+    if pending:
+        yield b''.join(pending)
@@ -0,0 +1,457 @@
+"""
+대용량 데이터 가져오기 (JSONL / CSV)
+
+    python manage.py import_data items catalog.csv
+    python manage.py import_data points ledger.jsonl --chunk-size 5000
+
+파일을 한 줄씩 읽어 chunk_size 행마다 검증 → bulk_create 를 트랜잭션 하나로 처리하고,
+같은 트랜잭션에서 ImportCheckpoint 에 처리한 행 수를 기록한다. 중간에 중단되면 같은 명령을
+다시 실행해 체크포인트 이후부터 이어서 가져온다. 메모리 사용량은 chunk_size 에만 비례한다.
+
+검증은 행 단위(필드 변환 + clean_fields)와 묶음 단위(중복/외래키 존재 여부를 쿼리 한 번으로)로 나뉜다.
+bulk_create 는 시그널을 보내지 않으므로 캐시 버전 무효화는 각 Importer.after_create 에서 직접 한다.
+"""
+import csv
+import json
+from datetime import date, datetime
+from itertools import islice
+from pathlib import Path
+
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .models import ImportCheckpoint
+
+DEFAULT_CHUNK_SIZE = 1000
+FORMATS = ('jsonl', 'csv')
+# 결과에 보관할 오류 메시지 수 (건너뛴 행 수는 전부 센다)
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportAborted(Exception):
+    """허용한 오류 수를 넘어 가져오기를 중단 (마지막 묶음은 커밋되지 않음)"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(f'검증 오류 {len(errors)}건으로 가져오기를 중단했습니다.')
+
+
+def detect_format(path):
+    suffix = Path(path).suffix.lower()
+    if suffix in ('.jsonl', '.ndjson', '.json'):
+        return 'jsonl'
+    if suffix == '.csv':
+        return 'csv'
+    raise ValueError(f'파일 형식을 알 수 없습니다: {path} (--format 으로 지정)')
+
+
+def read_rows(path, fmt):
+    """(줄 번호, dict) 를 한 행씩 생성. 빈 문자열 값은 없는 값으로 취급한다."""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        if fmt == 'csv':
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, {key: value for key, value in row.items() if value not in ('', None)}
+        else:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as e:
+                    row = {'__error__': f'JSON 형식 오류: {e.msg}'}
+                if not isinstance(row, dict):
+                    row = {'__error__': 'JSON 객체가 아닙니다.'}
+                yield line_no, {key: value for key, value in row.items() if value not in ('', None)}
+
+
+# ---- 값 변환 ----
+
+def _required(row, key):
+    if key not in row:
+        raise ValidationError(f'{key} 값이 필요합니다.')
+    return row[key]
+
+
+def _int(row, key, default=None, min_value=None):
+    if key not in row:
+        if default is None:
+            raise ValidationError(f'{key} 값이 필요합니다.')
+        return default
+    try:
+        value = int(row[key])
+    except (TypeError, ValueError):
+        raise ValidationError(f'{key} 는 정수여야 합니다: {row[key]!r}')
+    if min_value is not None and value < min_value:
+        raise ValidationError(f'{key} 는 {min_value} 이상이어야 합니다.')
+    return value
+
+
+def _optional_int(row, key):
+    return _int(row, key) if key in row else None
+
+
+def _choice(row, key, choices, default=None):
+    value = row.get(key, default)
+    if value is None:
+        raise ValidationError(f'{key} 값이 필요합니다.')
+    if value not in {choice for choice, _ in choices}:
+        raise ValidationError(f'{key} 값이 올바르지 않습니다: {value!r}')
+    return value
+
+
+def _date(row, key):
+    if key not in row:
+        return None
+    value = row[key]
+    parsed = value if isinstance(value, date) else parse_date(str(value))
+    if parsed is None:
+        raise ValidationError(f'{key} 날짜 형식이 올바르지 않습니다(YYYY-MM-DD): {value!r}')
+    return parsed
+
+
+def _datetime(row, key):
+    if key not in row:
+        return None
+    value = str(row[key])
+    parsed = parse_datetime(value)
+    if parsed is None and parse_date(value) is not None:
+        parsed = datetime.combine(parse_date(value), datetime.min.time())
+    if parsed is None:
+        raise ValidationError(f'{key} 일시 형식이 올바르지 않습니다(ISO 8601): {value!r}')
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def _bool(row, key, default):
+    if key not in row:
+        return default
+    value = row[key]
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('1', 'true', 'yes', 'y')
+
+
+def _error_message(error):
+    if isinstance(error, ValidationError):
+        if hasattr(error, 'error_dict'):
+            return '; '.join(f'{field}: {" ".join(messages)}' for field, messages in error.message_dict.items())
+        return ' '.join(error.messages)
+    return str(error)
+
+
+# ---- 종류별 가져오기 규칙 ----
+
+class Importer:
+    """
+    한 종류의 행을 모델 인스턴스로 바꾸는 규칙
+
+    prepare(rows) → 묶음 단위 조회 결과(context), build(row, context) → 인스턴스,
+    validate_batch(entries, context) → {줄 번호: 오류 메시지}, after_create(objs) → 후처리
+    """
+    model = None
+    # clean_fields 에서 제외할 필드 (외래키는 행마다 쿼리하지 않도록 validate_batch 에서 한 번에 확인)
+    clean_exclude = ()
+    # 원본의 생성 시각을 보존할 auto_now_add 필드 (bulk_create 후 한 번에 덮어씀)
+    preserved_timestamp = None
+
+    def prepare(self, rows):
+        return None
+
+    def build(self, row, context):
+        raise NotImplementedError
+
+    def validate_batch(self, entries, context):
+        return {}
+
+    def after_create(self, objs):
+        pass
+
+
+class PetItemImporter(Importer):
+    """item_name, item_type(snack|decoration), required_level(기본 1), cost"""
+
+    def __init__(self):
+        from growth.models import PetItem
+        self.model = PetItem
+
+    def build(self, row, context):
+        return self.model(
+            item_name=_required(row, 'item_name'),
+            item_type=_choice(row, 'item_type', self.model.ITEM_TYPE_CHOICES),
+            required_level=_int(row, 'required_level', default=1, min_value=1),
+            cost=_int(row, 'cost', min_value=0),
+        )
+
+    def after_create(self, objs):
+        from myproject.conditional import bump_version
+        bump_version('pet_items')
+
+
+class DonationPoolImporter(Importer):
+    """title, goal_points, sponsor, description, start_date, end_date, current_points, status, completed_at, created_at"""
+    preserved_timestamp = 'created_at'
+
+    def __init__(self):
+        from donation.models import DonationPool
+        self.model = DonationPool
+
+    def build(self, row, context):
+        pool = self.model(
+            title=_required(row, 'title'),
+            sponsor=row.get('sponsor'),
+            description=row.get('description'),
+            start_date=_date(row, 'start_date'),
+            end_date=_date(row, 'end_date'),
+            goal_points=_int(row, 'goal_points', min_value=1),
+            current_points=_int(row, 'current_points', default=0, min_value=0),
+            status=_choice(row, 'status', self.model.STATUS_CHOICES, default='open'),
+            completed_at=_datetime(row, 'completed_at'),
+        )
+        if pool.start_date and pool.end_date and pool.start_date > pool.end_date:
+            raise ValidationError('종료일은 시작일보다 이후여야 합니다.')
+        pool.created_at = _datetime(row, 'created_at')
+        return pool
+
+    def after_create(self, objs):
+        from myproject.conditional import bump_version
+        # 새 open 풀은 적립 대상 목록(donation.routing)에도 들어간다.
+        bump_version('donation_pools', 'active_pools')
+
+
+class UserImporter(Importer):
+    """
+    email, username, password, total_points, is_active, created_at
+
+    password 가 Django 해시 형식이면 그대로 쓰고, 평문이면 해시한다. (해시는 행마다 수십 ms 가
+    걸리므로 대량 이전은 해시된 값으로 넣는 것이 좋다) 비어 있으면 로그인 불가 비밀번호로 둔다.
+    """
+    preserved_timestamp = 'created_at'
+    clean_exclude = ('password', 'last_login', 'date_joined')
+
+    def __init__(self):
+        from account.models import User
+        self.model = User
+
+    def build(self, row, context):
+        user = self.model(
+            email=self.model.objects.normalize_email(_required(row, 'email')),
+            username=_required(row, 'username'),
+            total_points=_int(row, 'total_points', default=0),
+            is_active=_bool(row, 'is_active', True),
+        )
+        password = row.get('password')
+        if password is None:
+            user.set_unusable_password()
+        else:
+            try:
+                identify_hasher(password)
+                user.password = password
+            except ValueError:
+                user.password = make_password(password)
+        user.created_at = _datetime(row, 'created_at')
+        return user
+
+    def validate_batch(self, entries, context):
+        from django.db.models import Q
+
+        errors = {}
+        seen = {}
+        for line, user in entries:
+            for field in ('email', 'username'):
+                value = getattr(user, field).lower()
+                if (field, value) in seen:
+                    errors[line] = f'{field} 가 {seen[(field, value)]}번 줄과 중복됩니다: {getattr(user, field)}'
+                seen.setdefault((field, value), line)
+
+        emails = [user.email for _, user in entries]
+        usernames = [user.username for _, user in entries]
+        existing = set()
+        for email, username in self.model.objects.filter(Q(email__in=emails) | Q(username__in=usernames)).values_list(
+            'email', 'username'
+        ):
+            existing.update({('email', email), ('username', username)})
+        for line, user in entries:
+            for field in ('email', 'username'):
+                if (field, getattr(user, field)) in existing:
+                    errors.setdefault(line, f'이미 있는 {field} 입니다: {getattr(user, field)}')
+        return errors
+
+
+class PointsHistoryImporter(Importer):
+    """
+    user_email 또는 user_id, points_change, reason, created_at, meeting_id, item_id
+
+    과거 원장을 그대로 옮기는 용도라 User.total_points 는 바꾸지 않는다. (users 가져오기에서 함께 지정)
+    """
+    preserved_timestamp = 'created_at'
+    clean_exclude = ('user_id', 'meeting_id', 'item_id')
+
+    def __init__(self):
+        from growth.models import PointsHistory
+        self.model = PointsHistory
+
+    def prepare(self, rows):
+        from account.models import User
+
+        emails = {User.objects.normalize_email(row['user_email']) for row in rows if 'user_email' in row}
+        return dict(User.objects.filter(email__in=emails).values_list('email', 'pk')) if emails else {}
+
+    def build(self, row, context):
+        from account.models import User
+
+        if 'user_email' in row:
+            email = User.objects.normalize_email(row['user_email'])
+            if email not in context:
+                raise ValidationError(f'사용자를 찾을 수 없습니다: {email}')
+            user_id = context[email]
+        else:
+            user_id = _int(row, 'user_id')
+        entry = self.model(
+            user_id_id=user_id,
+            points_change=_int(row, 'points_change'),
+            reason=_choice(row, 'reason', self.model.REASON_CHOICES),
+            meeting_id_id=_optional_int(row, 'meeting_id'),
+            item_id_id=_optional_int(row, 'item_id'),
+        )
+        entry.created_at = _datetime(row, 'created_at')
+        return entry
+
+    def validate_batch(self, entries, context):
+        from account.models import User
+        from community.models import CommunityMeeting
+        from growth.models import PetItem
+
+        errors = {}
+        for attname, model, label in (
+            ('user_id_id', User, '사용자'),
+            ('meeting_id_id', CommunityMeeting, '모임'),
+            ('item_id_id', PetItem, '아이템'),
+        ):
+            ids = {getattr(entry, attname) for _, entry in entries} - {None}
+            if not ids:
+                continue
+            missing = ids - set(model.objects.filter(pk__in=ids).values_list('pk', flat=True))
+            for line, entry in entries:
+                if getattr(entry, attname) in missing:
+                    errors.setdefault(line, f'{label}를 찾을 수 없습니다: {getattr(entry, attname)}')
+        return errors
+
+    def after_create(self, objs):
+        from mypage.summary import bump_summary_version
+        bump_summary_version(*{entry.user_id_id for entry in objs})
+
+
+IMPORTERS = {
+    'items': PetItemImporter,
+    'pools': DonationPoolImporter,
+    'users': UserImporter,
+    'points': PointsHistoryImporter,
+}
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _build_chunk(importer, chunk):
+    """묶음 검증: (유효한 [(줄, 인스턴스)], [(줄, 오류)])"""
+    context = importer.prepare([row for _, row in chunk])
+    entries, errors = [], []
+    for line, row in chunk:
+        try:
+            if '__error__' in row:
+                raise ValidationError(row['__error__'])
+            instance = importer.build(row, context)
+            instance.clean_fields(exclude=importer.clean_exclude)
+            # bulk_create 의 auto_now_add 가 덮어쓰기 전에 원본 시각을 보관
+            timestamp = getattr(instance, importer.preserved_timestamp) if importer.preserved_timestamp else None
+            entries.append((line, instance, timestamp))
+        except (ValidationError, ValueError, TypeError) as e:
+            errors.append((line, _error_message(e)))
+
+    batch_errors = importer.validate_batch([(line, instance) for line, instance, _ in entries], context)
+    if batch_errors:
+        errors.extend(sorted(batch_errors.items()))
+        entries = [entry for entry in entries if entry[0] not in batch_errors]
+    return entries, errors
+
+
+def _create(importer, entries):
+    objs = importer.model.objects.bulk_create([instance for _, instance, _ in entries])
+    field = importer.preserved_timestamp
+    if field:
+        # bulk_create 에서 auto_now_add 가 현재 시각으로 채운 값을 원본 시각으로 되돌린다.
+        restored = []
+        for obj, (_, _, timestamp) in zip(objs, entries):
+            if timestamp is not None:
+                setattr(obj, field, timestamp)
+                restored.append(obj)
+        if restored:
+            importer.model.objects.bulk_update(restored, [field])
+    importer.after_create(objs)
+    return objs
+
+
+def checkpoint_name(kind, path):
+    return f'{kind}:{Path(path).resolve()}'
+
+
+def run_import(kind, path, fmt=None, chunk_size=DEFAULT_CHUNK_SIZE, name=None, max_errors=0,
+               restart=False, progress=None):
+    """
+    파일 하나를 가져온다.
+
+    name 은 체크포인트 이름 (기본: '<kind>:<파일 절대 경로>'). max_errors 를 넘는 검증 오류가 생기면
+    해당 묶음을 커밋하지 않고 ImportAborted 를 던지며, 체크포인트는 직전 묶음까지 유지된다.
+    progress(checkpoint) 는 묶음을 커밋할 때마다 호출된다.
+    반환: (체크포인트, 오류 목록 [(줄, 메시지)])
+    """
+    if kind not in IMPORTERS:
+        raise ValueError(f'알 수 없는 가져오기 종류입니다: {kind}')
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f'지원하지 않는 형식입니다: {fmt}')
+    importer = IMPORTERS[kind]()
+    source = str(Path(path).resolve())
+    name = name or checkpoint_name(kind, path)
+
+    checkpoint, _ = ImportCheckpoint.objects.get_or_create(name=name, defaults={'kind': kind, 'source': source})
+    if checkpoint.kind != kind:
+        raise ValueError(f'체크포인트 {name} 은 {checkpoint.kind} 가져오기에 쓰였습니다.')
+    if restart:
+        checkpoint.rows_done = checkpoint.imported = checkpoint.skipped = 0
+        checkpoint.completed_at = None
+        checkpoint.save()
+    if checkpoint.completed_at:
+        return checkpoint, []
+
+    errors = []
+    total_errors = checkpoint.skipped
+    rows = islice(read_rows(path, fmt), checkpoint.rows_done, None)
+    for chunk in _chunks(rows, chunk_size):
+        entries, chunk_errors = _build_chunk(importer, chunk)
+        total_errors += len(chunk_errors)
+        errors.extend(chunk_errors[:max(MAX_REPORTED_ERRORS - len(errors), 0)])
+        if total_errors > max_errors:
+            raise ImportAborted(errors)
+
+        with transaction.atomic():
+            objs = _create(importer, entries) if entries else []
+            checkpoint.rows_done += len(chunk)
+            checkpoint.imported += len(objs)
+            checkpoint.skipped += len(chunk_errors)
+            checkpoint.save(update_fields=['rows_done', 'imported', 'skipped', 'updated_at'])
+        if progress:
+            progress(checkpoint)
+
+    checkpoint.completed_at = timezone.now()
+    checkpoint.save(update_fields=['completed_at', 'updated_at'])
+    return checkpoint, errors
@@ -0,0 +1,68 @@
+"""
+정산용 원장 내보내기
+
+    python manage.py export_data points --since 2024-01-01 --until 2024-12-31 -o points-2024.csv.gz --gzip
+    python manage.py export_data transactions --pool 3 --format jsonl > pool3.jsonl
+    python manage.py export_data donation_history --pool 3 -o hall-of-fame.csv
+"""
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from dataio.exporters import DATASETS, DEFAULT_BATCH_SIZE, FORMATS, export_chunks
+
+
+def _date(value):
+    parsed = parse_date(value)
+    if parsed is None:
+        raise ValueError(value)
+    return parsed
+
+
+class Command(BaseCommand):
+    help = '포인트 원장·기부 트랜잭션·명예의 전당을 CSV/JSONL 로 스트리밍 내보냅니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('dataset', choices=sorted(DATASETS), help='내보낼 데이터')
+        parser.add_argument('--format', choices=FORMATS, default='csv')
+        parser.add_argument('--since', type=_date, help='이 날짜(포함)부터 (YYYY-MM-DD)')
+        parser.add_argument('--until', type=_date, help='이 날짜(포함)까지 (YYYY-MM-DD)')
+        parser.add_argument('--pool', type=int, dest='pool_id', help='기부 풀 ID (transactions, donation_history)')
+        parser.add_argument('--gzip', action='store_true', help='gzip 으로 압축')
+        parser.add_argument('-o', '--output', help='출력 파일 (기본: 표준 출력)')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='keyset 페이지 크기')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size 는 1 이상이어야 합니다.')
+        counter = [0]
+        try:
+            chunks = export_chunks(
+                options['dataset'],
+                since=options['since'],
+                until=options['until'],
+                pool_id=options['pool_id'],
+                fmt=options['format'],
+                compress=options['gzip'],
+                batch_size=options['batch_size'],
+                counter=counter,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        started = time.monotonic()
+        if options['output']:
+            with open(options['output'], 'wb') as out:
+                self._write(out, chunks)
+        else:
+            self._write(sys.stdout.buffer, chunks)
+
+        elapsed = time.monotonic() - started
+        self.stderr.write(f'{counter[0]}행 내보냄 ({elapsed:.2f}s, {counter[0] / elapsed if elapsed else 0:.0f}행/s)')
+
+    def _write(self, out, chunks):
+        for chunk in chunks:
+            out.write(chunk)
+        out.flush()
@@ -0,0 +1,82 @@
+"""
+JSONL/CSV 대량 가져오기
+
+    python manage.py import_data items catalog.csv
+    python manage.py import_data users users.jsonl --chunk-size 2000
+    python manage.py import_data points ledger.csv --max-errors 100   # 잘못된 행은 100건까지 건너뜀
+    python manage.py import_data points ledger.csv --restart          # 체크포인트 무시하고 처음부터
+
+중단됐을 때는 같은 명령을 다시 실행하면 마지막으로 커밋한 묶음 다음부터 이어서 가져온다.
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dataio.importers import DEFAULT_CHUNK_SIZE, FORMATS, IMPORTERS, ImportAborted, checkpoint_name, run_import
+from dataio.models import ImportCheckpoint
+
+
+class Command(BaseCommand):
+    help = 'JSONL/CSV 파일의 아이템·기부 풀·사용자·포인트 이력을 묶음 단위로 가져옵니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=sorted(IMPORTERS), help='가져올 데이터 종류')
+        parser.add_argument('path', help='JSONL 또는 CSV 파일 경로')
+        parser.add_argument('--format', choices=FORMATS, help='파일 형식 (기본: 확장자로 판단)')
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='트랜잭션 하나에서 가져올 행 수')
+        parser.add_argument('--name', help='체크포인트 이름 (기본: 종류 + 파일 경로)')
+        parser.add_argument('--max-errors', type=int, default=0, help='건너뛸 수 있는 잘못된 행 수 (넘으면 중단)')
+        parser.add_argument('--restart', action='store_true', help='체크포인트를 무시하고 처음부터 가져오기')
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size 는 1 이상이어야 합니다.')
+
+        started = time.monotonic()
+        resumed_from = None
+
+        def report(checkpoint):
+            elapsed = time.monotonic() - started
+            done = checkpoint.rows_done - resumed_from
+            self.stdout.write(f'  {checkpoint.rows_done}행 처리 (가져옴 {checkpoint.imported}, 건너뜀 {checkpoint.skipped}) '
+                              f'{done / elapsed if elapsed else 0:.0f}행/s')
+
+        name = options['name']
+        try:
+            existing = ImportCheckpoint.objects.filter(
+                name=name or checkpoint_name(options['kind'], options['path'])
+            ).first()
+            resumed_from = 0 if existing is None or options['restart'] else existing.rows_done
+            if existing and existing.completed_at and not options['restart']:
+                self.stdout.write(f'이미 완료된 가져오기입니다: {existing.name} (--restart 로 다시 실행)')
+                return
+            if resumed_from:
+                self.stdout.write(f'체크포인트 {resumed_from}행 이후부터 이어서 가져옵니다.')
+
+            checkpoint, errors = run_import(
+                options['kind'],
+                options['path'],
+                fmt=options['format'],
+                chunk_size=options['chunk_size'],
+                name=name,
+                max_errors=options['max_errors'],
+                restart=options['restart'],
+                progress=report,
+            )
+        except ImportAborted as e:
+            self._write_errors(e.errors)
+            raise CommandError(f'{e} 수정 후 다시 실행하면 마지막 체크포인트부터 이어집니다.')
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        self._write_errors(errors)
+        elapsed = time.monotonic() - started
+        done = checkpoint.rows_done - resumed_from
+        self.stdout.write(self.style.SUCCESS(
+            f'{checkpoint.imported}건 가져오기 완료, {checkpoint.skipped}행 건너뜀 '
+            f'({elapsed:.2f}s, {done / elapsed if elapsed else 0:.0f}행/s)'
+        ))
+
+    def _write_errors(self, errors):
+        for line, message in errors:
+            self.stderr.write(self.style.WARNING(f'  {line}번 줄: {message}'))
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportCheckpoint',
+            fields=[
+                ('name', models.CharField(max_length=200, primary_key=True, serialize=False)),
+                ('kind', models.CharField(max_length=20)),
+                ('source', models.CharField(max_length=500)),
+                ('rows_done', models.BigIntegerField(default=0, help_text='처리(가져오기 + 건너뜀)한 데이터 행 수')),
+                ('imported', models.BigIntegerField(default=0)),
+                ('skipped', models.BigIntegerField(default=0, help_text='검증 실패로 건너뛴 행 수')),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'import_checkpoint',
+            },
+        ),
+    ]
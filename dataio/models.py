@@ -0,0 +1,20 @@
+from django.db import models
+
+# Create your models here.
+
+class ImportCheckpoint(models.Model):
+    """가져오기 작업의 진행 위치 (커밋된 데이터 행 수)"""
+    name = models.CharField(max_length=200, primary_key=True)
+    kind = models.CharField(max_length=20)
+    source = models.CharField(max_length=500)
+    rows_done = models.BigIntegerField(default=0, help_text="처리(가져오기 + 건너뜀)한 데이터 행 수")
+    imported = models.BigIntegerField(default=0)
+    skipped = models.BigIntegerField(default=0, help_text="검증 실패로 건너뛴 행 수")
+    completed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'import_checkpoint'
+    
+    def __str__(self):
+        return f"{self.name} @ {self.rows_done}"
@@ -0,0 +1,126 @@
+import gzip
+import json
+import os
+import tempfile
+from datetime import date
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from account.models import User
+from donation.models import DonationPool, DonationTransaction
+from donation.routing import eligible_pools
+from growth.models import PetItem, PointsHistory
+
+from .exporters import export_chunks
+from .importers import ImportAborted, checkpoint_name, run_import
+from .models import ImportCheckpoint
+
+
+class ImportTests(TestCase):
+    def write(self, suffix, content):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_csv_items_abort_then_skip_invalid(self):
+        path = self.write('.csv', 'item_name,item_type,cost\n리본,decoration,50\n왕관,hat,10\n간식,snack,5\n')
+
+        with self.assertRaises(ImportAborted):
+            run_import('items', path)
+        self.assertFalse(PetItem.objects.exists())
+
+        checkpoint, errors = run_import('items', path, max_errors=1)
+        self.assertEqual((checkpoint.imported, checkpoint.skipped), (2, 1))
+        self.assertEqual(errors[0][0], 3)  # CSV 3번째 줄
+        self.assertIsNotNone(checkpoint.completed_at)
+
+    def test_resume_from_checkpoint(self):
+        rows = [{'email': f'u{i}@example.com', 'username': f'u{i}'} for i in range(5)]
+        path = self.write('.jsonl', '\n'.join(json.dumps(row) for row in rows))
+        # 앞의 2행을 커밋한 뒤 중단된 상태
+        User.objects.create_user(email='u0@example.com', username='u0')
+        User.objects.create_user(email='u1@example.com', username='u1')
+        ImportCheckpoint.objects.create(name=checkpoint_name('users', path), kind='users', source=path, rows_done=2,
+                                        imported=2)
+
+        checkpoint, errors = run_import('users', path, chunk_size=2)
+        self.assertEqual(errors, [])
+        self.assertEqual(checkpoint.imported, 5)
+        self.assertEqual(User.objects.count(), 5)
+        self.assertFalse(User.objects.get(username='u4').has_usable_password())
+
+    def test_imported_pools_become_routing_targets(self):
+        cache.clear()
+        self.assertEqual(eligible_pools(), [])  # 빈 목록을 프로세스 메모리에 적재
+        path = self.write('.csv', 'title,goal_points\n새 풀,500\n')
+
+        run_import('pools', path)
+        self.assertEqual([pool.pool_id for pool in eligible_pools()], list(DonationPool.objects.values_list('pk', flat=True)))
+
+    def test_points_keep_history_timestamps_and_validate_users_in_batch(self):
+        User.objects.create_user(email='a@example.com', username='a')
+        lines = [
+            {'user_email': 'a@example.com', 'points_change': 100, 'reason': 'meeting_participation',
+             'created_at': '2024-03-01T09:00:00+09:00'},
+            {'user_email': 'ghost@example.com', 'points_change': 100, 'reason': 'meeting_participation'},
+        ]
+        path = self.write('.jsonl', '\n'.join(json.dumps(line) for line in lines))
+
+        with self.assertRaises(CommandError):
+            call_command('import_data', 'points', path, stdout=StringIO(), stderr=StringIO())
+        call_command('import_data', 'points', path, '--max-errors', '1',
+                     stdout=StringIO(), stderr=StringIO())
+
+        entry = PointsHistory.objects.get()
+        self.assertEqual(entry.created_at.isoformat(), '2024-03-01T00:00:00+00:00')
+
+
+class ExportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='f@example.com', username='finance', is_staff=True)
+        pools = [DonationPool.objects.create(title=f'풀{i}', goal_points=1000) for i in range(2)]
+        self.pool = pools[0]
+        DonationTransaction.objects.bulk_create(
+            [DonationTransaction(pool_id=pools[i % 2], user_id=self.user, amount=i + 1) for i in range(25)]
+        )
+
+    def test_keyset_batches_cover_every_row_once(self):
+        counter = [0]
+        lines = b''.join(export_chunks('transactions', fmt='jsonl', batch_size=4, counter=counter)).splitlines()
+        ids = [json.loads(line)['transaction_id'] for line in lines]
+        self.assertEqual(counter[0], 25)
+        self.assertEqual(ids, sorted(set(ids)))
+
+    def test_filters(self):
+        rows = b''.join(export_chunks('transactions', pool_id=self.pool.pk)).decode().splitlines()
+        self.assertEqual(len(rows), 1 + 13)  # 헤더 + 짝수 번째 트랜잭션
+        self.assertEqual(b''.join(export_chunks('transactions', until=date(2000, 1, 1))).decode().count('\n'), 1)
+        with self.assertRaises(ValueError):
+            export_chunks('points', pool_id=self.pool.pk)
+
+    def test_streaming_gzip_endpoint_is_staff_only(self):
+        url = reverse('export_dataset', args=['transactions'])
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        self.client.force_login(self.user)
+        response = self.client.get(url, {'gzip': '1', 'pool': self.pool.pk})
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        body = gzip.decompress(b''.join(response.streaming_content)).decode()
+        self.assertTrue(body.startswith('transaction_id,pool_id,user_id,username,amount,created_at'))
+        self.assertEqual(self.client.get(url, {'since': 'yesterday'}).status_code, 400)
+        self.assertEqual(self.client.get(url, {'until': '2024-13-45'}).status_code, 400)
+
+    async def test_asgi_streams_without_buffering(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse('export_dataset', args=['transactions']), {'format': 'jsonl'})
+
+        self.assertTrue(response.is_async)
+        lines = b''.join([chunk async for chunk in response.streaming_content]).splitlines()
+        self.assertEqual(len(lines), 25)
@@ -0,0 +1,6 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('export/<str:dataset>/', views.export_dataset, name='export_dataset'),
+]
@@ -0,0 +1,77 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth.decorators import user_passes_test
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponseBadRequest, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from django.views.decorators.http import require_GET
+
+from .exporters import DATASETS, FORMATS, export_chunks
+
+# Create your views here.
+
+CONTENT_TYPES = {'csv': 'text/csv; charset=utf-8', 'jsonl': 'application/x-ndjson; charset=utf-8'}
+
+
+def _is_admin(user):
+    return user.is_authenticated and user.is_staff
+
+
+def _async_chunks(chunks):
+    """
+    동기 이터레이터를 async 이터레이터로 감싼다. (ASGI 용)
+
+    ASGI 에서 StreamingHttpResponse 는 동기 이터레이터를 끝까지 모은 뒤에 보내므로
+    (전체 내보내기가 메모리에 올라감) 한 조각씩 스레드에서 꺼내 바로 보낸다.
+    서버 측 커서가 같은 DB 연결을 쓰도록 thread_sensitive 로 꺼낸다.
+    """
+    iterator = iter(chunks)
+    done = object()
+    pull = sync_to_async(next, thread_sensitive=True)
+
+    async def stream():
+        while (chunk := await pull(iterator, done)) is not done:
+            yield chunk
+    return stream()
+
+
+@require_GET
+@user_passes_test(_is_admin)
+def export_dataset(request, dataset):
+    """
+    정산용 원장 내보내기 (관리자 전용, 스트리밍)
+    GET ?format=csv|jsonl&since=YYYY-MM-DD&until=YYYY-MM-DD&pool=<pool_id>&gzip=1
+    """
+    fmt = request.GET.get('format', 'csv')
+    if dataset not in DATASETS or fmt not in FORMATS:
+        return HttpResponseBadRequest(f'dataset 은 {", ".join(DATASETS)}, format 은 {", ".join(FORMATS)} 중 하나여야 합니다.')
+
+    filters = {}
+    for key in ('since', 'until'):
+        if request.GET.get(key):
+            try:
+                filters[key] = parse_date(request.GET[key])
+            except ValueError:  # 형식은 맞지만 없는 날짜 (2024-13-45)
+                filters[key] = None
+            if filters[key] is None:
+                return HttpResponseBadRequest(f'{key} 는 YYYY-MM-DD 형식의 올바른 날짜여야 합니다.')
+    if request.GET.get('pool'):
+        if not request.GET['pool'].isdigit():
+            return HttpResponseBadRequest('pool 은 숫자여야 합니다.')
+        filters['pool_id'] = int(request.GET['pool'])
+    compress = request.GET.get('gzip') in ('1', 'true')
+
+    try:
+        chunks = export_chunks(dataset, fmt=fmt, compress=compress, **filters)
+    except ValueError as e:
+        return HttpResponseBadRequest(str(e))
+
+    filename = f'{dataset}-{timezone.localdate():%Y%m%d}.{fmt}' + ('.gz' if compress else '')
+    if isinstance(request, ASGIRequest):
+        chunks = _async_chunks(chunks)
+    response = StreamingHttpResponse(
+        chunks, content_type='application/gzip' if compress else CONTENT_TYPES[fmt]
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response['Cache-Control'] = 'no-store'
+    return response
@@ -5,8 +5,9 @@ from .models import DonationPool, DonationHistory
 
 @admin.register(DonationPool)
 class DonationPoolAdmin(admin.ModelAdmin):
-    list_display = ['pool_id', 'title', 'current_points', 'goal_points', 'status', 'created_at', 'completed_at']
+    list_display = ['pool_id', 'title', 'current_points', 'goal_points', 'get_progress_display', 'status', 'priority', 'start_date', 'end_date', 'created_at', 'completed_at']
     list_filter = ['status', 'created_at']
+    list_editable = ['priority']
     search_fields = ['title']
     readonly_fields = ['pool_id', 'created_at']
     
@@ -19,6 +20,8 @@ class DonationPoolAdmin(admin.ModelAdmin):
 class DonationHistoryAdmin(admin.ModelAdmin):
     list_display = ['donation_id', 'pool_id', 'user_id', 'contributed_points', 'created_at']
     list_filter = ['created_at']
+    list_select_related = ['pool_id', 'user_id']
     search_fields = ['pool_id__title', 'user_id__username', 'user_id__email']
     readonly_fields = ['donation_id', 'created_at']
+    autocomplete_fields = ['pool_id', 'user_id']
     ordering = ['-contributed_points', '-created_at']
@@ -0,0 +1,24 @@
+"""
+기부 이벤트 핸들러 (outbox)
+"""
+from community.tasks import create_donation_history
+from outbox.events import handler
+
+from .models import DonationPool
+from .routing import apply_credits, route_events
+
+
+@handler('points_granted', name='donation.credit_pools')
+def credit_pools(events):
+    """지급된 포인트를 지급일 기준 적립 대상 풀에 배분 (묶음의 풀별 합계로 한 번에 갱신)"""
+    apply_credits(route_events(events))
+
+
+@handler('pool_completed', name='donation.hall_of_fame')
+def build_hall_of_fame(events):
+    """목표를 달성한 풀의 명예의 전당 생성"""
+    pools = DonationPool.objects.in_bulk([event.payload['pool_id'] for event in events])
+    for event in events:
+        pool = pools.get(event.payload['pool_id'])
+        if pool is not None:
+            create_donation_history(pool)
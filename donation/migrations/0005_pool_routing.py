@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0004_donationtransaction'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='donationpool',
+            name='priority',
+            field=models.IntegerField(default=0, help_text='적립 라우팅 우선순위 (클수록 먼저, donation.routing 참고)'),
+        ),
+        migrations.AddIndex(
+            model_name='donationpool',
+            index=models.Index(fields=['status', 'priority'], name='donation_po_status_d505e9_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:20
+# 0001_initial 이후 모델에서 바뀐 포인트 필드 help_text 를 반영 (스키마 변경 없음)
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donation', '0005_pool_routing'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='donationhistory',
+            name='contributed_points',
+            field=models.IntegerField(help_text='해당 pool에 대한 최종 기여 포인트'),
+        ),
+        migrations.AlterField(
+            model_name='donationpool',
+            name='current_points',
+            field=models.IntegerField(default=0, help_text='해당 캠페인에 누적된 전체 기부 포인트 합계'),
+        ),
+        migrations.AlterField(
+            model_name='donationpool',
+            name='goal_points',
+            field=models.IntegerField(help_text='캠페인 목표 포인트'),
+        ),
+    ]
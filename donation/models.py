@@ -24,6 +24,10 @@ class DonationPool(models.Model):
     )
     goal_points = models.IntegerField(help_text="캠페인 목표 포인트")
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='open')
+    priority = models.IntegerField(
+        default=0,
+        help_text="적립 라우팅 우선순위 (클수록 먼저, donation.routing 참고)"
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
@@ -31,6 +35,9 @@ class DonationPool(models.Model):
     class Meta:
         db_table = 'donation_pool'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'priority']),  # 적립 대상 풀 조회
+        ]
 
     def __str__(self):
         return self.title
@@ -0,0 +1,180 @@
+"""
+기부 풀 적립 라우팅
+
+지급된 포인트를 어느 풀에 얼마나 적립할지 정한다.
+
+1. 적립 대상: status='open' 이고 지급일(TIME_ZONE 기준)이 start_date ~ end_date 안에 있는 풀
+   (날짜가 비어 있으면 그쪽으로는 제한 없음)
+2. 배분 정책 (settings.DONATION_ROUTING_POLICY)
+   - split: 대상 풀에 균등 분배, 나머지는 우선순위가 높은 풀부터 1점씩
+   - priority: 우선순위가 가장 높은 풀 하나에 전부
+   - round_robin: 이벤트 번호(event_id)로 풀을 돌아가며 선택 (재처리해도 같은 풀)
+3. 적립: 풀별 증가량을 CASE WHEN 으로 묶어 batch_size 개 풀마다 UPDATE 한 문장
+
+대상 풀 목록은 적립마다 바뀌지 않으므로 프로세스 메모리에 두고, 공유 캐시의
+'active_pools' 버전(myproject.conditional)이 바뀌었을 때 다시 읽는다.
+버전은 donation.signals 의 DonationPool 시그널, 완료 처리(claim_completed_pools),
+가져오기(dataio.importers)에서 올린다. 공유 캐시가 아니거나(LocMem 등) 버전을 올리지 않는
+경로로 바뀐 경우에도 ACTIVE_POOLS_TTL_SECONDS 가 지나면 다시 읽는다.
+current_points 는 캐시하지 않으므로 적립 자체는 버전을 올리지 않는다.
+
+    allocations = route_events(events)      # {pool_id: points}
+    apply_credits(allocations)
+"""
+import threading
+import time
+from collections import defaultdict, namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, F, Q, Value, When
+from django.utils import timezone
+
+from community.tasks import claim_completed_pools
+from myproject.conditional import bump_version, get_versions
+from outbox.events import publish_many
+
+from .models import DonationPool
+
+POLICIES = ('split', 'priority', 'round_robin')
+DEFAULT_POLICY = 'split'
+DEFAULT_BATCH_SIZE = 200
+# 대상 풀 정렬: 우선순위 높은 순, 같으면 최근 생성 순
+POOL_ORDERING = ('-priority', '-created_at', '-pool_id')
+ACTIVE_POOLS_TTL_SECONDS = 60
+
+ActivePool = namedtuple('ActivePool', ['pool_id', 'start_date', 'end_date', 'priority'])
+
+_active_pools = (None, 0.0, ())       # (버전, 읽은 시각(monotonic), 풀 목록)
+_active_pools_lock = threading.Lock()
+
+
+def get_policy():
+    policy = getattr(settings, 'DONATION_ROUTING_POLICY', DEFAULT_POLICY)
+    if policy not in POLICIES:
+        raise ValueError(f'알 수 없는 적립 정책입니다: {policy}')
+    return policy
+
+
+def get_active_pools():
+    """진행 중인 풀의 ActivePool 튜플 (POOL_ORDERING 순)"""
+    global _active_pools
+    [version] = get_versions('active_pools')
+
+    def is_fresh(cached):
+        return cached[0] == version and time.monotonic() - cached[1] < ACTIVE_POOLS_TTL_SECONDS
+
+    if is_fresh(_active_pools):
+        return _active_pools[2]
+    with _active_pools_lock:
+        if not is_fresh(_active_pools):
+            loaded_at = time.monotonic()
+            pools = tuple(
+                ActivePool(*row) for row in DonationPool.objects.filter(status='open')
+                .order_by(*POOL_ORDERING)
+                .values_list('pool_id', 'start_date', 'end_date', 'priority')
+            )
+            _active_pools = (version, loaded_at, pools)
+        return _active_pools[2]
+
+
+def _is_eligible(pool, on_date):
+    return (pool.start_date is None or pool.start_date <= on_date) and (
+        pool.end_date is None or on_date <= pool.end_date
+    )
+
+
+def eligible_pools(on_date=None):
+    """on_date(기본: 오늘)에 적립 대상인 풀 목록"""
+    on_date = on_date or timezone.localdate()
+    return [pool for pool in get_active_pools() if _is_eligible(pool, on_date)]
+
+
+def featured_pool(on_date=None):
+    """화면에 대표로 보여줄 풀 (적립 대상 중 첫 번째, 없으면 None). 쿼리 한 번."""
+    on_date = on_date or timezone.localdate()
+    return (
+        DonationPool.objects.filter(status='open')
+        .filter(Q(start_date__isnull=True) | Q(start_date__lte=on_date))
+        .filter(Q(end_date__isnull=True) | Q(end_date__gte=on_date))
+        .order_by(*POOL_ORDERING)
+        .first()
+    )
+
+
+def _next_turn():
+    """이벤트 번호가 없는 적립(직접 호출)용 round_robin 순번"""
+    key = 'donation:routing:turn'
+    cache.add(key, 0, None)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        return 0
+
+
+def allocate(points, pools, policy=None, key=None):
+    """
+    points 를 pools 에 배분한 {pool_id: points}
+
+    pools 는 POOL_ORDERING 순이어야 한다. key 는 round_robin 에서 풀을 고르는 번호.
+    """
+    policy = policy or get_policy()
+    if policy not in POLICIES:
+        raise ValueError(f'알 수 없는 적립 정책입니다: {policy}')
+    if points <= 0 or not pools:
+        return {}
+    if policy == 'priority':
+        return {pools[0].pool_id: points}
+    if policy == 'round_robin':
+        if key is None:
+            key = _next_turn()
+        return {pools[key % len(pools)].pool_id: points}
+    share, remainder = divmod(points, len(pools))
+    allocations = {}
+    for index, pool in enumerate(pools):
+        amount = share + (1 if index < remainder else 0)
+        if amount:
+            allocations[pool.pool_id] = amount
+    return allocations
+
+
+def route_events(events, policy=None):
+    """points_granted 이벤트 묶음의 풀별 적립량 합계 {pool_id: points}"""
+    policy = policy or get_policy()
+    pools_by_date = {}
+    totals = defaultdict(int)
+    for event in events:
+        on_date = timezone.localdate(event.created_at)
+        if on_date not in pools_by_date:
+            pools_by_date[on_date] = eligible_pools(on_date)
+        routed = allocate(event.payload['total_points'], pools_by_date[on_date], policy, key=event.event_id)
+        for pool_id, amount in routed.items():
+            totals[pool_id] += amount
+    return dict(totals)
+
+
+def apply_credits(allocations, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    {pool_id: points} 를 적립하고 이번에 목표를 달성한 pool_id 목록을 반환
+
+    batch_size 개 풀마다 UPDATE ... SET current_points = current_points + CASE ... 한 문장.
+    그 사이 완료된 풀은 WHERE status='open' 에 걸러져 적립되지 않는다.
+    """
+    items = sorted((pool_id, points) for pool_id, points in allocations.items() if points)
+    if not items:
+        return []
+    for index in range(0, len(items), batch_size):
+        batch = items[index:index + batch_size]
+        DonationPool.objects.filter(pk__in=[pool_id for pool_id, _ in batch], status='open').update(
+            current_points=F('current_points') + Case(
+                *[When(pk=pool_id, then=Value(points)) for pool_id, points in batch],
+                default=Value(0),
+            )
+        )
+    bump_version('donation_pools')
+
+    # DonationHistory 생성은 이벤트 핸들러에서 처리
+    claimed = claim_completed_pools()
+    if claimed:
+        publish_many('pool_completed', [{'pool_id': pool_id} for pool_id in claimed])
+    return claimed
@@ -0,0 +1,18 @@
+"""
+기부 풀 변경 시그널
+
+풀 진행률을 보여주는 화면(홈 API 등)의 ETag 가 바뀌도록 'donation_pools' 버전을,
+적립 대상 풀 캐시(donation.routing)를 다시 읽도록 'active_pools' 버전을 올린다.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from myproject.conditional import bump_version
+
+from .models import DonationPool
+
+
+@receiver(post_save, sender=DonationPool)
+@receiver(post_delete, sender=DonationPool)
+def bump_donation_pools_version(sender, **kwargs):
+    bump_version('donation_pools', 'active_pools')
@@ -1,3 +1,158 @@
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from account.models import User
+
+from .handlers import build_hall_of_fame, credit_pools
+from .models import DonationHistory, DonationPool
+from .routing import ACTIVE_POOLS_TTL_SECONDS, allocate, apply_credits, eligible_pools, featured_pool
+
+
+class ConditionalDonationPageTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='d@example.com', username='donor', password='pw')
+        self.pool = DonationPool.objects.create(title='풀', goal_points=100, current_points=100, status='completed')
+        DonationHistory.objects.create(pool_id=self.pool, user_id=self.user, contributed_points=100)
+        self.client.force_login(self.user)
+
+    def test_history_revalidates_until_pool_changes(self):
+        url = reverse('donation_history', args=[self.pool.pk])
+        response = self.client.get(url)
+        self.assertIn('Last-Modified', response)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        etag = response['ETag']
+
+        self.pool.title = '새 이름'
+        self.pool.save()
+        self.assertContains(self.client.get(url, HTTP_IF_NONE_MATCH=etag), '새 이름')
+
+    def test_donation_page_changes_with_pools(self):
+        url = reverse('donation')
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        DonationPool.objects.create(title='새 캠페인', goal_points=500)
+        self.assertContains(self.client.get(url, HTTP_IF_NONE_MATCH=etag), '새 캠페인')
+
+
+class PoolCompletionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_completion_is_claimed_exactly_once(self):
+        from community.tasks import claim_completed_pools, update_donation_pool
+        from outbox.models import OutboxEvent
+
+        small = DonationPool.objects.create(title='작은 풀', goal_points=100)
+        large = DonationPool.objects.create(title='큰 풀', goal_points=1000)
+
+        update_donation_pool(120)  # split: 60 / 60
+        self.assertFalse(OutboxEvent.objects.filter(event_type='pool_completed').exists())
+
+        self.assertEqual(update_donation_pool(120), [small.pk])
+        small.refresh_from_db()
+        self.assertEqual((small.status, small.current_points), ('completed', 120))
+        self.assertIsNotNone(small.completed_at)
+
+        # 다른 워커가 뒤늦게 같은 조건을 확인해도 이미 전환된 풀은 다시 선점되지 않는다.
+        self.assertEqual(claim_completed_pools(), [])
+        events = OutboxEvent.objects.filter(event_type='pool_completed')
+        self.assertEqual([event.payload['pool_id'] for event in events], [small.pk])
+
+        # 완료된 풀은 적립 대상에서 빠진다.
+        update_donation_pool(10)
+        small.refresh_from_db()
+        large.refresh_from_db()
+        self.assertEqual((small.current_points, large.current_points), (120, 130))
+
+    def test_hall_of_fame_is_idempotent(self):
+        from growth.models import PointsHistory
+        from notification.models import Notification
+        from outbox.models import OutboxEvent
+
+        pool = DonationPool.objects.create(title='풀', goal_points=100)
+        user = User.objects.create_user(email='hof@example.com', username='hof', password='pw')
+        PointsHistory.objects.create(user_id=user, points_change=150, reason='admin_approval')
+        event = OutboxEvent.objects.create(event_type='pool_completed', payload={'pool_id': pool.pk})
+
+        # 같은 이벤트가 두 번 전달되어도 기록과 알림은 한 번만
+        build_hall_of_fame([event])
+        build_hall_of_fame([event])
+        self.assertEqual(DonationHistory.objects.get(pool_id=pool, user_id=user).contributed_points, 150)
+        self.assertEqual(Notification.objects.filter(user_id=user, notification_type='donation_completed').count(), 1)
+
+
+class PoolRoutingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        today = timezone.localdate()
+        self.today = today
+        self.high = DonationPool.objects.create(title='우선', goal_points=10000, priority=5)
+        self.low = DonationPool.objects.create(title='일반', goal_points=10000)
+        self.window = DonationPool.objects.create(
+            title='기간', goal_points=10000, start_date=today, end_date=today + timedelta(days=7)
+        )
+        DonationPool.objects.create(title='종료됨', goal_points=10000, end_date=today - timedelta(days=1))
+        DonationPool.objects.create(title='예정', goal_points=10000, start_date=today + timedelta(days=1))
+
+    def test_policies(self):
+        pools = eligible_pools(self.today)
+        self.assertEqual([pool.pool_id for pool in pools], [self.high.pk, self.window.pk, self.low.pk])
+
+        self.assertEqual(
+            allocate(100, pools, 'split'), {self.high.pk: 34, self.window.pk: 33, self.low.pk: 33}
+        )
+        self.assertEqual(allocate(100, pools, 'priority'), {self.high.pk: 100})
+        self.assertEqual(
+            [allocate(10, pools, 'round_robin', key=key) for key in (3, 4, 5)],
+            [{self.high.pk: 10}, {self.window.pk: 10}, {self.low.pk: 10}],
+        )
+        self.assertEqual(allocate(10, [], 'split'), {})
+        with self.assertRaises(ValueError):
+            allocate(10, pools, 'random')
+
+    def test_active_pools_cached_until_pool_changes(self):
+        eligible_pools(self.today)
+        with self.assertNumQueries(0):
+            eligible_pools(self.today)
+
+        apply_credits({self.low.pk: 5})  # 적립은 대상 목록을 바꾸지 않는다.
+        with self.assertNumQueries(0):
+            eligible_pools(self.today)
+
+        self.low.priority = 10
+        self.low.save()
+        with self.assertNumQueries(1):
+            self.assertEqual(eligible_pools(self.today)[0].pool_id, self.low.pk)
+
+    def test_active_pools_expire_without_version_bump(self):
+        eligible_pools(self.today)
+        # 버전을 올리지 않는 경로(다른 프로세스의 LocMem 캐시 등)로 바뀐 풀
+        DonationPool.objects.filter(pk=self.low.pk).update(priority=10)
+        with mock.patch('donation.routing.time.monotonic', return_value=time.monotonic() + ACTIVE_POOLS_TTL_SECONDS):
+            self.assertEqual(eligible_pools(self.today)[0].pool_id, self.low.pk)
+
+    def test_credit_handler_routes_events_in_one_update(self):
+        from outbox.models import OutboxEvent
+
+        events = [OutboxEvent.objects.create(event_type='points_granted', payload={'total_points': 30})
+                  for _ in range(4)]
+        eligible_pools(self.today)
+        with self.settings(DONATION_ROUTING_POLICY='split'):
+            # UPDATE 한 번 + 완료 선점 UPDATE 한 번
+            with self.assertNumQueries(2):
+                credit_pools(events)
 
-# Create your tests here.
+        points = dict(DonationPool.objects.values_list('title', 'current_points'))
+        self.assertEqual(
+            points, {'우선': 40, '일반': 40, '기간': 40, '종료됨': 0, '예정': 0}
+        )
+        self.assertEqual(featured_pool(self.today), self.high)
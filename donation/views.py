@@ -1,11 +1,15 @@
 from django import forms
 from django.contrib.auth.decorators import login_required, user_passes_test
-from django.db.models import Sum
+from django.db.models import Max, Sum
 from django.shortcuts import get_object_or_404, redirect, render
+from django.utils import timezone
 
 from growth.models import PointsHistory
+from myproject.conditional import conditional_page
+from myproject.db_router import replica_reads
 
 from .models import DonationHistory, DonationPool, DonationTransaction
+from .routing import featured_pool
 
 
 class DonationPoolForm(forms.ModelForm):
@@ -13,7 +17,7 @@ class DonationPoolForm(forms.ModelForm):
 
     class Meta:
         model = DonationPool
-        fields = ['title', 'sponsor', 'start_date', 'end_date', 'goal_points']
+        fields = ['title', 'sponsor', 'start_date', 'end_date', 'goal_points', 'priority']
         widgets = {
             'title': forms.TextInput(
                 attrs={
@@ -46,6 +50,11 @@ class DonationPoolForm(forms.ModelForm):
                     'min': 1,
                 }
             ),
+            'priority': forms.NumberInput(
+                attrs={
+                    'class': 'form-control',
+                }
+            ),
         }
         labels = {
             'title': '기부 이벤트 제목',
@@ -53,6 +62,7 @@ class DonationPoolForm(forms.ModelForm):
             'start_date': '시작일',
             'end_date': '종료일',
             'goal_points': '목표 포인트',
+            'priority': '적립 우선순위',
         }
 
     def clean(self):
@@ -66,7 +76,22 @@ class DonationPoolForm(forms.ModelForm):
         return cleaned_data
 
 
+def _donation_page_etag(request):
+    """
+    기부 내역/TOP 10/내 기여도는 새 트랜잭션이 쌓일 때만 바뀐다. (PK 인덱스 조회 한 번)
+    대표 캠페인은 기간(start_date ~ end_date)으로 고르므로 날짜도 섞는다.
+    """
+    latest = DonationTransaction.objects.aggregate(latest=Max('transaction_id'))['latest']
+    return latest, timezone.localdate()
+
+
+def _history_last_modified(request, pool_id):
+    """명예의 전당 행은 풀 완료 시 한 번 생성되고 수정되지 않는다."""
+    return DonationHistory.objects.filter(pool_id=pool_id).aggregate(latest=Max('created_at'))['latest']
 
+
+@replica_reads
+@conditional_page('donation_pools', etag_func=_donation_page_etag)
 def donation(request):
     """
     메인 기부 페이지
@@ -83,12 +108,8 @@ def donation(request):
     show_all_donations = request.GET.get('view') == 'all'
 
     try:
-        # 현재 진행 중인 기부 캠페인 (가장 최근 open)
-        active_pool = (
-            DonationPool.objects.filter(status='open')
-            .order_by('-created_at')
-            .first()
-        )
+        # 현재 적립 중인 대표 캠페인 (기간 안, 우선순위 → 최근 생성 순)
+        active_pool = featured_pool()
 
         # 완료된 캠페인 목록
         completed_pools = (
@@ -139,7 +160,9 @@ def donation(request):
     return render(request, 'donation.html', context)
 
 
+@replica_reads
 @login_required
+@conditional_page('donation_pools', last_modified_func=_history_last_modified)
 def donation_history(request, pool_id):
     """기부 명예의 전당 (완료된 캠페인 기준)"""
     pool = get_object_or_404(DonationPool, pool_id=pool_id)
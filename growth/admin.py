@@ -1,5 +1,7 @@
 from django.contrib import admin
-from .models import PetItem, UserPet, UserInventory, PointsHistory
+from myproject.pagination import EstimatedCountPaginator
+
+from .models import PetItem, UserPet, UserInventory, UserEquipment, PointsHistory, PointsRollup
 
 # Register your models here.
 
@@ -15,22 +17,59 @@ class PetItemAdmin(admin.ModelAdmin):
 class UserPetAdmin(admin.ModelAdmin):
     list_display = ['user_pet_id', 'user_id', 'pet_type', 'current_level', 'current_xp', 'updated_at']
     list_filter = ['pet_type', 'current_level', 'created_at']
+    list_select_related = ['user_id']
     search_fields = ['user_id__username', 'user_id__email']
     readonly_fields = ['user_pet_id', 'created_at', 'updated_at']
+    autocomplete_fields = ['user_id']
 
 
 @admin.register(UserInventory)
 class UserInventoryAdmin(admin.ModelAdmin):
-    list_display = ['inventory_id', 'user_id', 'item_id', 'is_equipped', 'acquired_at']
-    list_filter = ['is_equipped', 'acquired_at']
+    list_display = ['inventory_id', 'user_id', 'item_id', 'acquired_at']
+    list_filter = ['acquired_at']
+    list_select_related = ['user_id', 'item_id']
     search_fields = ['user_id__username', 'item_id__item_name']
     readonly_fields = ['inventory_id', 'acquired_at']
+    autocomplete_fields = ['user_id', 'item_id']
+
+
+@admin.register(UserEquipment)
+class UserEquipmentAdmin(admin.ModelAdmin):
+    list_display = ['equipment_id', 'user_id', 'slot', 'inventory_id', 'equipped_at']
+    list_filter = ['slot']
+    list_select_related = ['user_id', 'inventory_id__item_id']
+    search_fields = ['user_id__username', 'inventory_id__item_id__item_name']
+    readonly_fields = ['equipment_id', 'equipped_at']
+    autocomplete_fields = ['user_id', 'inventory_id']
 
 
 @admin.register(PointsHistory)
 class PointsHistoryAdmin(admin.ModelAdmin):
     list_display = ['point_id', 'user_id', 'points_change', 'reason', 'meeting_id', 'item_id', 'created_at']
     list_filter = ['reason', 'created_at']
+    list_select_related = ['user_id', 'meeting_id', 'item_id']
     search_fields = ['user_id__username', 'user_id__email']
     readonly_fields = ['point_id', 'created_at']
+    autocomplete_fields = ['user_id', 'meeting_id', 'item_id']
     date_hierarchy = 'created_at'
+    # 계속 쌓이는 원장 테이블: 전체 COUNT(*) 대신 추정치 사용
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(PointsRollup)
+class PointsRollupAdmin(admin.ModelAdmin):
+    list_display = ['period', 'bucket_start', 'user_id', 'reason', 'points_total', 'points_earned', 'entry_count']
+    list_filter = ['period', 'reason', 'bucket_start']
+    list_select_related = ['user_id']
+    search_fields = ['user_id__username', 'user_id__email']
+    date_hierarchy = 'bucket_start'
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    
+    def has_add_permission(self, request):
+        # build_points_rollups 로만 생성
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,98 @@
+"""
+펫 애니메이션 스프라이트 아틀라스 조회
+
+`python manage.py build_pet_atlas` 가 만든 manifest.json 을 읽어
+펫 종류/레벨에 해당하는 프레임의 아틀라스 위치를 알려준다.
+manifest 가 없으면 None 을 돌려주고, 템플릿은 개별 프레임 PNG(frame_image_path)로 폴백한다.
+"""
+import json
+import os
+from functools import lru_cache
+
+from django.contrib.staticfiles import finders
+
+ATLAS_STATIC_DIR = 'growth/atlas'
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_PATH = f'{ATLAS_STATIC_DIR}/{MANIFEST_NAME}'
+FRAME_STATIC_DIR = 'growth/pet'
+FRAME_PREFIX = 'ezgif-frame-'
+# 펫 선택 화면 미리보기에 쓰는 프레임 (레벨 기준)
+PREVIEW_LEVEL = 30
+
+# (경로, mtime) 이 바뀌었을 때만 manifest 를 다시 읽는다.
+_manifest_cache = {'key': None, 'data': None}
+
+
+def load_manifest():
+    """아틀라스 manifest 로드 (없으면 None)"""
+    path = finders.find(MANIFEST_PATH)
+    if not path:
+        return None
+
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+    except OSError:
+        return None
+
+    if _manifest_cache['key'] != key:
+        with open(path, encoding='utf-8') as fp:
+            _manifest_cache['data'] = json.load(fp)
+        _manifest_cache['key'] = key
+    return _manifest_cache['data']
+
+
+def get_pet_frame(pet_type, level):
+    """
+    펫 종류/레벨에 해당하는 아틀라스 프레임 정보
+
+    반환값은 템플릿에서 background-size/background-position 으로 바로 쓸 수 있는
+    퍼센트 값을 포함한다. 레벨이 프레임 수를 넘으면 마지막 프레임을 보여준다.
+    """
+    manifest = load_manifest()
+    if not manifest:
+        return None
+
+    pet = manifest.get('pets', {}).get(pet_type)
+    if not pet or not pet['frame_count']:
+        return None
+
+    index = min(max(int(level), 1), pet['frame_count']) - 1
+    columns = pet['columns']
+    rows = pet['rows']
+    col, row = index % columns, index // columns
+
+    return {
+        'png': f"{ATLAS_STATIC_DIR}/{pet['png']}",
+        'webp': f"{ATLAS_STATIC_DIR}/{pet['webp']}" if pet.get('webp') else None,
+        'frame_width': pet['frame_width'],
+        'frame_height': pet['frame_height'],
+        'size_x': columns * 100,
+        'size_y': rows * 100,
+        'pos_x': round(col * 100 / (columns - 1), 4) if columns > 1 else 0,
+        'pos_y': round(row * 100 / (rows - 1), 4) if rows > 1 else 0,
+    }
+
+
+@lru_cache(maxsize=None)
+def _frame_paths(pet_type):
+    """펫 종류별 개별 프레임 정적 경로 튜플 (프로세스당 한 번 디렉터리를 읽음)"""
+    directory = finders.find(f'{FRAME_STATIC_DIR}/{pet_type}')
+    if not directory or not os.path.isdir(directory):
+        return ()
+    names = sorted(
+        name for name in os.listdir(directory) if name.startswith(FRAME_PREFIX) and name.endswith('.png')
+    )
+    return tuple(f'{FRAME_STATIC_DIR}/{pet_type}/{name}' for name in names)
+
+
+def frame_image_path(pet_type, level):
+    """
+    펫 종류/레벨에 해당하는 개별 프레임 PNG 의 정적 경로
+
+    레벨이 프레임 수를 넘으면 마지막 프레임을 보여준다. (아틀라스와 같은 규칙)
+    """
+    level = max(int(level), 1)
+    paths = _frame_paths(pet_type)
+    if not paths:
+        return f'{FRAME_STATIC_DIR}/{pet_type}/{FRAME_PREFIX}{level:03d}.png'
+    return paths[min(level, len(paths)) - 1]
@@ -0,0 +1,79 @@
+"""
+상점 카탈로그 캐시와 사용자별 상점 상태
+
+PetItem 카탈로그는 관리자가 수정할 때만 바뀌므로 프로세스 메모리에 두고,
+공유 캐시의 'pet_items' 버전(myproject.conditional)이 바뀌었을 때만 다시 읽는다.
+버전은 growth.signals 의 PetItem 시그널에서 올린다.
+
+사용자별 상태(보유/장착/구매 가능/레벨 부족)는 카탈로그 + 인벤토리 쿼리 한 번으로 계산한다.
+"""
+import threading
+from collections import namedtuple
+
+from django.db.models import Exists, OuterRef
+
+from myproject.conditional import get_versions
+from myproject.db_router import primary_reads
+
+from .models import PetItem, UserEquipment, UserInventory
+
+CatalogItem = namedtuple(
+    'CatalogItem', ['item_id', 'item_name', 'item_type', 'item_type_display', 'required_level', 'cost']
+)
+
+_catalog = (None, ())
+_catalog_lock = threading.Lock()
+
+
+def get_catalog():
+    """(required_level, cost) 순으로 정렬된 CatalogItem 튜플"""
+    global _catalog
+    [version] = get_versions('pet_items')
+    cached_version, items = _catalog
+    if cached_version == version:
+        return items
+    with _catalog_lock:
+        if _catalog[0] != version:
+            item_types = dict(PetItem.ITEM_TYPE_CHOICES)
+            with primary_reads():
+                items = tuple(
+                    CatalogItem(item_id, name, item_type, item_types.get(item_type, item_type), level, cost)
+                    for item_id, name, item_type, level, cost in PetItem.objects.order_by('required_level', 'cost')
+                    .values_list('item_id', 'item_name', 'item_type', 'required_level', 'cost')
+                )
+            _catalog = (version, items)
+        return _catalog[1]
+
+
+def get_shop_items(user, pet_level):
+    """
+    카탈로그에 사용자별 상태를 붙인 상점 목록
+
+    pet_level 이 None 이면(펫 없음) 레벨 제한은 적용하지 않는다.
+    반환: [{'item': CatalogItem, 'inventory_id', 'owned', 'equipped', 'affordable',
+            'locked_by_level', 'can_purchase'}, ...]
+    """
+    equipped = UserEquipment.objects.filter(inventory_id=OuterRef('pk'))
+    inventory = {
+        item_id: (inventory_id, is_equipped)
+        for inventory_id, item_id, is_equipped in UserInventory.objects.filter(user_id=user)
+        .annotate(is_equipped=Exists(equipped))
+        .values_list('inventory_id', 'item_id', 'is_equipped')
+    }
+    points = user.total_points
+    shop_items = []
+    for item in get_catalog():
+        inventory_id, equipped = inventory.get(item.item_id, (None, False))
+        owned = inventory_id is not None
+        affordable = points >= item.cost
+        locked_by_level = pet_level is not None and pet_level < item.required_level
+        shop_items.append({
+            'item': item,
+            'inventory_id': inventory_id,
+            'owned': owned,
+            'equipped': equipped,
+            'affordable': affordable,
+            'locked_by_level': locked_by_level,
+            'can_purchase': not owned and affordable and not locked_by_level,
+        })
+    return shop_items
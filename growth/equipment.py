@@ -0,0 +1,60 @@
+"""
+펫 아이템 장착 슬롯
+
+슬롯은 아이템 타입별로 하나씩이며 UserEquipment 의 (user_id, slot) 유니크 제약이 이를 보장한다.
+장착은 upsert(INSERT ... ON CONFLICT DO UPDATE) 한 번으로 같은 슬롯의 이전 아이템을 교체하고,
+해제는 DELETE 한 번이므로 동시에 여러 번 눌러도 슬롯당 장착 아이템은 항상 하나 이하다.
+upsert 는 시그널이 발생하지 않으므로 마이페이지 요약 버전은 여기서 직접 올린다.
+(해제는 post_delete 시그널이 mypage.signals 에서 처리)
+"""
+from django.db import transaction
+
+from mypage.summary import bump_summary_version
+
+from .models import PetItem, UserEquipment
+
+ACTIONS = ('equip', 'unequip', 'toggle')
+
+
+def equip(inventory):
+    """인벤토리 아이템을 해당 타입 슬롯에 장착 (inventory.item_id 가 로드되어 있어야 함)"""
+    UserEquipment.objects.bulk_create(
+        [UserEquipment(user_id_id=inventory.user_id_id, slot=inventory.item_id.item_type, inventory_id=inventory)],
+        update_conflicts=True,
+        unique_fields=['user_id', 'slot'],
+        update_fields=['inventory_id', 'equipped_at'],
+    )
+    bump_summary_version(inventory.user_id_id)
+
+
+def unequip(inventory):
+    """장착 해제. 장착되어 있었으면 True."""
+    deleted, _ = UserEquipment.objects.filter(
+        user_id=inventory.user_id_id, inventory_id=inventory
+    ).delete()
+    return bool(deleted)
+
+
+def change_equipment(inventory, action='toggle'):
+    """action 에 따라 장착/해제 후 장착 여부를 반환"""
+    if action not in ACTIONS:
+        raise ValueError(f'알 수 없는 동작입니다: {action}')
+    with transaction.atomic():
+        if action == 'equip':
+            equip(inventory)
+            return True
+        was_equipped = unequip(inventory)
+        if action == 'toggle' and not was_equipped:
+            equip(inventory)
+            return True
+        return False
+
+
+def get_loadout(user_id):
+    """슬롯별 장착 아이템: {slot: {'inventory_id', 'item_id', 'item_name'} or None}"""
+    loadout = {slot: None for slot, _ in PetItem.ITEM_TYPE_CHOICES}
+    for slot, inventory_id, item_id, item_name in UserEquipment.objects.filter(user_id=user_id).values_list(
+        'slot', 'inventory_id', 'inventory_id__item_id', 'inventory_id__item_id__item_name'
+    ):
+        loadout[slot] = {'inventory_id': inventory_id, 'item_id': item_id, 'item_name': item_name}
+    return loadout
@@ -0,0 +1,12 @@
+"""
+성장(포인트) 이벤트 핸들러 (outbox)
+"""
+from outbox.events import handler
+
+from .rollups import build_points_rollups
+
+
+@handler('points_granted', name='growth.points_rollups')
+def refresh_points_rollups(events):
+    """새로 쌓인 포인트 이력을 집계 테이블에 반영 (체크포인트 기반이라 중복 반영 없음)"""
+    build_points_rollups()
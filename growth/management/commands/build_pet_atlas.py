@@ -0,0 +1,133 @@
+"""
+펫 애니메이션 프레임을 스프라이트 아틀라스로 묶는 빌드 명령
+
+    python manage.py build_pet_atlas
+    python manage.py build_pet_atlas --frame-width 240 --columns 12 --webp-quality 75
+
+static/growth/pet/<pet>/ezgif-frame-NNN.png 를 펫별 한 장의 시트(PNG + WebP)로 합치고
+static/growth/atlas/manifest.json 에 프레임 배치 정보를 기록한다.
+"""
+import json
+import math
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from growth.atlas import MANIFEST_NAME
+from growth.models import UserPet
+
+FRAME_PATTERN = re.compile(r'ezgif-frame-(\d+)\.png$')
+
+
+class Command(BaseCommand):
+    help = '펫 애니메이션 프레임을 펫별 스프라이트 아틀라스(PNG/WebP)와 manifest 로 빌드합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source',
+            default=str(Path(settings.BASE_DIR) / 'static' / 'growth' / 'pet'),
+            help='펫별 프레임 디렉터리의 상위 경로',
+        )
+        parser.add_argument(
+            '--output',
+            default=str(Path(settings.BASE_DIR) / 'static' / 'growth' / 'atlas'),
+            help='아틀라스와 manifest 를 저장할 경로',
+        )
+        parser.add_argument('--frame-width', type=int, default=320, help='아틀라스 내 프레임 너비(px)')
+        parser.add_argument('--columns', type=int, default=10, help='아틀라스 한 줄의 프레임 수')
+        parser.add_argument('--webp-quality', type=int, default=80, help='WebP 품질 (0-100)')
+        parser.add_argument('--webp-lossless', action='store_true', help='WebP 를 무손실로 저장')
+        parser.add_argument('--pet', action='append', dest='pets', help='특정 펫만 빌드 (여러 번 지정 가능)')
+
+    def handle(self, *args, **options):
+        try:
+            from PIL import Image
+        except ImportError:
+            raise CommandError('Pillow 가 필요합니다: pip install Pillow')
+
+        source = Path(options['source'])
+        output = Path(options['output'])
+        if not source.is_dir():
+            raise CommandError(f'프레임 디렉터리를 찾을 수 없습니다: {source}')
+        if options['frame_width'] < 1 or options['columns'] < 1:
+            raise CommandError('--frame-width 와 --columns 는 1 이상이어야 합니다.')
+
+        pet_types = options['pets'] or [choice for choice, _ in UserPet.PET_TYPE_CHOICES]
+        output.mkdir(parents=True, exist_ok=True)
+
+        manifest_path = output / MANIFEST_NAME
+        manifest = {'pets': {}}
+        if manifest_path.exists() and options['pets']:
+            # 일부 펫만 다시 빌드하는 경우 나머지 항목은 유지
+            manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+
+        for pet_type in pet_types:
+            frames = self._collect_frames(source / pet_type)
+            if not frames:
+                self.stdout.write(self.style.WARNING(f'[{pet_type}] 프레임이 없어 건너뜁니다.'))
+                continue
+
+            entry, source_bytes, built_bytes = self._build_sheet(Image, pet_type, frames, output, options)
+            manifest['pets'][pet_type] = entry
+            self.stdout.write(
+                f'[{pet_type}] {entry["frame_count"]}프레임 → '
+                f'{entry["columns"]}x{entry["rows"]} 시트, '
+                f'{source_bytes / 1024 / 1024:.1f}MB → {built_bytes / 1024 / 1024:.1f}MB'
+            )
+
+        manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding='utf-8')
+        self.stdout.write(self.style.SUCCESS(f'manifest 저장 완료: {manifest_path}'))
+
+    def _collect_frames(self, pet_dir):
+        """프레임 번호 순으로 정렬된 프레임 경로 목록"""
+        if not pet_dir.is_dir():
+            return []
+        numbered = []
+        for path in pet_dir.iterdir():
+            match = FRAME_PATTERN.search(path.name)
+            if match:
+                numbered.append((int(match.group(1)), path))
+        return [path for _, path in sorted(numbered)]
+
+    def _build_sheet(self, Image, pet_type, frames, output, options):
+        """펫 한 종류의 프레임을 한 장의 시트로 합치고 PNG/WebP 로 저장"""
+        with Image.open(frames[0]) as first:
+            src_width, src_height = first.size
+        frame_width = options['frame_width']
+        frame_height = max(1, round(src_height * frame_width / src_width))
+
+        columns = min(options['columns'], len(frames))
+        rows = math.ceil(len(frames) / columns)
+
+        sheet = Image.new('RGBA', (columns * frame_width, rows * frame_height), (0, 0, 0, 0))
+        source_bytes = 0
+        for index, path in enumerate(frames):
+            source_bytes += path.stat().st_size
+            with Image.open(path) as frame:
+                frame = frame.convert('RGBA').resize((frame_width, frame_height), Image.LANCZOS)
+                sheet.paste(frame, ((index % columns) * frame_width, (index // columns) * frame_height))
+
+        png_name = f'{pet_type}.png'
+        webp_name = f'{pet_type}.webp'
+        sheet.save(output / png_name, format='PNG', optimize=True)
+        sheet.save(
+            output / webp_name,
+            format='WEBP',
+            quality=options['webp_quality'],
+            lossless=options['webp_lossless'],
+            method=6,
+        )
+
+        entry = {
+            'png': png_name,
+            'webp': webp_name,
+            'frame_count': len(frames),
+            'frame_width': frame_width,
+            'frame_height': frame_height,
+            'columns': columns,
+            'rows': rows,
+        }
+        built_bytes = (output / png_name).stat().st_size + (output / webp_name).stat().st_size
+        return entry, source_bytes, built_bytes
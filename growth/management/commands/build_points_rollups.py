@@ -0,0 +1,36 @@
+"""
+포인트 이력 집계 테이블 갱신 (cron 으로 주기 실행)
+
+    python manage.py build_points_rollups
+    python manage.py build_points_rollups --batch-size 20000
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from growth.rollups import DEFAULT_BATCH_SIZE, build_points_rollups
+
+
+class Command(BaseCommand):
+    help = '마지막 처리 위치 이후의 PointsHistory 를 일/주 단위 집계 테이블에 반영합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='트랜잭션 하나에서 처리할 이력 수')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size 는 1 이상이어야 합니다.')
+
+        started = time.monotonic()
+
+        def report(processed, last_id):
+            self.stdout.write(f'  {processed}건 반영 (point_id ≤ {last_id})')
+
+        processed = build_points_rollups(
+            batch_size=options['batch_size'],
+            progress=report,
+        )
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'{processed}건 집계 완료 ({elapsed:.2f}s, {processed / elapsed if elapsed else 0:.0f}건/s)'
+        ))
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:24
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('growth', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupCheckpoint',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('last_id', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'rollup_checkpoint',
+            },
+        ),
+        migrations.CreateModel(
+            name='PointsRollup',
+            fields=[
+                ('rollup_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('period', models.CharField(choices=[('day', '일간'), ('week', '주간')], max_length=10)),
+                ('bucket_start', models.DateField(help_text='일간은 해당 날짜, 주간은 그 주 월요일 (TIME_ZONE 기준)')),
+                ('reason', models.CharField(choices=[('ai_approval', 'AI 승인'), ('admin_approval', '관리자 승인'), ('item_purchase', '아이템 구매'), ('meeting_participation', '모임 참여')], max_length=30)),
+                ('points_total', models.IntegerField(default=0, help_text='points_change 합계 (차감 포함)')),
+                ('points_earned', models.IntegerField(default=0, help_text='적립(양수)만의 합계')),
+                ('entry_count', models.IntegerField(default=0)),
+                ('user_id', models.ForeignKey(db_column='user_id', on_delete=django.db.models.deletion.CASCADE, related_name='points_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'points_rollup',
+                'ordering': ['-bucket_start'],
+                'unique_together': {('period', 'bucket_start', 'user_id', 'reason')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('growth', '0002_points_rollup'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userpet',
+            name='current_level',
+            field=models.IntegerField(db_index=True, default=1),
+        ),
+    ]
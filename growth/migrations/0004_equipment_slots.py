@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:38
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def copy_equipped_items(apps, schema_editor):
+    """is_equipped 플래그를 슬롯 행으로 옮긴다. (슬롯당 가장 최근에 얻은 아이템 하나만)"""
+    UserInventory = apps.get_model('growth', 'UserInventory')
+    UserEquipment = apps.get_model('growth', 'UserEquipment')
+    db_alias = schema_editor.connection.alias
+    slots = {}
+    for inventory_id, user_id, item_type in (
+        UserInventory.objects.using(db_alias).filter(is_equipped=True)
+        .order_by('acquired_at', 'inventory_id')
+        .values_list('inventory_id', 'user_id', 'item_id__item_type')
+    ):
+        slots[(user_id, item_type)] = inventory_id
+    UserEquipment.objects.using(db_alias).bulk_create(
+        [
+            UserEquipment(user_id_id=user_id, slot=slot, inventory_id_id=inventory_id)
+            for (user_id, slot), inventory_id in slots.items()
+        ],
+        batch_size=1000,
+    )
+
+
+def copy_equipment_back(apps, schema_editor):
+    UserInventory = apps.get_model('growth', 'UserInventory')
+    UserEquipment = apps.get_model('growth', 'UserEquipment')
+    db_alias = schema_editor.connection.alias
+    UserInventory.objects.using(db_alias).filter(
+        pk__in=UserEquipment.objects.using(db_alias).values('inventory_id')
+    ).update(is_equipped=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('growth', '0003_leaderboard_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserEquipment',
+            fields=[
+                ('equipment_id', models.AutoField(primary_key=True, serialize=False)),
+                ('slot', models.CharField(choices=[('snack', '간식'), ('decoration', '장식')], max_length=20)),
+                ('equipped_at', models.DateTimeField(auto_now=True)),
+                ('inventory_id', models.ForeignKey(db_column='inventory_id', on_delete=django.db.models.deletion.CASCADE, related_name='equipped_slots', to='growth.userinventory')),
+                ('user_id', models.ForeignKey(db_column='user_id', on_delete=django.db.models.deletion.CASCADE, related_name='equipment', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'user_equipment',
+                'ordering': ['slot'],
+                'constraints': [models.UniqueConstraint(fields=('user_id', 'slot'), name='unique_user_equipment_slot')],
+            },
+        ),
+        migrations.RunPython(copy_equipped_items, copy_equipment_back),
+        migrations.RemoveField(
+            model_name='userinventory',
+            name='is_equipped',
+        ),
+    ]
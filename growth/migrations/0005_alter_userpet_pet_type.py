@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:02
+# 0001_initial 이후 모델에서 바뀐 pet_type 선택지를 반영 (스키마 변경 없음)
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('growth', '0004_equipment_slots'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userpet',
+            name='pet_type',
+            field=models.CharField(choices=[('cat', '고양이'), ('dog', '강아지'), ('tree', '그루트')], default='otter', max_length=20),
+        ),
+    ]
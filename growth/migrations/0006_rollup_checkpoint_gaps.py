@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('growth', '0005_alter_userpet_pet_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rollupcheckpoint',
+            name='gaps',
+            field=models.JSONField(blank=True, default=list, help_text='[[시작, 끝, 발견 시각], ...] (myproject.cursor)'),
+        ),
+    ]
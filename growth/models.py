@@ -1,6 +1,8 @@
 from django.db import models
 from account.models import User
 
+from .progression import progress_percent, xp_to_next_level
+
 # Create your models here.
 
 class PetItem(models.Model):
@@ -37,14 +39,26 @@ class UserPet(models.Model):
     user_pet_id = models.AutoField(primary_key=True)
     user_id = models.OneToOneField(User, on_delete=models.CASCADE, related_name='pet', db_column='user_id')
     pet_type = models.CharField(max_length=20, choices=PET_TYPE_CHOICES, default='otter')
-    current_level = models.IntegerField(default=1)
+    current_level = models.IntegerField(default=1, db_index=True)  # 리더보드 정렬용
     current_xp = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     @property
     def max_xp(self):
-        return (self.current_level + 1) * 100
+        """다음 레벨까지 필요한 XP (growth.progression 기준)"""
+        return xp_to_next_level(self.current_level)
+
+    @property
+    def xp_percent(self):
+        """현재 레벨 내 XP 진행률 (0-100)"""
+        return progress_percent(self.current_level, self.current_xp)
+
+    @property
+    def image_path(self):
+        """현재 레벨 프레임 이미지의 정적 경로 (growth.atlas 에서 미리 계산한 목록)"""
+        from .atlas import frame_image_path
+        return frame_image_path(self.pet_type, self.current_level)
         
     class Meta:
         db_table = 'user_pet'
@@ -58,7 +72,6 @@ class UserInventory(models.Model):
     inventory_id = models.AutoField(primary_key=True)
     user_id = models.ForeignKey(User, on_delete=models.CASCADE, related_name='inventory_items', db_column='user_id')
     item_id = models.ForeignKey(PetItem, on_delete=models.CASCADE, related_name='owned_by_users', db_column='item_id')
-    is_equipped = models.BooleanField(default=False)
     acquired_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
@@ -70,6 +83,32 @@ class UserInventory(models.Model):
         return f"{self.user_id.username} - {self.item_id.item_name}"
 
 
+class UserEquipment(models.Model):
+    """
+    사용자 장착 슬롯 (사용자·슬롯당 한 행)
+
+    슬롯은 아이템 타입과 같다. (user_id, slot) 유니크 제약으로 한 슬롯에 두 아이템이
+    동시에 장착될 수 없고, 장착은 growth.equipment.equip() 의 upsert 한 번으로 처리한다.
+    """
+    SLOT_CHOICES = PetItem.ITEM_TYPE_CHOICES
+
+    equipment_id = models.AutoField(primary_key=True)
+    user_id = models.ForeignKey(User, on_delete=models.CASCADE, related_name='equipment', db_column='user_id')
+    slot = models.CharField(max_length=20, choices=SLOT_CHOICES)
+    inventory_id = models.ForeignKey(UserInventory, on_delete=models.CASCADE, related_name='equipped_slots', db_column='inventory_id')
+    equipped_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'user_equipment'
+        ordering = ['slot']
+        constraints = [
+            models.UniqueConstraint(fields=['user_id', 'slot'], name='unique_user_equipment_slot'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id_id} - {self.get_slot_display()}: {self.inventory_id_id}"
+
+
 class PointsHistory(models.Model):
     """포인트 변동 이력 모델"""
     REASON_CHOICES = [
@@ -95,3 +134,42 @@ class PointsHistory(models.Model):
     
     def __str__(self):
         return f"{self.user_id.username} - {self.points_change:+d} ({self.get_reason_display()})"
+
+
+class PointsRollup(models.Model):
+    """포인트 이력 집계 테이블 (일/주 단위, 사용자·사유별)"""
+    PERIOD_CHOICES = [
+        ('day', '일간'),
+        ('week', '주간'),
+    ]
+    
+    rollup_id = models.BigAutoField(primary_key=True)
+    period = models.CharField(max_length=10, choices=PERIOD_CHOICES)
+    bucket_start = models.DateField(help_text="일간은 해당 날짜, 주간은 그 주 월요일 (TIME_ZONE 기준)")
+    user_id = models.ForeignKey(User, on_delete=models.CASCADE, related_name='points_rollups', db_column='user_id')
+    reason = models.CharField(max_length=30, choices=PointsHistory.REASON_CHOICES)
+    points_total = models.IntegerField(default=0, help_text="points_change 합계 (차감 포함)")
+    points_earned = models.IntegerField(default=0, help_text="적립(양수)만의 합계")
+    entry_count = models.IntegerField(default=0)
+    
+    class Meta:
+        db_table = 'points_rollup'
+        unique_together = ['period', 'bucket_start', 'user_id', 'reason']
+        ordering = ['-bucket_start']
+    
+    def __str__(self):
+        return f"{self.get_period_display()} {self.bucket_start} - user {self.user_id_id} {self.reason}: {self.points_total:+d}"
+
+
+class RollupCheckpoint(models.Model):
+    """집계 작업의 처리 위치 (마지막으로 반영한 point_id + 아직 커밋되지 않았을 수 있는 번호 구간)"""
+    name = models.CharField(max_length=50, primary_key=True)
+    last_id = models.BigIntegerField(default=0)
+    gaps = models.JSONField(default=list, blank=True, help_text='[[시작, 끝, 발견 시각], ...] (myproject.cursor)')
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'rollup_checkpoint'
+    
+    def __str__(self):
+        return f"{self.name} @ {self.last_id}"
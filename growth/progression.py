@@ -0,0 +1,97 @@
+"""
+펫 레벨/XP 진행 곡선
+
+레벨 L 에서 L+1 로 올라가려면 L * XP_PER_LEVEL 의 XP 가 필요하다.
+누적 XP 표를 미리 계산해 두고 bisect 로 레벨을 찾기 때문에
+XP 를 한 번에 많이 받아도 while 루프 없이 O(log n) 으로 레벨이 결정된다.
+포인트 지급 로직, UserPet.max_xp, 템플릿의 XP 바가 모두 이 모듈을 기준으로 한다.
+"""
+from bisect import bisect_right
+
+from django.db import transaction
+from django.utils import timezone
+
+XP_PER_LEVEL = 100
+MAX_LEVEL = 1000
+
+# LEVEL_THRESHOLDS[i] = 레벨 1 에서 시작해 레벨 i+1 에 도달하기 위한 누적 XP
+LEVEL_THRESHOLDS = [XP_PER_LEVEL * (level - 1) * level // 2 for level in range(1, MAX_LEVEL + 1)]
+
+
+def xp_to_next_level(level):
+    """현재 레벨에서 다음 레벨까지 필요한 XP"""
+    return max(int(level), 1) * XP_PER_LEVEL
+
+
+def total_xp(level, xp):
+    """(레벨, 레벨 내 XP) → 누적 XP"""
+    level = min(max(int(level), 1), MAX_LEVEL)
+    return LEVEL_THRESHOLDS[level - 1] + xp
+
+
+def level_for_total_xp(total):
+    """누적 XP → (레벨, 레벨 내 XP)"""
+    total = max(int(total), 0)
+    level = bisect_right(LEVEL_THRESHOLDS, total)
+    return level, total - LEVEL_THRESHOLDS[level - 1]
+
+
+def apply_xp(level, xp, delta):
+    """XP 를 더한 뒤의 (레벨, 레벨 내 XP). 레벨은 내려가지 않는다."""
+    new_level, new_xp = level_for_total_xp(total_xp(level, xp) + delta)
+    if new_level < level:
+        return level, 0
+    return new_level, new_xp
+
+
+def apply_xp_batch(states, deltas):
+    """
+    여러 펫의 레벨업을 한 번에 계산
+
+    states: [(level, xp), ...], deltas: [delta, ...] (같은 길이)
+    반환: [(level, xp), ...]
+    """
+    if len(states) != len(deltas):
+        raise ValueError('states 와 deltas 의 길이가 다릅니다.')
+    return [apply_xp(level, xp, delta) for (level, xp), delta in zip(states, deltas)]
+
+
+def progress_percent(level, xp):
+    """현재 레벨 내 진행률 (0-100)"""
+    return min(100, int(xp * 100 / xp_to_next_level(level)))
+
+
+def grant_pet_xp_bulk(xp_by_user_id, default_pet_type='otter'):
+    """
+    사용자별 XP 를 한 번에 반영
+
+    xp_by_user_id: {user_id: xp_delta}
+    기존 펫은 select_for_update 로 잠근 뒤 읽어 bulk_update 한 번으로 갱신한다.
+    (동시에 같은 사용자에게 지급해도 한쪽의 XP 가 덮어써지지 않는다)
+    펫이 없는 사용자는 레벨 1 펫을 먼저 만들고 같은 방식으로 XP 를 더한다. 그사이 다른 요청이
+    펫을 만들었으면 생성은 무시되고 그 펫을 다시 읽어 더하므로 XP 가 사라지지 않는다.
+    """
+    from .models import UserPet
+
+    if not xp_by_user_id:
+        return
+    user_ids = sorted(xp_by_user_id)
+    with transaction.atomic():
+        # 여러 사용자를 잠글 때 교착을 피하도록 항상 user_id 순서로 잠근다.
+        pets = list(UserPet.objects.select_for_update().filter(user_id__in=user_ids).order_by('user_id'))
+        missing = set(user_ids) - {pet.user_id_id for pet in pets}
+        if missing:
+            UserPet.objects.bulk_create(
+                [UserPet(user_id_id=user_id, pet_type=default_pet_type) for user_id in sorted(missing)],
+                ignore_conflicts=True,
+            )
+            pets += UserPet.objects.select_for_update().filter(user_id__in=missing).order_by('user_id')
+
+        results = apply_xp_batch(
+            [(pet.current_level, pet.current_xp) for pet in pets],
+            [xp_by_user_id[pet.user_id_id] for pet in pets],
+        )
+        now = timezone.now()  # bulk_update 는 auto_now 를 채우지 않는다
+        for pet, (level, xp) in zip(pets, results):
+            pet.current_level, pet.current_xp, pet.updated_at = level, xp, now
+        UserPet.objects.bulk_update(pets, ['current_level', 'current_xp', 'updated_at'])
@@ -0,0 +1,143 @@
+"""
+PointsHistory 일/주 단위 집계
+
+build_points_rollups() 는 RollupCheckpoint 에 기록된 마지막 point_id 이후의 이력(과 그 사이
+늦게 커밋된 이력, myproject.cursor)만 읽어 PointsRollup 에 더한다. 리더보드/일별 발행량 같은 분석 쿼리는 원장(PointsHistory) 대신
+집계 테이블만 읽으므로 비용이 원장 크기가 아니라 버킷 수에 비례한다.
+"""
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q, Sum
+from django.utils import timezone
+
+from myproject.cursor import next_ids
+
+from .models import PointsHistory, PointsRollup, RollupCheckpoint
+
+CHECKPOINT_NAME = 'points_history'
+DEFAULT_BATCH_SIZE = 5000
+
+
+def bucket_start(period, value):
+    """datetime/date → 해당 기간 버킷의 시작 날짜 (TIME_ZONE 기준, 주는 월요일 시작)"""
+    if hasattr(value, 'tzinfo'):
+        value = timezone.localtime(value).date() if timezone.is_aware(value) else value.date()
+    if period == 'week':
+        return value - timedelta(days=value.weekday())
+    return value
+
+
+def build_points_rollups(batch_size=DEFAULT_BATCH_SIZE, progress=None):
+    """
+    새 PointsHistory 를 집계 테이블에 반영
+
+    batch_size 건씩 트랜잭션 하나로 처리하고 체크포인트를 함께 갱신하므로
+    중간에 중단돼도 다음 실행에서 이어서 처리한다. 반환값은 반영한 이력 수.
+    """
+    processed = 0
+    while True:
+        with transaction.atomic():
+            checkpoint, _ = RollupCheckpoint.objects.select_for_update().get_or_create(name=CHECKPOINT_NAME)
+            ids, (last_id, gaps) = next_ids(
+                PointsHistory.objects.all(), 'point_id', checkpoint.last_id, checkpoint.gaps, batch_size
+            )
+            if not ids and gaps == checkpoint.gaps:
+                break
+            rows = list(
+                PointsHistory.objects.filter(point_id__in=ids)
+                .values_list('point_id', 'user_id', 'reason', 'points_change', 'created_at')
+            )
+
+            _apply_rows(rows)
+            checkpoint.last_id, checkpoint.gaps = last_id, gaps
+            checkpoint.save(update_fields=['last_id', 'gaps', 'updated_at'])
+
+        processed += len(rows)
+        if progress:
+            progress(processed, checkpoint.last_id)
+        if len(rows) < batch_size:
+            break
+    return processed
+
+
+def _apply_rows(rows):
+    """이력 묶음을 (기간, 버킷, 사용자, 사유) 별로 합산해 집계 테이블에 더한다."""
+    deltas = defaultdict(lambda: [0, 0, 0])
+    for _, user_id, reason, points_change, created_at in rows:
+        for period in ('day', 'week'):
+            delta = deltas[(period, bucket_start(period, created_at), user_id, reason)]
+            delta[0] += points_change
+            delta[1] += max(points_change, 0)
+            delta[2] += 1
+
+    # 이미 있는 버킷 행을 한 번에 조회
+    lookup = Q()
+    for period in ('day', 'week'):
+        starts = {key[1] for key in deltas if key[0] == period}
+        lookup |= Q(period=period, bucket_start__in=starts)
+    user_ids = {key[2] for key in deltas}
+    existing = {
+        (r.period, r.bucket_start, r.user_id_id, r.reason): r
+        for r in PointsRollup.objects.filter(lookup, user_id__in=user_ids)
+    }
+
+    to_create, to_update = [], []
+    for key, (total, earned, count) in deltas.items():
+        rollup = existing.get(key)
+        if rollup is None:
+            period, start, user_id, reason = key
+            to_create.append(PointsRollup(
+                period=period, bucket_start=start, user_id_id=user_id, reason=reason,
+                points_total=total, points_earned=earned, entry_count=count,
+            ))
+        else:
+            rollup.points_total += total
+            rollup.points_earned += earned
+            rollup.entry_count += count
+            to_update.append(rollup)
+
+    PointsRollup.objects.bulk_create(to_create)
+    PointsRollup.objects.bulk_update(to_update, ['points_total', 'points_earned', 'entry_count'])
+
+
+# ---- 조회 API (집계 테이블만 읽음) ----
+
+def top_earners(period='week', start=None, limit=10):
+    """
+    기간별 상위 적립자
+
+    period='week' + start=None 이면 이번 주, period='all' 이면 전체 기간(주간 버킷 합산).
+    반환: [{'user_id': ..., 'username': ..., 'points': ...}, ...]
+    """
+    if period == 'all':
+        queryset = PointsRollup.objects.filter(period='week')
+    else:
+        start = bucket_start(period, start or timezone.now())
+        queryset = PointsRollup.objects.filter(period=period, bucket_start=start)
+    return list(
+        queryset.values('user_id', 'user_id__username')
+        .annotate(points=Sum('points_earned'))
+        .order_by('-points', 'user_id')[:limit]
+    )
+
+
+def points_issued_per_day(start, end):
+    """일별 발행(적립) 포인트: {date: points} (start, end 포함)"""
+    return dict(
+        PointsRollup.objects.filter(period='day', bucket_start__range=(start, end))
+        .values_list('bucket_start')
+        .annotate(points=Sum('points_earned'))
+        .order_by('bucket_start')
+    )
+
+
+def reason_totals(start, end, period='day'):
+    """사유별 합계: {reason: {'earned': ..., 'net': ..., 'count': ...}}"""
+    rows = (
+        PointsRollup.objects.filter(period=period, bucket_start__range=(start, end))
+        .values('reason')
+        .annotate(earned=Sum('points_earned'), net=Sum('points_total'), count=Sum('entry_count'))
+    )
+    return {row.pop('reason'): row for row in rows}
@@ -0,0 +1,17 @@
+"""
+상점 카탈로그 무효화 시그널
+
+PetItem 이 바뀌면 'pet_items' 버전을 올려 각 프로세스의 카탈로그 캐시(growth.catalog)를 갱신하게 한다.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from myproject.conditional import bump_version
+
+from .models import PetItem
+
+
+@receiver(post_save, sender=PetItem)
+@receiver(post_delete, sender=PetItem)
+def bump_catalog_version(sender, **kwargs):
+    bump_version('pet_items')
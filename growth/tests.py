@@ -1,3 +1,258 @@
-from django.test import TestCase
+import json
+import tempfile
+from datetime import datetime, timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from account.models import User
+
+from .atlas import get_pet_frame
+from .catalog import get_catalog, get_shop_items
+from .models import PetItem, PointsHistory, PointsRollup, UserEquipment, UserInventory, UserPet
+from .progression import (
+    MAX_LEVEL,
+    apply_xp,
+    apply_xp_batch,
+    grant_pet_xp_bulk,
+    level_for_total_xp,
+    total_xp,
+    xp_to_next_level,
+)
+from .rollups import build_points_rollups, points_issued_per_day, reason_totals, top_earners
+
+
+class ProgressionTests(TestCase):
+    """펫 레벨 곡선 테스트"""
+
+    def test_matches_per_level_requirement(self):
+        # 레벨 L → L+1 에 L * 100 XP 필요
+        self.assertEqual(apply_xp(1, 0, 99), (1, 99))
+        self.assertEqual(apply_xp(1, 0, 100), (2, 0))
+        self.assertEqual(apply_xp(2, 50, 250), (3, 100))
+        self.assertEqual(xp_to_next_level(3), 300)
+
+    def test_large_grant_and_round_trip(self):
+        level, xp = apply_xp(1, 0, 10_000_000)
+        self.assertLessEqual(level, MAX_LEVEL)
+        self.assertEqual(total_xp(level, xp), 10_000_000)
+        self.assertEqual(level_for_total_xp(total_xp(7, 123)), (7, 123))
+
+    def test_batch_equals_single(self):
+        states = [(1, 0), (5, 40), (10, 999)]
+        deltas = [150, 0, 5000]
+        self.assertEqual(
+            apply_xp_batch(states, deltas),
+            [apply_xp(level, xp, delta) for (level, xp), delta in zip(states, deltas)],
+        )
+
+    def test_image_path_is_clamped_to_available_frames(self):
+        pet = UserPet(pet_type='dog', current_level=7)
+        self.assertEqual(pet.image_path, 'growth/pet/dog/ezgif-frame-007.png')
+        pet.current_level = MAX_LEVEL
+        self.assertEqual(pet.image_path, 'growth/pet/dog/ezgif-frame-050.png')
+
+    def test_model_property_uses_curve(self):
+        pet = UserPet(current_level=4, current_xp=200)
+        self.assertEqual(pet.max_xp, 400)
+        self.assertEqual(pet.xp_percent, 50)
+
+
+class GrantPetXpBulkTests(TestCase):
+    def test_updates_existing_and_creates_missing(self):
+        a = User.objects.create_user(email='a@example.com', username='a', password='pw')
+        b = User.objects.create_user(email='b@example.com', username='b', password='pw')
+        UserPet.objects.create(user_id=a, pet_type='cat', current_level=1, current_xp=50)
+
+        grant_pet_xp_bulk({a.pk: 100, b.pk: 300})
+
+        pet_a = UserPet.objects.get(user_id=a)
+        pet_b = UserPet.objects.get(user_id=b)
+        self.assertEqual((pet_a.current_level, pet_a.current_xp), (2, 50))
+        self.assertEqual((pet_b.current_level, pet_b.current_xp), (3, 0))
+
+    def test_pet_created_concurrently_keeps_both_grants(self):
+        user = User.objects.create_user(email='c@example.com', username='c', password='pw')
+        bulk_create = UserPet.objects.bulk_create
+
+        def create_after_other_request(objs, **kwargs):
+            # 잠금 조회와 생성 사이에 다른 요청이 펫을 만들고 XP 150 을 준 상황
+            UserPet.objects.create(user_id=user, pet_type='cat', current_level=2, current_xp=50)
+            return bulk_create(objs, **kwargs)
+
+        with mock.patch.object(UserPet.objects, 'bulk_create', side_effect=create_after_other_request):
+            grant_pet_xp_bulk({user.pk: 100})
+
+        pet = UserPet.objects.get(user_id=user)
+        self.assertEqual(pet.pet_type, 'cat')
+        self.assertEqual(total_xp(pet.current_level, pet.current_xp), 250)
+
+
+class PointsRollupTests(TestCase):
+    """포인트 집계 테이블 테스트"""
+
+    def setUp(self):
+        self.a = User.objects.create_user(email='a@example.com', username='a', password='pw')
+        self.b = User.objects.create_user(email='b@example.com', username='b', password='pw')
+
+    def _history(self, user, points, reason, created_at):
+        entry = PointsHistory.objects.create(user_id=user, points_change=points, reason=reason)
+        PointsHistory.objects.filter(pk=entry.pk).update(created_at=created_at)
+
+    def test_incremental_build_and_queries(self):
+        monday = timezone.make_aware(datetime(2025, 12, 1, 12, 0))
+        self._history(self.a, 100, 'meeting_participation', monday)
+        self._history(self.a, -30, 'item_purchase', monday + timedelta(days=1))
+        self._history(self.b, 200, 'admin_approval', monday + timedelta(days=2))
+
+        self.assertEqual(build_points_rollups(), 3)
+        self.assertEqual(build_points_rollups(), 0)
+
+        self._history(self.a, 300, 'meeting_participation', monday + timedelta(days=3))
+        self.assertEqual(build_points_rollups(batch_size=1), 1)
+
+        week = top_earners('week', monday)
+        self.assertEqual([(row['user_id__username'], row['points']) for row in week], [('a', 400), ('b', 200)])
+        self.assertEqual(points_issued_per_day(monday.date(), monday.date() + timedelta(days=6))[monday.date()], 100)
+        totals = reason_totals(monday.date(), monday.date() + timedelta(days=6))
+        self.assertEqual(totals['item_purchase'], {'earned': 0, 'net': -30, 'count': 1})
+        self.assertEqual(PointsRollup.objects.get(period='week', user_id=self.a, reason='meeting_participation').points_total, 400)
+
+
+class ShopCatalogTests(TestCase):
+    """상점 카탈로그 캐시/사용자별 상태 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='s@example.com', username='shopper', password='pw')
+        self.user.total_points = 150
+        self.user.save()
+        UserPet.objects.create(user_id=self.user, pet_type='cat', current_level=2)
+        self.owned = PetItem.objects.create(item_name='리본', item_type='decoration', cost=50)
+        self.cheap = PetItem.objects.create(item_name='간식', item_type='snack', cost=100)
+        self.pricey = PetItem.objects.create(item_name='모자', item_type='decoration', cost=500)
+        self.locked = PetItem.objects.create(item_name='왕관', item_type='decoration', cost=10, required_level=5)
+        inventory = UserInventory.objects.create(user_id=self.user, item_id=self.owned)
+        UserEquipment.objects.create(user_id=self.user, slot='decoration', inventory_id=inventory)
+
+    def test_catalog_is_cached_until_item_changes(self):
+        get_catalog()
+        with self.assertNumQueries(0):
+            get_catalog()
+
+        self.cheap.item_name = '고급 간식'
+        self.cheap.save()
+        with self.assertNumQueries(1):
+            names = [item.item_name for item in get_catalog()]
+        self.assertIn('고급 간식', names)
+
+    def test_projection(self):
+        entries = {entry['item'].item_id: entry for entry in get_shop_items(self.user, 2)}
+        self.assertTrue(entries[self.owned.pk]['owned'] and entries[self.owned.pk]['equipped'])
+        self.assertTrue(entries[self.cheap.pk]['can_purchase'])
+        self.assertFalse(entries[self.pricey.pk]['affordable'])
+        self.assertTrue(entries[self.locked.pk]['locked_by_level'])
+        self.assertFalse(entries[self.locked.pk]['can_purchase'])
+
+    def test_growth_page_uses_single_inventory_query(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse('growth'))  # 카탈로그 적재
+        # 펫 + 인벤토리 + 포인트 이력 (세션/사용자는 캐시)
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('growth'))
+        self.assertContains(response, '장착 중')
+        self.assertContains(response, '레벨 부족')
+
+
+class EquipmentTests(TestCase):
+    """장착 슬롯 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='e@example.com', username='equipper', password='pw')
+        self.ribbon, self.hat = [
+            UserInventory.objects.create(
+                user_id=self.user, item_id=PetItem.objects.create(item_name=name, item_type='decoration', cost=10)
+            )
+            for name in ('리본', '모자')
+        ]
+        self.client.force_login(self.user)
+
+    def _post(self, inventory, action='toggle'):
+        return self.client.post(reverse('equip_item_api', args=[inventory.pk]), {'action': action}).json()
+
+    def test_equip_replaces_slot_and_returns_loadout(self):
+        data = self._post(self.ribbon)
+        self.assertTrue(data['equipped'])
+        self.assertEqual(data['loadout']['decoration']['item_name'], '리본')
+        self.assertIsNone(data['loadout']['snack'])
+
+        data = self._post(self.hat, 'equip')
+        self.assertEqual(data['loadout']['decoration']['inventory_id'], self.hat.pk)
+        self.assertEqual(UserEquipment.objects.filter(user_id=self.user).count(), 1)
+
+        data = self._post(self.hat)
+        self.assertFalse(data['equipped'])
+        self.assertIsNone(data['loadout']['decoration'])
+
+    def test_slot_uniqueness_is_enforced_by_database(self):
+        from django.db import IntegrityError, transaction
+
+        UserEquipment.objects.create(user_id=self.user, slot='decoration', inventory_id=self.ribbon)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            UserEquipment.objects.create(user_id=self.user, slot='decoration', inventory_id=self.hat)
+
+    def test_other_users_inventory_is_not_found(self):
+        other = User.objects.create_user(email='x@example.com', username='other', password='pw')
+        self.client.force_login(other)
+        response = self.client.post(reverse('equip_item_api', args=[self.ribbon.pk]))
+        self.assertEqual(response.status_code, 404)
+
+
+class PetAtlasTests(TestCase):
+    """스프라이트 아틀라스 빌드/프레임 위치 테스트"""
+
+    def setUp(self):
+        from PIL import Image
+
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.static_dir = root / 'static'
+        frames_dir = root / 'frames' / 'cat'
+        frames_dir.mkdir(parents=True)
+        # 5 프레임, 번호 순 정렬이 파일 이름 순서와 달라도 되는지 확인 (9 < 10)
+        for number in (1, 2, 9, 10, 11):
+            Image.new('RGBA', (20, 10), (number, 0, 0, 255)).save(frames_dir / f'ezgif-frame-{number}.png')
+        call_command(
+            'build_pet_atlas', source=str(root / 'frames'), output=str(self.static_dir / 'growth' / 'atlas'),
+            frame_width=8, columns=2, pets=['cat'], stdout=StringIO(),
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_manifest_and_frame_offsets(self):
+        manifest = json.loads((self.static_dir / 'growth' / 'atlas' / 'manifest.json').read_text(encoding='utf-8'))
+        self.assertEqual(
+            manifest['pets']['cat'],
+            {'png': 'cat.png', 'webp': 'cat.webp', 'frame_count': 5, 'frame_width': 8, 'frame_height': 4,
+             'columns': 2, 'rows': 3},
+        )
+        with override_settings(STATICFILES_DIRS=[self.static_dir]):
+            third = get_pet_frame('cat', 3)
+            self.assertEqual((third['size_x'], third['size_y'], third['pos_x'], third['pos_y']), (200, 300, 0, 50))
+            # 프레임 수를 넘는 레벨은 마지막 프레임
+            self.assertEqual((get_pet_frame('cat', 99)['pos_x'], get_pet_frame('cat', 99)['pos_y']), (0, 100))
+            self.assertIsNone(get_pet_frame('dog', 1))
+
+            user = User.objects.create_user(email='atlas@example.com', username='atlas', password='pw')
+            UserPet.objects.create(user_id=user, pet_type='cat', current_level=4)
+            self.client.force_login(user)
+            response = self.client.get(reverse('growth'))
+        self.assertContains(response, 'background-position: 100.0% 50.0%;')
+        self.assertEqual(response.context['pet_frame']['png'], 'growth/atlas/cat.png')
@@ -6,5 +6,6 @@ urlpatterns = [
     path('pet-select/', views.pet_select, name='pet_select'),
     path('purchase/<int:item_id>/', views.purchase_item, name='purchase_item'),
     path('equip/<int:inventory_id>/', views.equip_item, name='equip_item'),
+    path('api/equip/<int:inventory_id>/', views.equip_item_api, name='equip_item_api'),
     path('shop/', views.shop, name='shop'),
 ]
\ No newline at end of file
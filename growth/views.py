@@ -1,8 +1,14 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.http import JsonResponse
+from django.views.decorators.http import require_POST
+from .atlas import PREVIEW_LEVEL, frame_image_path, get_pet_frame
+from .catalog import get_shop_items
+from .equipment import ACTIONS as EQUIP_ACTIONS, change_equipment, get_loadout
 from .models import PetItem, UserPet, UserInventory, PointsHistory
 from account.models import User
+from myproject.ratelimit import rate_limit
 
 # Create your views here.
 
@@ -37,9 +43,8 @@ def pet_select(request):
             return render(request, 'pet_select.html')
     
     pet_choices = [
-        {'type': 'cat', 'name': '고양이'},
-        {'type': 'dog', 'name': '강아지'},
-        {'type': 'tree', 'name': '그루트'},
+        {'type': pet_type, 'name': name, 'image_path': frame_image_path(pet_type, PREVIEW_LEVEL)}
+        for pet_type, name in [('cat', '고양이'), ('dog', '강아지'), ('tree', '그루트')]
     ]
     
     return render(request, 'pet_select.html', {'pet_choices': pet_choices})
@@ -55,27 +60,27 @@ def growth(request):
         # 펫이 없으면 펫 선택 페이지로 리다이렉트
         return redirect('pet_select')
     
-    # 상점 아이템 목록
-    items = PetItem.objects.all().order_by('required_level', 'cost')
-    
-    # 사용자 인벤토리
-    inventory = UserInventory.objects.filter(user_id=request.user)
-    owned_item_ids = set(inventory.values_list('item_id', flat=True))
+    # 상점 목록: 메모리의 카탈로그 + 인벤토리 쿼리 한 번으로 보유/장착/구매 가능 여부 계산
+    shop_items = get_shop_items(request.user, user_pet.current_level)
     
     # 포인트 이력
     points_history = PointsHistory.objects.filter(user_id=request.user).order_by('-created_at')[:10]
     
+    # 스프라이트 아틀라스가 빌드되어 있으면 펫당 이미지 한 장만 로드
+    pet_frame = get_pet_frame(user_pet.pet_type, user_pet.current_level)
+    
     context = {
         'user_pet': user_pet,
-        'items': items,
-        'inventory': inventory,
-        'owned_item_ids': owned_item_ids,
+        'pet_frame': pet_frame,
+        'shop_items': shop_items,
+        'owned_items': [entry for entry in shop_items if entry['owned']],
         'points_history': points_history,
         'user_points': request.user.total_points,
     }
     return render(request, 'growth.html', context)
 
 
+@rate_limit('purchase_item')
 @login_required
 def purchase_item(request, item_id):
     """아이템 구매"""
@@ -113,8 +118,7 @@ def purchase_item(request, item_id):
         # 인벤토리에 추가
         UserInventory.objects.create(
             user_id=request.user,
-            item_id=item,
-            is_equipped=False
+            item_id=item
         )
         
         messages.success(request, f'{item.item_name}을(를) 구매했습니다.')
@@ -124,29 +128,46 @@ def purchase_item(request, item_id):
     return redirect('growth')
 
 
+@rate_limit('equip_item')
 @login_required
 def equip_item(request, inventory_id):
     """아이템 장착/해제"""
-    inventory_item = get_object_or_404(UserInventory, inventory_id=inventory_id, user_id=request.user)
-    
-    # 같은 타입의 다른 아이템 해제 (선택적)
-    if inventory_item.item_id.item_type == 'decoration':
-        # 장식 아이템은 하나만 장착 가능
-        UserInventory.objects.filter(
-            user_id=request.user,
-            item_id__item_type='decoration',
-            is_equipped=True
-        ).update(is_equipped=False)
+    inventory_item = get_object_or_404(
+        UserInventory.objects.select_related('item_id'), inventory_id=inventory_id, user_id=request.user
+    )
     
-    # 토글
-    inventory_item.is_equipped = not inventory_item.is_equipped
-    inventory_item.save()
+    # 같은 타입 슬롯의 다른 아이템은 upsert 로 자동 교체
+    is_equipped = change_equipment(inventory_item)
     
-    status = '장착' if inventory_item.is_equipped else '해제'
+    status = '장착' if is_equipped else '해제'
     messages.success(request, f'{inventory_item.item_id.item_name}을(를) {status}했습니다.')
     
     return redirect('growth')
 
+
+@rate_limit('equip_item')
+@login_required
+@require_POST
+def equip_item_api(request, inventory_id):
+    """
+    아이템 장착/해제 API (AJAX용)
+    POST action=equip|unequip|toggle (기본 toggle) → 장착 여부와 새 슬롯 구성
+    """
+    action = request.POST.get('action', 'toggle')
+    if action not in EQUIP_ACTIONS:
+        return JsonResponse({'error': f'알 수 없는 동작입니다: {action}'}, status=400)
+    
+    inventory_item = get_object_or_404(
+        UserInventory.objects.select_related('item_id'), inventory_id=inventory_id, user_id=request.user
+    )
+    is_equipped = change_equipment(inventory_item, action)
+    
+    return JsonResponse({
+        'inventory_id': inventory_item.inventory_id,
+        'equipped': is_equipped,
+        'loadout': get_loadout(request.user.pk),
+    })
+
 @login_required
 def shop(request):
     return render(request, 'shop.html')
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""
+템플릿 렌더링 벤치마크
+
+실제 페이지를 한 번 요청해 각 페이지가 렌더링한 템플릿과 컨텍스트를 잡아 둔 뒤,
+같은 컨텍스트로 템플릿 렌더링만 반복해 시간을 잰다. (뷰/DB 비용은 포함하지 않음)
+cached 는 설정의 엔진(컴파일 결과 재사용), parse 는 매번 파일을 읽고 컴파일하는 엔진이다.
+
+    python manage.py bench_templates
+    python manage.py bench_templates --user me@example.com --iterations 500 --url /growth/
+"""
+import statistics
+import time
+from contextlib import contextmanager
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.template import Context, Engine
+from django.template.base import Template
+from django.test import Client, override_settings
+
+DEFAULT_URLS = ['/', '/community/', '/donation/', '/growth/', '/mypage/', '/mypage/notifications/']
+DEFAULT_ITERATIONS = 200
+
+
+@contextmanager
+def capture_renders():
+    """요청 중 최상위 템플릿 렌더링을 [(템플릿 이름, 평탄화한 컨텍스트), ...] 로 모은다."""
+    captured = []
+    original = Template._render
+    depth = [0]
+
+    def recording_render(template, context):
+        if depth[0] == 0:
+            captured.append((template.name, context.flatten()))
+        depth[0] += 1
+        try:
+            return original(template, context)
+        finally:
+            depth[0] -= 1
+
+    Template._render = recording_render
+    try:
+        yield captured
+    finally:
+        Template._render = original
+
+
+def _time_renders(get_template, name, context, iterations):
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        get_template(name).render(Context(context))
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.mean(samples), samples[int(len(samples) * 0.95) - 1 if len(samples) > 1 else 0]
+
+
+class Command(BaseCommand):
+    help = '페이지별 템플릿 렌더링 시간(캐시된 템플릿 vs 매번 파싱)을 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help='로그인할 사용자 이메일 또는 이름 (기본: 첫 번째 활성 사용자)')
+        parser.add_argument('--url', action='append', dest='urls', help=f'측정할 페이지 (기본: {" ".join(DEFAULT_URLS)})')
+        parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS, help='템플릿당 렌더링 횟수')
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError('--iterations 는 1 이상이어야 합니다.')
+        user = self._get_user(options['user'])
+        contexts = self._capture(user, options['urls'] or DEFAULT_URLS)
+        if not contexts:
+            raise CommandError('렌더링된 템플릿이 없습니다.')
+
+        engine = Engine.get_default()
+        # 같은 설정이지만 cached.Loader 를 거치지 않는 엔진
+        parse_engine = Engine(
+            dirs=engine.dirs,
+            loaders=['django.template.loaders.filesystem.Loader', 'django.template.loaders.app_directories.Loader'],
+            context_processors=engine.context_processors,
+            debug=engine.debug,
+            libraries=engine.libraries,
+            builtins=engine.builtins,
+        )
+
+        self.stdout.write(f'{"template":<36}{"cached ms":>12}{"p95":>10}{"parse ms":>12}{"p95":>10}')
+        for name, context in contexts.items():
+            cached = _time_renders(engine.get_template, name, context, options['iterations'])
+            parsed = _time_renders(parse_engine.get_template, name, context, options['iterations'])
+            self.stdout.write(f'{name:<36}{cached[0]:>12.3f}{cached[1]:>10.3f}{parsed[0]:>12.3f}{parsed[1]:>10.3f}')
+
+    def _get_user(self, identifier):
+        User = get_user_model()
+        queryset = User.objects.filter(is_active=True)
+        if identifier:
+            user = queryset.filter(email=identifier).first() or queryset.filter(username=identifier).first()
+            if user is None:
+                raise CommandError(f'사용자를 찾을 수 없습니다: {identifier}')
+            return user
+        return queryset.order_by('pk').first()
+
+    def _capture(self, user, urls):
+        """{템플릿 이름: 컨텍스트} (페이지 순서, 같은 템플릿은 처음 것만)"""
+        client = Client()
+        if user is not None:
+            client.force_login(user)
+        contexts = {}
+        with override_settings(ALLOWED_HOSTS=['*']), capture_renders() as captured:
+            for url in urls:
+                response = client.get(url)
+                if response.status_code != 200:
+                    self.stderr.write(f'{url}: {response.status_code} (건너뜀)')
+        for name, context in captured:
+            contexts.setdefault(name, context)
+        return contexts
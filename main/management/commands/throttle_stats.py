@@ -0,0 +1,29 @@
+"""
+요청 제한(myproject.ratelimit) 거절 횟수 확인
+
+    python manage.py throttle_stats
+    python manage.py throttle_stats --reset
+
+거절 횟수는 캐시에 있으므로 웹 워커와 같은 공유 캐시(Redis/Memcached/DB 캐시)를 쓸 때만 의미가 있다.
+"""
+from django.core.management.base import BaseCommand
+
+from myproject.ratelimit import KINDS, get_policies, get_throttle_stats, reset_throttle_stats
+
+
+class Command(BaseCommand):
+    help = '요청 제한 영역별 거절 횟수를 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='출력 후 거절 횟수를 0 으로 초기화')
+
+    def handle(self, *args, **options):
+        for scope, counts in sorted(get_throttle_stats().items()):
+            policies = get_policies(scope)
+            detail = ', '.join(
+                f'{kind}({policies[kind]}) {counts[kind]}' for kind in KINDS if kind in policies
+            )
+            self.stdout.write(f'{scope}: {detail}')
+        if options['reset']:
+            reset_throttle_stats()
+            self.stdout.write(self.style.SUCCESS('거절 횟수를 초기화했습니다.'))
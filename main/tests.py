@@ -1,3 +1,311 @@
-from django.test import TestCase
+import gzip
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
 
-# Create your tests here.
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from account.models import User
+from community.models import CommunityMeeting, MeetingParticipant, MeetingSubmission, SubmissionMedia
+from donation.models import DonationPool
+from growth.models import PointsHistory, UserPet
+from myproject.conditional import bump_version
+from myproject.db_router import PrimaryReplicaRouter, begin_request, end_request
+from myproject.middleware import DEFAULT_CACHE_CONTROL, IMMUTABLE_CACHE_CONTROL, parse_accept_encoding
+from myproject.pagination import EstimatedCountPaginator
+from notification.models import Notification
+
+
+class HomeApiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='home@example.com', username='home', password='pw')
+        UserPet.objects.create(user_id=self.user, pet_type='cat', current_level=2)
+        for i in range(7):
+            CommunityMeeting.objects.create(
+                host_id=self.user, title=f'모임{i}', description='설명', location_name='장소',
+                location_coords='37.5,127.0', meeting_date=timezone.now() + timedelta(days=1),
+            )
+        DonationPool.objects.create(title='풀', goal_points=1000, current_points=250)
+        Notification.objects.create(user_id=self.user, notification_type='system', title='알림', message='내용')
+        self.url = reverse('home_api')
+
+    def test_payload_and_query_count(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse('main'))  # 세션/사용자 캐시 적재
+        # 읽지 않은 알림 수 + 모임 + 기부 풀 + 펫
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+        data = response.json()
+        self.assertEqual(len(data['recent_meetings']), 5)
+        self.assertEqual(data['active_pool']['progress'], 25)
+        self.assertEqual(data['user']['unread_notifications'], 1)
+        self.assertEqual(data['user']['pet']['level'], 2)
+        self.assertIn('ETag', response)
+
+    def test_anonymous(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertIsNone(response.json()['user'])
+
+    def test_not_modified_until_data_changes(self):
+        self.client.force_login(self.user)
+        etag = self.client.get(self.url)['ETag']
+
+        with self.assertNumQueries(1):  # 읽지 않은 알림 수 (세션/사용자는 캐시)
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        meeting = CommunityMeeting.objects.first()
+        MeetingParticipant.objects.create(meeting_id=meeting, user_id=self.user)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        Notification.objects.create(user_id=self.user, notification_type='system', title='알림2', message='내용')
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRoutingTests(TestCase):
+    """읽기 전용 뷰는 복제본을, 쓰기 직후에는 기본 DB 를 읽는지 (SQLite 두 개로 확인)"""
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='rr@example.com', username='rr', password='pw')
+        self.user.save(using='replica')  # 복제가 끝난 행
+        # 아직 복제되지 않은 행 (기본 DB 에만 있음)
+        DonationPool.objects.create(title='새 풀', goal_points=1000)
+        self.notification = Notification.objects.create(
+            user_id=self.user, notification_type='system', title='알림', message='내용'
+        )
+        cache.clear()  # 풀 생성으로 남은 '최근 변경' 표시 제거 (고정 시간 경과)
+        self.client.force_login(self.user)
+
+    def active_pool(self):
+        return self.client.get(reverse('home_api')).json()['active_pool']
+
+    def test_reads_replica_until_user_writes(self):
+        data = self.client.get(reverse('home_api')).json()
+        self.assertIsNone(data['active_pool'])
+        self.assertEqual(data['user']['username'], 'rr')
+
+        # 쓰기 뷰(읽음 처리) 이후에는 잠시 기본 DB 에 고정된다.
+        self.client.get(reverse('notification_read', args=[self.notification.pk]))
+        self.assertEqual(self.active_pool()['title'], '새 풀')
+
+        cache.clear()  # 고정 시간 만료
+        self.assertIsNone(self.active_pool())
+
+    def test_other_users_are_not_pinned(self):
+        self.client.get(reverse('notification_read', args=[self.notification.pk]))
+
+        other = User.objects.create_user(email='o@example.com', username='other', password='pw')
+        other.save(using='replica')
+        self.client.force_login(other)
+        self.assertIsNone(self.active_pool())
+        # 요청 밖의 읽기는 항상 기본 DB
+        self.assertEqual(DonationPool.objects.count(), 1)
+
+    def test_recently_changed_versions_render_from_primary(self):
+        self.assertIsNone(self.active_pool())
+        # 다른 사용자(관리자)가 방금 바꾼 풀: 복제 지연 중일 수 있으므로 새 ETag 의 본문은 기본 DB 에서
+        bump_version('donation_pools')
+        self.assertEqual(self.active_pool()['title'], '새 풀')
+
+    @override_settings(DATABASE_REPLICAS=['replica', 'replica2'])
+    def test_one_replica_per_request(self):
+        router = PrimaryReplicaRouter()
+        state, token = begin_request()
+        try:
+            state.use_replica = True
+            chosen = {router.db_for_read(DonationPool) for _ in range(20)}
+        finally:
+            end_request(token)
+        self.assertEqual(len(chosen), 1)
+
+
+class AdminChangelistQueryTests(TestCase):
+    """관리자 목록의 쿼리 수가 행 수와 무관한지 (N+1 방지)"""
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(email='admin@example.com', username='admin', password='pw')
+        self.client.force_login(self.admin)
+
+    def _users(self, count, prefix):
+        return [
+            User.objects.create_user(email=f'{prefix}{i}@example.com', username=f'{prefix}{i}', password='pw')
+            for i in range(count)
+        ]
+
+    def _meetings(self, hosts):
+        return [
+            CommunityMeeting.objects.create(
+                host_id=host, title=f'{host.username} 모임', description='설명', location_name='장소',
+                location_coords='37.5,127.0', meeting_date=timezone.now() + timedelta(days=1),
+            )
+            for host in hosts
+        ]
+
+    def _assert_flat(self, url, add_rows):
+        """행을 더 넣어도 쿼리 수가 그대로인지"""
+        add_rows('a')
+        self.client.get(url)  # 세션/사용자/ContentType 캐시 적재
+        with CaptureQueriesContext(connection) as baseline:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        add_rows('b')
+        with self.assertNumQueries(len(baseline)):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_points_history(self):
+        def add_rows(prefix):
+            for user in self._users(10, prefix):
+                PointsHistory.objects.create(user_id=user, points_change=100, reason='meeting_participation')
+        self._assert_flat(reverse('admin:growth_pointshistory_changelist'), add_rows)
+
+    def test_notification(self):
+        def add_rows(prefix):
+            for user in self._users(10, prefix):
+                Notification.objects.create(user_id=user, notification_type='system', title='알림', message='내용')
+        self._assert_flat(reverse('admin:notification_notification_changelist'), add_rows)
+
+    def test_community_meeting(self):
+        def add_rows(prefix):
+            for meeting in self._meetings(self._users(10, prefix)):
+                MeetingSubmission.objects.create(meeting_id=meeting, host_id=meeting.host_id)
+        self._assert_flat(reverse('admin:community_communitymeeting_changelist'), add_rows)
+
+    def test_submission_media(self):
+        def add_rows(prefix):
+            for meeting in self._meetings(self._users(10, prefix)):
+                submission = MeetingSubmission.objects.create(meeting_id=meeting, host_id=meeting.host_id)
+                SubmissionMedia.objects.create(
+                    submission_id=submission, user_id=meeting.host_id, media_type='scene_photo',
+                    file_url='https://example.com/a.jpg',
+                )
+        self._assert_flat(reverse('admin:community_submissionmedia_changelist'), add_rows)
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='page@example.com', username='page', password='pw')
+        Notification.objects.bulk_create([
+            Notification(user_id=self.user, notification_type='system', title=f'알림{i}', message='내용')
+            for i in range(10)
+        ])
+        # 삭제된 행: SQLite 추정치(MAX(pk))는 이 행들까지 센다.
+        Notification.objects.filter(title__in=['알림0', '알림1', '알림2', '알림3']).delete()
+        self.max_pk = Notification.objects.order_by('-pk').values_list('pk', flat=True)[0]
+
+    def paginator(self, queryset, threshold):
+        paginator = EstimatedCountPaginator(queryset, 2)
+        paginator.EXACT_COUNT_THRESHOLD = threshold
+        return paginator
+
+    def test_exact_count_below_threshold(self):
+        paginator = self.paginator(Notification.objects.order_by('pk'), threshold=10000)
+        self.assertEqual(paginator.count, 6)
+
+    def test_exact_count_with_filters(self):
+        queryset = Notification.objects.filter(title__in=['알림8', '알림9']).order_by('pk')
+        self.assertEqual(self.paginator(queryset, threshold=1).count, 2)
+
+    def test_estimate_can_run_high(self):
+        paginator = self.paginator(Notification.objects.order_by('pk'), threshold=1)
+        self.assertEqual(paginator.count, self.max_pk)
+        self.assertGreater(paginator.count, 6)
+        # 추정치만큼 늘어난 마지막 페이지는 오류 없이 비어 있다.
+        self.assertEqual(len(paginator.page(paginator.num_pages)), 0)
+
+
+class TemplateBenchmarkTests(TestCase):
+    def test_reports_each_rendered_template(self):
+        user = User.objects.create_user(email='bench@example.com', username='bench', password='pw')
+        UserPet.objects.create(user_id=user, pet_type='cat', current_level=3)
+        out = StringIO()
+
+        call_command('bench_templates', user='bench', urls=['/growth/', '/mypage/'], iterations=2, stdout=out)
+
+        rows = [line.split()[0] for line in out.getvalue().splitlines()[1:]]
+        self.assertEqual(rows, ['growth.html', 'mypage.html'])
+
+
+class StaticFilesTests(TestCase):
+    """collectstatic 결과물(해시 파일명 + .gz)과 StaticFilesMiddleware 의 서빙"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        source = Path(tmp.name) / 'static'
+        (source / 'css').mkdir(parents=True)
+        (source / 'css' / 'app.css').write_text('body { color: #333; }\n' * 50)
+        (source / 'css' / 'tiny.css').write_text('a{}')
+        self.static_root = Path(tmp.name) / 'staticfiles'
+
+        settings_override = override_settings(STATICFILES_DIRS=[source], STATIC_ROOT=self.static_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        call_command('collectstatic', interactive=False, verbosity=0)
+
+        self.hashed_name = staticfiles_storage.stored_name('css/app.css')
+
+    def get(self, name, **headers):
+        response = self.client.get(f'/static/{name}', headers=headers)
+        if response.streaming:
+            response.content_bytes = b''.join(response.streaming_content)
+            response.close()
+        return response
+
+    def test_collectstatic_writes_hashed_names_and_gzip_siblings(self):
+        self.assertRegex(self.hashed_name, r'^css/app\.[0-9a-f]{12}\.css$')
+        original = (self.static_root / self.hashed_name).read_bytes()
+        self.assertEqual(gzip.decompress((self.static_root / (self.hashed_name + '.gz')).read_bytes()), original)
+        # 너무 작은 파일은 압축본을 만들지 않는다.
+        self.assertFalse((self.static_root / 'css' / 'tiny.css.gz').exists())
+
+    def test_hashed_file_is_immutable_and_gzipped_on_request(self):
+        response = self.get(self.hashed_name, accept_encoding='gzip, deflate')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Cache-Control'], IMMUTABLE_CACHE_CONTROL)
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(gzip.decompress(response.content_bytes), (self.static_root / self.hashed_name).read_bytes())
+
+    def test_unhashed_name_gets_short_cache(self):
+        response = self.get('css/app.css')
+
+        self.assertEqual(response['Cache-Control'], DEFAULT_CACHE_CONTROL)
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_encoding_with_q_zero_is_not_served(self):
+        for header in ('gzip;q=0', 'gzip; q=0.0, identity', '*;q=0'):
+            with self.subTest(header=header):
+                response = self.get(self.hashed_name, accept_encoding=header)
+                self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(self.get(self.hashed_name, accept_encoding='*')['Content-Encoding'], 'gzip')
+
+    def test_matching_etag_returns_304(self):
+        etag = self.get(self.hashed_name, accept_encoding='gzip')['ETag']
+
+        response = self.get(self.hashed_name, accept_encoding='gzip', if_none_match=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['Cache-Control'], IMMUTABLE_CACHE_CONTROL)
+        # 압축 여부가 다르면 다른 표현이므로 ETag 도 다르다.
+        self.assertEqual(self.get(self.hashed_name, if_none_match=etag).status_code, 200)
+
+    def test_parse_accept_encoding(self):
+        self.assertEqual(
+            parse_accept_encoding('gzip;q=0.5, BR, deflate;q=oops, *;q=0'),
+            {'gzip': 0.5, 'br': 1.0, '*': 0.0},
+        )
@@ -3,4 +3,5 @@ from . import views
 
 urlpatterns = [
     path('', views.main, name='main'),
+    path('api/home/', views.home_api, name='home_api'),
 ]
\ No newline at end of file
@@ -1,11 +1,21 @@
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET
+from django.views.decorators.vary import vary_on_cookie
 from community.models import CommunityMeeting
 from growth.models import UserPet
-from donation.models import DonationPool
+from donation.routing import featured_pool
+from mypage.summary import get_summary_version
+from myproject.conditional import make_etag, read_versions
+from myproject.db_router import replica_reads
+from notification.models import Notification
 
 # Create your views here.
 
+@replica_reads
 def main(request):
     """메인 홈 페이지"""
     # 최근 모임 목록
@@ -18,7 +28,7 @@ def main(request):
     # 현재 진행 중인 기부 풀
     active_pool = None
     try:
-        active_pool = DonationPool.objects.filter(status='open').order_by('-created_at').first()
+        active_pool = featured_pool()
     except Exception:
         pass
     
@@ -36,3 +46,90 @@ def main(request):
         'user_pet': user_pet,
     }
     return render(request, 'main.html', context)
+
+
+HOME_RECENT_MEETINGS = 5
+
+
+def _home_etag(request):
+    """
+    홈 API 검증자: 모임/기부 풀 버전 + 날짜(대표 풀은 기간으로 고름)
+    + (로그인 시) 사용자 포인트·요약 버전·읽지 않은 알림 수
+
+    응답을 만들기 전에 계산되며, 알림 수는 응답에서도 그대로 쓰도록 request 에 보관한다.
+    """
+    versions = [*read_versions('meetings', 'donation_pools'), timezone.localdate()]
+    if not request.user.is_authenticated:
+        return make_etag(versions)
+    request.home_unread_count = Notification.objects.filter(user_id=request.user, is_read=False).count()
+    return make_etag(
+        versions,
+        request.user.pk,
+        request.user.total_points,
+        get_summary_version(request.user.pk),
+        request.home_unread_count,
+    )
+
+
+@replica_reads
+@require_GET
+@vary_on_cookie
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_home_etag)
+def home_api(request):
+    """
+    홈 화면 JSON API (SPA/모바일용)
+
+    최근 모임, 진행 중인 기부 풀, 내 펫/포인트/읽지 않은 알림 수를 한 번에 반환한다.
+    쿼리 수는 데이터 양과 무관하게 고정(비로그인 2개, 로그인 시 4개. 세션·사용자는 캐시)이고,
+    If-None-Match 가 일치하면 쿼리셋을 만들지 않고 304 를 반환한다.
+    """
+    recent_meetings = [
+        {
+            'id': meeting.meeting_id,
+            'title': meeting.title,
+            'host': meeting.host_id.username,
+            'location_name': meeting.location_name,
+            'meeting_date': meeting.meeting_date.isoformat(),
+            'capacity': meeting.capacity,
+            'participant_count': meeting.participant_count,
+            'status': meeting.status,
+        }
+        for meeting in CommunityMeeting.objects.select_related('host_id').order_by('-created_at')[:HOME_RECENT_MEETINGS]
+    ]
+
+    active_pool = featured_pool()
+    pool_data = None
+    if active_pool is not None:
+        pool_data = {
+            'id': active_pool.pool_id,
+            'title': active_pool.title,
+            'sponsor': active_pool.sponsor,
+            'current_points': active_pool.current_points,
+            'goal_points': active_pool.goal_points,
+            'progress': active_pool.get_progress_percentage(),
+            'end_date': active_pool.end_date.isoformat() if active_pool.end_date else None,
+        }
+
+    user_data = None
+    if request.user.is_authenticated:
+        pet = UserPet.objects.filter(user_id=request.user).first()
+        user_data = {
+            'username': request.user.username,
+            'points': request.user.total_points,
+            'unread_notifications': request.home_unread_count,
+            'pet': {
+                'pet_type': pet.pet_type,
+                'pet_type_display': pet.get_pet_type_display(),
+                'level': pet.current_level,
+                'xp': pet.current_xp,
+                'max_xp': pet.max_xp,
+                'xp_percent': pet.xp_percent,
+            } if pet else None,
+        }
+
+    return JsonResponse({
+        'recent_meetings': recent_meetings,
+        'active_pool': pool_data,
+        'user': user_data,
+    })
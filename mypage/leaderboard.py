@@ -0,0 +1,335 @@
+"""
+사용자 리더보드 (포인트 / 펫 레벨 / 주간 적립)
+
+점수를 고정된 로그 눈금 칸(score_bucket)으로 나눠 칸별 인원을 Fenwick 트리에 두고, 칸 안에서는
+(점수, user_id) 정렬 리스트를 유지해 top-N 과 "내 순위" 를 O(log 칸 수 + 칸 크기) 에 답한다.
+칸 수가 고정이라 메모리는 점수의 크기가 아니라 사용자 수에 비례한다. 프로세스 메모리에 두고 다음과 같이 갱신한다.
+- 포인트: PointsHistory 의 point_id 이후로 변동이 생긴 사용자와 새로 가입한 사용자만 다시 읽는다.
+- 레벨: UserPet.updated_at 이 마지막 동기화 이후(PET_SYNC_OVERLAP_SECONDS 여유)인 펫만 다시 읽는다.
+  (이력 없이 바뀐 레벨도 save()/bulk_update 가 updated_at 을 갱신하므로 잡힌다)
+- 관리자 직접 수정처럼 이력이 없는 포인트 변경은 FULL_REBUILD_SECONDS 마다 전체 재구성으로 반영한다.
+  재구성은 요청을 막지 않도록 백그라운드 스레드에서 새 인덱스를 만든 뒤 교체한다.
+  (인덱스가 웹 프로세스 메모리에 있으므로 관리 명령 등 다른 프로세스에서는 만들 수 없다)
+- 주간: growth.rollups 의 이번 주 집계에서 다시 만든다.
+"""
+import logging
+import threading
+import time
+from bisect import bisect_left, insort
+from datetime import timedelta
+
+from django.db import connection
+from django.db.models import Sum
+from django.utils import timezone
+
+from myproject.db_router import primary_reads
+
+logger = logging.getLogger(__name__)
+
+REFRESH_INTERVAL_SECONDS = 5
+FULL_REBUILD_SECONDS = 600
+# 늦게 커밋된 트랜잭션의 updated_at 을 놓치지 않도록 이만큼 겹쳐 다시 읽는다.
+PET_SYNC_OVERLAP_SECONDS = 60
+BOARDS = ('points', 'level', 'weekly')
+# 점수 칸 눈금: 2의 거듭제곱 구간마다 2 ** (BUCKET_BITS - 1) 칸, 2 ** MAX_SCORE_BITS 까지
+BUCKET_BITS = 4
+MAX_SCORE_BITS = 64
+
+
+class FenwickTree:
+    """칸별 인원 수 누적합 (1-based 내부 인덱스)"""
+
+    def __init__(self, size):
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, index, delta):
+        index += 1
+        while index <= self.size:
+            self.tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, index):
+        """0..index 구간 합"""
+        index = min(index, self.size - 1) + 1
+        total = 0
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+
+def score_bucket(score):
+    """
+    점수가 들어갈 고정 칸 번호 (점수 순서를 유지하는 로그 눈금)
+
+    0~15 는 점수마다 한 칸, 그 위로는 한 칸의 폭이 점수의 1/8 이하다.
+    0 이하 점수는 0번 칸, 2 ** MAX_SCORE_BITS 이상은 마지막 칸에 모인다. (칸 안에서는 정확히 정렬)
+    """
+    if score < 2 ** BUCKET_BITS:
+        return max(score, 0)
+    shift = min(score.bit_length(), MAX_SCORE_BITS) - BUCKET_BITS
+    top_bits = min(score >> shift, 2 ** BUCKET_BITS - 1)
+    return shift * 2 ** (BUCKET_BITS - 1) + top_bits
+
+
+NUM_BUCKETS = score_bucket(2 ** MAX_SCORE_BITS - 1) + 1
+
+
+class ScoreIndex:
+    """
+    점수 순위 자료구조 (user_id → score)
+
+    칸은 score_bucket 의 고정 눈금이라 새 점수가 들어와도 트리를 다시 만들지 않는다.
+    칸마다 (-score, user_id) 정렬 리스트를 두어 칸 안의 순서를 정한다.
+    """
+
+    def __init__(self, entries=()):
+        self.lock = threading.Lock()
+        self.scores = {}
+        self.names = {}
+        self.buckets = [[] for _ in range(NUM_BUCKETS)]  # 칸 → [(-score, user_id), ...] 정렬 리스트
+        self.fenwick = FenwickTree(NUM_BUCKETS)
+        for user_id, name, score in entries:
+            self.scores[user_id] = score
+            self.names[user_id] = name
+            self.buckets[score_bucket(score)].append((-score, user_id))
+        for bucket, members in enumerate(self.buckets):
+            if members:
+                members.sort()
+                self.fenwick.add(bucket, len(members))
+        self.count = len(self.scores)
+
+    def _insert(self, user_id, name, score):
+        self.scores[user_id] = score
+        self.names[user_id] = name
+        self.count += 1
+        bucket = score_bucket(score)
+        insort(self.buckets[bucket], (-score, user_id))
+        self.fenwick.add(bucket, 1)
+
+    def _remove(self, user_id):
+        score = self.scores.pop(user_id)
+        self.names.pop(user_id, None)
+        self.count -= 1
+        bucket = score_bucket(score)
+        members = self.buckets[bucket]
+        del members[bisect_left(members, (-score, user_id))]
+        self.fenwick.add(bucket, -1)
+
+    def update(self, user_id, name, score):
+        with self.lock:
+            if user_id in self.scores:
+                if self.scores[user_id] == score:
+                    self.names[user_id] = name
+                    return
+                self._remove(user_id)
+            self._insert(user_id, name, score)
+
+    def discard(self, user_id):
+        with self.lock:
+            if user_id in self.scores:
+                self._remove(user_id)
+
+    def rank(self, user_id):
+        """1부터 시작하는 순위 (동점이면 user_id 가 작은 쪽이 앞). 없으면 None."""
+        with self.lock:
+            score = self.scores.get(user_id)
+            if score is None:
+                return None
+            bucket = score_bucket(score)
+            above = self.count - self.fenwick.prefix_sum(bucket)
+            within = bisect_left(self.buckets[bucket], (-score, user_id))
+            return above + within + 1
+
+    def top(self, limit):
+        """[(rank, user_id, name, score), ...]"""
+        result = []
+        with self.lock:
+            for members in reversed(self.buckets):
+                for negative_score, user_id in members:
+                    result.append((len(result) + 1, user_id, self.names.get(user_id), -negative_score))
+                    if len(result) >= limit:
+                        return result
+        return result
+
+
+class Leaderboard:
+    """ScoreIndex 를 DB 와 주기적으로 맞추는 래퍼"""
+
+    def __init__(self, board):
+        if board not in BOARDS:
+            raise ValueError(f'알 수 없는 리더보드입니다: {board}')
+        self.board = board
+        self.index = None
+        self.cursor = None         # 마지막으로 반영한 변경 위치 (_current_cursor)
+        self.last_refresh = 0.0
+        self.last_rebuild = 0.0
+        self.refresh_lock = threading.Lock()
+        self.rebuild_thread = None
+
+    def refresh(self, force=False):
+        now = time.monotonic()
+        if not force and self.index is not None and now - self.last_refresh < REFRESH_INTERVAL_SECONDS:
+            return
+        # 워터마크가 복제본마다 다른 지연으로 뒤섞이지 않도록 기본 DB 에서 읽는다.
+        with self.refresh_lock, primary_reads():
+            if self.index is None or self.board == 'weekly':
+                # 처음 한 번(그리고 작은 주간 집계)만 요청 안에서 만든다.
+                self._install(*self._build())
+                self.last_rebuild = now
+            else:
+                self._apply_changes()
+                if now - self.last_rebuild >= FULL_REBUILD_SECONDS:
+                    self.last_rebuild = now
+                    self._schedule_rebuild()
+            self.last_refresh = now
+
+    def rebuild(self):
+        """DB 에서 전체를 다시 읽어 인덱스를 교체 (읽는 동안 기존 인덱스로 계속 응답)"""
+        cursor, index = self._build()
+        with self.refresh_lock:
+            self._install(cursor, index)
+
+    def _schedule_rebuild(self):
+        if self.rebuild_thread is not None and self.rebuild_thread.is_alive():
+            return
+        self.rebuild_thread = threading.Thread(
+            target=self._rebuild_in_background, name=f'leaderboard-{self.board}', daemon=True
+        )
+        self.rebuild_thread.start()
+
+    def _rebuild_in_background(self):
+        try:
+            self.rebuild()
+        except Exception:
+            logger.exception('리더보드 재구성 실패: %s', self.board)
+        finally:
+            connection.close()
+
+    def _build(self):
+        # 커서를 먼저 잡아 두면 읽는 사이의 변경은 다음 _apply_changes 에서 다시 반영된다.
+        cursor = self._current_cursor()
+        return cursor, ScoreIndex(self._load_scores())
+
+    def _install(self, cursor, index):
+        self.cursor = cursor
+        self.index = index
+
+    def _current_cursor(self):
+        from account.models import User
+        from growth.models import PointsHistory
+
+        if self.board == 'points':
+            return (
+                PointsHistory.objects.order_by('-point_id').values_list('point_id', flat=True).first() or 0,
+                User.objects.order_by('-pk').values_list('pk', flat=True).first() or 0,
+            )
+        if self.board == 'level':
+            return timezone.now()
+        return None
+
+    def _changed_user_ids(self, since, until):
+        from account.models import User
+        from growth.models import PointsHistory, UserPet
+
+        if self.board == 'points':
+            (last_point_id, last_user_id), (latest_point_id, latest_user_id) = since, until
+            changed = set()
+            if latest_point_id > last_point_id:
+                changed.update(
+                    PointsHistory.objects.filter(point_id__gt=last_point_id, point_id__lte=latest_point_id)
+                    .values_list('user_id', flat=True)
+                )
+            if latest_user_id > last_user_id:
+                changed.update(
+                    User.objects.filter(pk__gt=last_user_id, pk__lte=latest_user_id).values_list('pk', flat=True)
+                )
+            return changed
+        return set(
+            UserPet.objects.filter(updated_at__gte=since - timedelta(seconds=PET_SYNC_OVERLAP_SECONDS))
+            .values_list('user_id', flat=True)
+        )
+
+    def _load_scores(self, user_ids=None):
+        """[(user_id, username, score), ...]"""
+        from account.models import User
+        from growth.models import UserPet
+        from growth.progression import total_xp
+        from growth.rollups import bucket_start
+
+        if self.board == 'points':
+            queryset = User.objects.filter(is_active=True)
+            if user_ids is not None:
+                queryset = queryset.filter(pk__in=user_ids)
+            return list(queryset.values_list('pk', 'username', 'total_points'))
+
+        if self.board == 'level':
+            queryset = UserPet.objects.filter(user_id__is_active=True)
+            if user_ids is not None:
+                queryset = queryset.filter(user_id__in=user_ids)
+            # 레벨이 같으면 누적 XP 가 많은 쪽이 앞선다.
+            return [
+                (user_id, username, total_xp(level, xp))
+                for user_id, username, level, xp in queryset.values_list(
+                    'user_id', 'user_id__username', 'current_level', 'current_xp'
+                )
+            ]
+
+        from growth.models import PointsRollup
+        return list(
+            PointsRollup.objects.filter(period='week', bucket_start=bucket_start('week', timezone.now()))
+            .values_list('user_id', 'user_id__username')
+            .annotate(points=Sum('points_earned'))
+        )
+
+    def _apply_changes(self):
+        cursor = self._current_cursor()
+        changed = self._changed_user_ids(self.cursor, cursor)
+        if changed:
+            loaded = self._load_scores(changed)
+            for user_id, username, score in loaded:
+                self.index.update(user_id, username, score)
+            for user_id in changed - {row[0] for row in loaded}:
+                self.index.discard(user_id)
+        self.cursor = cursor
+
+    def top(self, limit=10):
+        self.refresh()
+        return [
+            {'rank': rank, 'user_id': user_id, 'username': name, 'score': self._display_score(user_id, score)}
+            for rank, user_id, name, score in self.index.top(limit)
+        ]
+
+    def rank_of(self, user_id):
+        self.refresh()
+        score = self.index.scores.get(user_id)
+        return {
+            'rank': self.index.rank(user_id),
+            'score': self._display_score(user_id, score) if score is not None else None,
+            'total': self.index.count,
+        }
+
+    def _display_score(self, user_id, score):
+        if self.board == 'level':
+            from growth.progression import level_for_total_xp
+            return level_for_total_xp(score)[0]
+        return score
+
+
+_boards = {}
+_boards_lock = threading.Lock()
+
+
+def get_leaderboard(board='points'):
+    """프로세스 단위로 공유되는 리더보드"""
+    with _boards_lock:
+        if board not in _boards:
+            _boards[board] = Leaderboard(board)
+        return _boards[board]
+
+
+def reset_leaderboards():
+    """모든 리더보드를 비워 다음 조회 때 다시 만들게 한다. (테스트/관리용)"""
+    with _boards_lock:
+        _boards.clear()
@@ -0,0 +1,44 @@
+"""
+대시보드 요약 무효화 시그널
+
+요약에 들어가는 데이터(포인트 이력, 펫, 인벤토리, 장착 슬롯, 모임 참여/호스트)가 바뀌면
+해당 사용자의 요약 버전을 올린다. bulk_create / update() 경로는 시그널이 발생하지 않으므로
+호출하는 쪽에서 mypage.summary.bump_summary_version 을 직접 부른다.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from community.models import CommunityMeeting, MeetingParticipant
+from growth.models import PetItem, PointsHistory, UserEquipment, UserInventory, UserPet
+
+from .summary import bump_summary_version
+
+
+@receiver([post_save, post_delete], sender=PointsHistory)
+@receiver([post_save, post_delete], sender=UserPet)
+@receiver([post_save, post_delete], sender=UserInventory)
+@receiver([post_save, post_delete], sender=UserEquipment)
+@receiver([post_save, post_delete], sender=MeetingParticipant)
+def invalidate_user_summary(sender, instance, **kwargs):
+    bump_summary_version(instance.user_id_id)
+
+
+@receiver([post_save, post_delete], sender=CommunityMeeting)
+def invalidate_meeting_summaries(sender, instance, **kwargs):
+    # 모임 제목은 호스트와 참여자 모두의 요약에 들어간다.
+    user_ids = [instance.host_id_id]
+    if not kwargs.get('created') and kwargs.get('signal') is post_save:
+        user_ids += list(
+            MeetingParticipant.objects.filter(meeting_id=instance).values_list('user_id', flat=True)
+        )
+    bump_summary_version(*user_ids)
+
+
+@receiver(post_save, sender=PetItem)
+def invalidate_item_owner_summaries(sender, instance, created, **kwargs):
+    # 아이템 이름/타입이 바뀌면 장착 중인 사용자의 요약만 다시 만든다.
+    if created:
+        return
+    bump_summary_version(
+        *UserEquipment.objects.filter(inventory_id__item_id=instance).values_list('user_id', flat=True)
+    )
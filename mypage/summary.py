@@ -0,0 +1,122 @@
+"""
+마이페이지 대시보드 요약 캐시
+
+사용자별 요약(펫, 장착 아이템, 포인트 이력, 참여/호스트 모임)을 한 번 만들어 캐시에 두고
+해당 사용자의 데이터가 바뀔 때만 버전을 올려 다시 만든다.
+버전은 mypage.signals 의 시그널 핸들러와 bulk 작업 경로(community.tasks 등)에서 올린다.
+"""
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+from myproject.db_router import primary_reads
+
+SUMMARY_TIMEOUT = 60 * 60 * 24
+POINTS_HISTORY_LIMIT = 20
+MEETINGS_LIMIT = 10
+
+
+def _version_key(user_id):
+    return f'mypage:summary:version:{user_id}'
+
+
+def _summary_key(user_id, version):
+    return f'mypage:summary:{user_id}:{version}'
+
+
+def get_summary_version(user_id):
+    """현재 요약 버전 (없으면 시각 기반으로 새로 발급해 이전 캐시와 겹치지 않게 한다)"""
+    version = cache.get(_version_key(user_id))
+    if version is None:
+        version = time.time_ns()
+        cache.add(_version_key(user_id), version, None)
+        version = cache.get(_version_key(user_id), version)
+    return version
+
+
+def _bump(user_ids):
+    for user_id in user_ids:
+        try:
+            cache.incr(_version_key(user_id))
+        except ValueError:
+            cache.set(_version_key(user_id), time.time_ns(), None)
+
+
+def bump_summary_version(*user_ids):
+    """
+    사용자 요약을 무효화 (다음 조회 시 재생성)
+
+    account.user_cache.bump_user_version 처럼 트랜잭션 안이면 커밋 직후에도 한 번 더 올려,
+    커밋 전에 다른 요청이 이전 데이터로 만든 요약이 남지 않게 한다.
+    """
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if not user_ids:
+        return
+    _bump(user_ids)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _bump(user_ids))
+
+
+def get_dashboard_summary(user):
+    """캐시된 요약을 반환하고, 없으면 새로 만든다."""
+    key = _summary_key(user.pk, get_summary_version(user.pk))
+    summary = cache.get(key)
+    if summary is None:
+        # 복제 지연된 데이터가 새 버전으로 캐시되지 않도록 기본 DB 에서 만든다.
+        with primary_reads():
+            summary = build_dashboard_summary(user)
+        cache.set(key, summary, SUMMARY_TIMEOUT)
+    return summary
+
+
+def build_dashboard_summary(user):
+    """대시보드 요약 생성 (캐시에 저장 가능한 기본 타입만 사용)"""
+    from community.models import CommunityMeeting
+    from growth.models import PetItem, PointsHistory, UserEquipment, UserPet
+
+    pet = (
+        UserPet.objects.filter(user_id=user)
+        .values('pet_type', 'current_level', 'current_xp')
+        .first()
+    )
+    if pet:
+        pet['pet_type_display'] = dict(UserPet.PET_TYPE_CHOICES).get(pet['pet_type'], pet['pet_type'])
+
+    item_types = dict(PetItem.ITEM_TYPE_CHOICES)
+    equipped_items = [
+        {'item_name': name, 'item_type_display': item_types.get(item_type, item_type)}
+        for name, item_type in UserEquipment.objects.filter(user_id=user)
+        .values_list('inventory_id__item_id__item_name', 'inventory_id__item_id__item_type')
+    ]
+
+    reasons = dict(PointsHistory.REASON_CHOICES)
+    points_history = [
+        {
+            'points_change': points_change,
+            'reason_display': reasons.get(reason, reason),
+            'created_at': created_at,
+        }
+        for points_change, reason, created_at in PointsHistory.objects.filter(user_id=user)
+        .order_by('-created_at')
+        .values_list('points_change', 'reason', 'created_at')[:POINTS_HISTORY_LIMIT]
+    ]
+
+    participated_meetings = list(
+        CommunityMeeting.objects.filter(participants__user_id=user)
+        .order_by('-created_at')
+        .values('meeting_id', 'title')[:MEETINGS_LIMIT]
+    )
+    hosted_meetings = list(
+        CommunityMeeting.objects.filter(host_id=user)
+        .order_by('-created_at')
+        .values('meeting_id', 'title')[:MEETINGS_LIMIT]
+    )
+
+    return {
+        'pet': pet,
+        'equipped_items': equipped_items,
+        'points_history': points_history,
+        'participated_meetings': participated_meetings,
+        'hosted_meetings': hosted_meetings,
+    }
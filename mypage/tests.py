@@ -1,3 +1,145 @@
+from unittest import mock
+
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+from account.models import User
+from growth.models import PetItem, PointsHistory, UserEquipment, UserInventory, UserPet
+
+from .leaderboard import NUM_BUCKETS, Leaderboard, ScoreIndex, get_leaderboard, reset_leaderboards, score_bucket
+from .summary import bump_summary_version, get_summary_version
+
+
+class DashboardSummaryTests(TestCase):
+    """마이페이지 요약 캐시 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        reset_leaderboards()
+        self.user = User.objects.create_user(email='me@example.com', username='me', password='pw')
+        UserPet.objects.create(user_id=self.user, pet_type='cat')
+        item = PetItem.objects.create(item_name='리본', item_type='decoration', cost=10)
+        inventory = UserInventory.objects.create(user_id=self.user, item_id=item)
+        UserEquipment.objects.create(user_id=self.user, slot='decoration', inventory_id=inventory)
+        self.client.force_login(self.user)
+
+    def test_cached_render_runs_no_queries(self):
+        self.client.get('/mypage/')
+        with self.assertNumQueries(0):  # 요약/세션/사용자 모두 캐시
+            response = self.client.get('/mypage/')
+        self.assertContains(response, '리본')
+        self.assertContains(response, '고양이')
+
+    def test_summary_rebuilt_after_points_change(self):
+        self.client.get('/mypage/')
+        PointsHistory.objects.create(user_id=self.user, points_change=100, reason='meeting_participation')
+
+        response = self.client.get('/mypage/')
+        self.assertContains(response, '+100P')
+
+    def test_version_bumped_again_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            bump_summary_version(self.user.pk)
+            # 커밋 전에 다른 요청이 이전 데이터로 요약을 만들었다고 가정
+            stale_version = get_summary_version(self.user.pk)
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(get_summary_version(self.user.pk), stale_version)
+
+
+class ScoreIndexTests(TestCase):
+    """리더보드 순위 자료구조 테스트"""
+
+    def test_rank_and_top_match_sorted_order(self):
+        scores = {user_id: (user_id * 37) % 101 for user_id in range(1, 60)}
+        index = ScoreIndex((user_id, f'u{user_id}', score) for user_id, score in scores.items())
+        index.update(5, 'u5', 5000)    # 처음 보는 점수
+        index.update(6, 'u6', 0)
+        index.discard(7)
+        scores.update({5: 5000, 6: 0})
+        del scores[7]
+
+        expected = sorted(scores, key=lambda user_id: (-scores[user_id], user_id))
+        self.assertEqual([row[1] for row in index.top(len(expected))], expected)
+        for position, user_id in enumerate(expected, start=1):
+            self.assertEqual(index.rank(user_id), position)
+        self.assertIsNone(index.rank(7))
+
+    def test_buckets_are_fixed_and_ordered(self):
+        edges = [-5, 0, 1, 15, 16, 17, 31, 32, 1000, 10 ** 9, 2 ** 64 - 1, 2 ** 64, 10 ** 30]
+        buckets = [score_bucket(score) for score in edges]
+        self.assertEqual(buckets, sorted(buckets))
+        self.assertEqual(buckets[-1], NUM_BUCKETS - 1)
+
+        index = ScoreIndex([(1, 'u1', 10), (2, 'u2', 10 ** 12), (3, 'u3', 10)])
+        for score in range(100):
+            index.update(1, 'u1', 10 ** 9 + score)   # 같은 칸 안에서 점수가 바뀜
+        index.update(4, 'u4', 10 ** 30)              # 마지막 칸에 모이는 점수도 칸 안에서 정렬
+        index.update(5, 'u5', 2 ** 64)
+        self.assertEqual(index.fenwick.size, NUM_BUCKETS)
+        self.assertEqual([row[1] for row in index.top(5)], [4, 5, 2, 1, 3])
+        self.assertEqual(index.rank(5), 2)
+        self.assertEqual(index.rank(3), 5)
+
+
+class LeaderboardTests(TestCase):
+    def setUp(self):
+        reset_leaderboards()
+        self.users = [
+            User.objects.create_user(email=f'u{i}@example.com', username=f'u{i}', password='pw', total_points=i * 100)
+            for i in range(1, 4)
+        ]
+
+    def test_incremental_refresh_from_points_history(self):
+        board = get_leaderboard('points')
+        self.assertEqual(board.rank_of(self.users[0].pk)['rank'], 3)
+
+        User.objects.filter(pk=self.users[0].pk).update(total_points=1000)
+        PointsHistory.objects.create(user_id=self.users[0], points_change=900, reason='admin_approval')
+        board.refresh(force=True)
+
+        self.assertEqual(board.rank_of(self.users[0].pk), {'rank': 1, 'score': 1000, 'total': 3})
+
+    def test_level_change_without_points_history(self):
+        for user in self.users:
+            UserPet.objects.create(user_id=user, pet_type='cat')
+        board = get_leaderboard('level')
+        self.assertEqual(board.rank_of(self.users[2].pk)['rank'], 3)
+
+        pet = UserPet.objects.get(user_id=self.users[2])
+        pet.current_level = 7
+        pet.save()
+        board.refresh(force=True)
+
+        self.assertEqual(board.rank_of(self.users[2].pk), {'rank': 1, 'score': 7, 'total': 3})
+
+    def test_new_users_join_incrementally(self):
+        board = get_leaderboard('points')
+        board.refresh()
+        user = User.objects.create_user(email='new@example.com', username='new', password='pw')
+        board.refresh(force=True)
+        self.assertEqual(board.rank_of(user.pk), {'rank': 4, 'score': 0, 'total': 4})
+
+    def test_full_rebuild_runs_outside_the_request(self):
+        board = get_leaderboard('points')
+        board.refresh()
+        # 이력 없이 바뀐 포인트 (관리자 직접 수정)
+        User.objects.filter(pk=self.users[0].pk).update(total_points=5000)
+
+        with mock.patch.object(Leaderboard, '_schedule_rebuild') as schedule, \
+                mock.patch('mypage.leaderboard.FULL_REBUILD_SECONDS', 0):
+            board.refresh(force=True)
+        schedule.assert_called_once_with()
+        self.assertEqual(board.rank_of(self.users[0].pk)['rank'], 3)
+
+        board.rebuild()  # 백그라운드 스레드가 실행하는 작업
+        self.assertEqual(board.rank_of(self.users[0].pk)['rank'], 1)
+
+    def test_json_endpoints(self):
+        self.client.force_login(self.users[0])
+        response = self.client.get('/mypage/leaderboard/', {'board': 'points', 'limit': 2})
+        self.assertEqual([entry['username'] for entry in response.json()['entries']], ['u3', 'u2'])
+
+        response = self.client.get('/mypage/leaderboard/me/')
+        self.assertEqual(response.json()['rank'], 3)
+        self.assertEqual(self.client.get('/mypage/leaderboard/', {'board': 'nope'}).status_code, 400)
@@ -5,4 +5,6 @@ urlpatterns = [
     path('', views.mypage, name='mypage'),
     path('notifications/', views.notifications, name='notifications'),
     path('notifications/<int:notification_id>/read/', views.notification_read, name='notification_read'),
+    path('leaderboard/', views.leaderboard_api, name='leaderboard_api'),
+    path('leaderboard/me/', views.leaderboard_me_api, name='leaderboard_me_api'),
 ]
@@ -1,47 +1,36 @@
 from django.shortcuts import render, redirect
+from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
+from myproject.db_router import replica_reads
 from notification.models import Notification
-from growth.models import UserPet, UserInventory, PointsHistory
-from community.models import MeetingParticipant, CommunityMeeting
+from .leaderboard import BOARDS, get_leaderboard
+from .summary import get_dashboard_summary
 
 # Create your views here.
 
+@replica_reads
 @login_required
 def mypage(request):
     """마이페이지"""
-    # 사용자 펫 정보
-    try:
-        user_pet = UserPet.objects.get(user_id=request.user)
-    except UserPet.DoesNotExist:
-        user_pet = None
-    
-    # 인벤토리
-    inventory = UserInventory.objects.filter(user_id=request.user, is_equipped=True)
-    
-    # 포인트 이력
-    points_history = PointsHistory.objects.filter(user_id=request.user).order_by('-created_at')[:20]
-    
-    # 참여한 모임
-    participated_meetings = CommunityMeeting.objects.filter(
-        participants__user_id=request.user
-    ).distinct().order_by('-created_at')[:10]
-    
-    # 호스트한 모임
-    hosted_meetings = CommunityMeeting.objects.filter(
-        host_id=request.user
-    ).order_by('-created_at')[:10]
+    # 펫/장착 아이템/포인트 이력/모임 목록은 사용자별 요약 캐시에서 가져온다.
+    # (해당 사용자의 데이터가 바뀔 때만 mypage.summary 에서 다시 만든다)
+    summary = get_dashboard_summary(request.user)
     
     context = {
         'user': request.user,
-        'user_pet': user_pet,
-        'inventory': inventory,
-        'points_history': points_history,
-        'participated_meetings': participated_meetings,
-        'hosted_meetings': hosted_meetings,
+        'user_pet': summary['pet'],
+        'inventory': summary['equipped_items'],
+        'points_history': summary['points_history'],
+        'participated_meetings': summary['participated_meetings'],
+        'hosted_meetings': summary['hosted_meetings'],
+        'points_rank': get_leaderboard('points').rank_of(request.user.pk),
+        'level_rank': get_leaderboard('level').rank_of(request.user.pk),
+        'top_users': get_leaderboard('points').top(5),
     }
     return render(request, 'mypage.html', context)
 
 
+@replica_reads
 @login_required
 def notifications(request):
     """알림 목록"""
@@ -70,3 +59,34 @@ def notification_read(request, notification_id):
     notification.save()
     
     return redirect('notifications')
+
+
+def _board_param(request):
+    board = request.GET.get('board', 'points')
+    return board if board in BOARDS else None
+
+
+@replica_reads
+@login_required
+def leaderboard_api(request):
+    """리더보드 상위 N명 API"""
+    board = _board_param(request)
+    if board is None:
+        return JsonResponse({'error': f"board 는 {', '.join(BOARDS)} 중 하나여야 합니다."}, status=400)
+    try:
+        limit = min(max(int(request.GET.get('limit', 10)), 1), 100)
+    except ValueError:
+        limit = 10
+    
+    return JsonResponse({'board': board, 'entries': get_leaderboard(board).top(limit)})
+
+
+@replica_reads
+@login_required
+def leaderboard_me_api(request):
+    """내 순위 API"""
+    board = _board_param(request)
+    if board is None:
+        return JsonResponse({'error': f"board 는 {', '.join(BOARDS)} 중 하나여야 합니다."}, status=400)
+    
+    return JsonResponse({'board': board, **get_leaderboard(board).rank_of(request.user.pk)})
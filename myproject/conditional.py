@@ -0,0 +1,145 @@
+"""
+조건부 GET (ETag / Last-Modified) 지원
+
+데이터 영역(namespace)마다 캐시에 버전 카운터를 두고, 해당 데이터가 바뀌면 시그널이나
+bulk 작업 경로에서 bump_version() 으로 올린다. 뷰는 쿼리셋을 만들기 전에
+버전(캐시 조회 한 번)만으로 ETag 를 계산할 수 있다.
+
+    @login_required
+    @conditional_page('meetings', 'submissions')
+    def meeting_detail(request, meeting_id):
+        ...
+
+    etag = make_etag(read_versions('meetings', 'donation_pools'), request.user.pk)
+
+버전을 올리면 REPLICA_PIN_SECONDS 동안 '최근 변경' 표시도 남긴다. 읽기 복제본으로 가는 요청에서
+read_versions() 가 이 표시를 보면 남은 읽기를 기본 DB 로 돌려, 복제가 덜 된 본문이
+새 ETag 로 저장되지 않게 한다. 트랜잭션 안에서 올리면 커밋 직후에 한 번 더 올린다.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_cookie
+
+from .db_router import current_state, get_pin_seconds, stop_replica_reads
+
+VERSION_NAMESPACES = ('meetings', 'submissions', 'donation_pools', 'active_pools', 'pet_items')
+
+
+def _version_key(namespace):
+    return f'conditional:version:{namespace}'
+
+
+def _changed_key(namespace):
+    return f'conditional:changed:{namespace}'
+
+
+def _fetch_versions(keys, found):
+    for key in keys:
+        if key not in found:
+            cache.add(key, time.time_ns(), None)
+            found[key] = cache.get(key)
+    return [found[key] for key in keys]
+
+
+def get_versions(*namespaces):
+    """[버전, ...] (namespaces 순서). 없는 버전은 시각 기반으로 새로 발급한다."""
+    keys = [_version_key(namespace) for namespace in namespaces]
+    return _fetch_versions(keys, cache.get_many(keys))
+
+
+def read_versions(*namespaces):
+    """
+    ETag 용 get_versions
+
+    읽기 복제본으로 가는 요청이고 namespaces 중 하나라도 REPLICA_PIN_SECONDS 안에 바뀌었으면
+    (복제가 덜 됐을 수 있으므로) 요청의 남은 읽기를 기본 DB 로 돌린다. 캐시 조회는 한 번.
+    """
+    state = current_state()
+    if state is None or not state.use_replica:
+        return get_versions(*namespaces)
+    keys = [_version_key(namespace) for namespace in namespaces]
+    changed_keys = [_changed_key(namespace) for namespace in namespaces]
+    found = cache.get_many(keys + changed_keys)
+    if any(key in found for key in changed_keys):
+        stop_replica_reads()
+    return _fetch_versions(keys, found)
+
+
+def _bump(namespaces):
+    pin_seconds = get_pin_seconds()
+    for namespace in namespaces:
+        try:
+            cache.incr(_version_key(namespace))
+        except ValueError:
+            cache.set(_version_key(namespace), time.time_ns(), None)
+    cache.set_many({_changed_key(namespace): True for namespace in namespaces}, pin_seconds)
+
+
+def bump_version(*namespaces):
+    """데이터 영역의 버전을 올려 해당 영역으로 만든 ETag 를 무효화"""
+    namespaces = set(namespaces)
+    unknown = namespaces - set(VERSION_NAMESPACES)
+    if unknown:
+        raise ValueError(f'알 수 없는 버전 영역입니다: {", ".join(sorted(unknown))}')
+    _bump(namespaces)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _bump(namespaces))
+
+
+def make_etag(*parts):
+    """검증자 값들로 약한 ETag 문자열 생성 (따옴표 포함)"""
+    digest = hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _has_pending_messages(request):
+    """아직 표시되지 않은 flash 메시지가 있으면 페이지를 새로 그려야 한다."""
+    storage = getattr(request, '_messages', None)
+    return storage is not None and len(storage) > 0
+
+
+def conditional_page(*namespaces, etag_func=None, last_modified_func=None):
+    """
+    템플릿 페이지용 조건부 GET 데코레이터
+
+    ETag 는 배포 버전(RELEASE_VERSION) + namespaces 버전 + 조회자(pk, is_staff)
+    + etag_func(request, *args, **kwargs) 결과로 만들고, last_modified_func 가 있으면
+    Last-Modified 도 붙인다. 검증자가 일치하면 뷰를 호출하지 않고 304 를 반환한다.
+    페이지에 사용자별 부분(네비게이션, 참여 여부 등)이 있으므로 Vary: Cookie 와
+    Cache-Control: private, no-cache 를 붙여 공유 캐시에 저장되지 않고 항상 재검증되게 한다.
+    """
+    unknown = set(namespaces) - set(VERSION_NAMESPACES)
+    if unknown:
+        raise ValueError(f'알 수 없는 버전 영역입니다: {", ".join(sorted(unknown))}')
+
+    def page_etag(request, *args, **kwargs):
+        if _has_pending_messages(request):
+            return None
+        parts = [
+            getattr(settings, 'RELEASE_VERSION', ''),
+            read_versions(*namespaces),
+            request.user.pk,
+            request.user.is_staff,
+        ]
+        if etag_func is not None:
+            parts.append(etag_func(request, *args, **kwargs))
+        return make_etag(*parts)
+
+    def page_last_modified(request, *args, **kwargs):
+        if _has_pending_messages(request):
+            return None
+        return last_modified_func(request, *args, **kwargs)
+
+    def decorator(view):
+        view = condition(
+            etag_func=page_etag,
+            last_modified_func=page_last_modified if last_modified_func else None,
+        )(view)
+        return vary_on_cookie(cache_control(private=True, no_cache=True)(view))
+    return decorator
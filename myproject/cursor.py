@@ -0,0 +1,68 @@
+"""
+자동 증가 번호(PK) 기반 처리 커서
+
+마지막으로 처리한 번호(last_id)만 기억하면, 번호는 먼저 받았지만 늦게 커밋된 트랜잭션의 행을
+영영 건너뛸 수 있다. 그래서 커서를 옮길 때 사이에 비어 있던 번호 구간(gap)을 함께 기록해 두고
+다음 실행마다 그 구간에 새로 보이는 행이 있는지 다시 확인한다. (늦게 보인 행은 순서가 뒤바뀌어 처리된다)
+롤백된 트랜잭션의 번호는 끝내 채워지지 않으므로 GAP_TIMEOUT_SECONDS 가 지나면 버린다.
+(이보다 오래 열려 있는 트랜잭션이 없어야 한다)
+
+    ids, (last_id, gaps) = next_ids(PointsHistory.objects.all(), 'point_id',
+                                    checkpoint.last_id, checkpoint.gaps, batch_size)
+    ...  # ids 처리
+    checkpoint.last_id, checkpoint.gaps = last_id, gaps  # 처리와 같은 트랜잭션에서 저장
+"""
+import logging
+import time
+
+from django.db.models import Q
+
+logger = logging.getLogger(__name__)
+
+GAP_TIMEOUT_SECONDS = 60 * 10
+
+
+def next_ids(queryset, field, last_id, gaps, batch_size, now=None):
+    """
+    이번에 처리할 번호 목록(오름차순)과 새 커서를 반환: ([id, ...], (last_id, gaps))
+
+    gaps 는 [[시작, 끝, 처음 발견한 시각(epoch 초)], ...] (양 끝 포함, JSONField 에 그대로 저장)
+    채워진 gap 과 last_id 이후의 번호를 각각 최대 batch_size 개씩 돌려준다.
+    """
+    now = time.time() if now is None else now
+    live = [gap for gap in gaps if now - gap[2] < GAP_TIMEOUT_SECONDS]
+    if len(live) < len(gaps):
+        logger.warning('%s: %d개 번호 구간이 채워지지 않아 버림 (롤백된 트랜잭션)', field, len(gaps) - len(live))
+
+    filled = []
+    if live:
+        lookup = Q()
+        for start, end, _ in live:
+            lookup |= Q(**{f'{field}__range': (start, end)})
+        filled = list(queryset.filter(lookup).order_by(field).values_list(field, flat=True)[:batch_size])
+        live = _remove_ids(live, filled)
+
+    new = list(
+        queryset.filter(**{f'{field}__gt': last_id}).order_by(field).values_list(field, flat=True)[:batch_size]
+    )
+    expected = last_id + 1
+    for value in new:
+        if value > expected:
+            live.append([expected, value - 1, now])
+        expected = value + 1
+    return filled + new, (new[-1] if new else last_id, live)
+
+
+def _remove_ids(gaps, ids):
+    """gap 구간에서 ids(오름차순)를 빼고 남은 구간"""
+    remaining = []
+    for start, end, seen in gaps:
+        for value in ids:
+            if value < start or value > end:
+                continue
+            if value > start:
+                remaining.append([start, value - 1, seen])
+            start = value + 1
+        if start <= end:
+            remaining.append([start, end, seen])
+    return remaining
@@ -0,0 +1,143 @@
+"""
+읽기 복제본 라우팅
+
+쓰기는 항상 기본 DB('default')로 보내고, @replica_reads 로 표시한 읽기 전용 뷰의
+GET/HEAD 요청에서만 읽기를 settings.DATABASE_REPLICAS 중 하나로 보낸다.
+관리 명령/디스패처 등 요청 밖의 코드는 항상 기본 DB 를 읽는다.
+
+read-your-writes:
+- 요청 중에 쓰기가 한 번이라도 일어나면 그 요청의 남은 읽기는 기본 DB 로 간다.
+- 쓰기가 있었던 요청이 끝나면 해당 사용자를 REPLICA_PIN_SECONDS 동안 기본 DB 에 고정한다.
+  (복제 지연이 이 시간보다 짧아야 한다)
+
+버전 캐시를 채우는 코드(마이페이지 요약, 상점 카탈로그, 리더보드 등)는 지연된 데이터가 새 버전으로
+캐시되지 않도록 primary_reads() 안에서 읽는다. ETag 뷰는 버전이 REPLICA_PIN_SECONDS 안에 바뀌었으면
+read_versions()(myproject.conditional)가 요청의 남은 읽기를 기본 DB 로 돌린다.
+
+복제본이 여러 개면 요청마다 하나를 골라 그 요청의 읽기는 모두 같은 복제본으로 보낸다.
+(복제본마다 지연이 달라 한 페이지 안에서 데이터가 앞뒤로 섞이지 않도록)
+
+    DATABASE_ROUTERS = ['myproject.db_router.PrimaryReplicaRouter']
+    DATABASE_REPLICAS = ['replica']
+
+    @replica_reads
+    @login_required
+    def mypage(request):
+        ...
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+DEFAULT_PIN_SECONDS = 5
+# 로그인 직후 세션처럼 지연되면 안 되는 앱은 항상 기본 DB 에서 읽는다.
+PRIMARY_ONLY_APPS = {'sessions'}
+
+
+class RoutingState:
+    """요청 하나의 라우팅 상태 (ReplicaRoutingMiddleware 가 만든다)"""
+    __slots__ = ('use_replica', 'wrote', 'replica')
+
+    def __init__(self):
+        self.use_replica = False
+        self.wrote = False
+        self.replica = None        # 첫 읽기 때 고른 복제본
+
+
+_state = ContextVar('db_routing_state', default=None)
+
+
+def get_replicas():
+    return list(getattr(settings, 'DATABASE_REPLICAS', ()))
+
+
+def get_pin_seconds():
+    return getattr(settings, 'REPLICA_PIN_SECONDS', DEFAULT_PIN_SECONDS)
+
+
+def _pin_key(user_id):
+    return f'db_router:pin:{user_id}'
+
+
+def pin_to_primary(user_id):
+    """사용자의 읽기를 REPLICA_PIN_SECONDS 동안 기본 DB 로 고정"""
+    if user_id is not None:
+        cache.set(_pin_key(user_id), True, get_pin_seconds())
+
+
+def is_pinned(user_id):
+    return user_id is not None and cache.get(_pin_key(user_id), False)
+
+
+def begin_request():
+    """새 라우팅 상태를 설정하고 (state, 복원용 token) 반환"""
+    state = RoutingState()
+    return state, _state.set(state)
+
+
+def end_request(token):
+    _state.reset(token)
+
+
+def current_state():
+    """현재 요청의 RoutingState (요청 밖이면 None)"""
+    return _state.get()
+
+
+def replica_reads(view):
+    """읽기 전용 뷰 표시 (다른 데코레이터보다 바깥에 둔다)"""
+    view.replica_reads = True
+    return view
+
+
+def stop_replica_reads():
+    """현재 요청의 남은 읽기를 모두 기본 DB 로 보낸다."""
+    state = _state.get()
+    if state is not None:
+        state.use_replica = False
+
+
+@contextmanager
+def primary_reads():
+    """블록 안의 읽기를 기본 DB 로 보낸다."""
+    state = _state.get()
+    if state is None or not state.use_replica:
+        yield
+        return
+    state.use_replica = False
+    try:
+        yield
+    finally:
+        state.use_replica = True
+
+
+class PrimaryReplicaRouter:
+    """DATABASE_ROUTERS 에 등록하는 라우터"""
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or not state.use_replica or state.wrote:
+            return DEFAULT_DB_ALIAS
+        if model._meta.app_label in PRIMARY_ONLY_APPS:
+            return DEFAULT_DB_ALIAS
+        if state.replica is None:
+            replicas = get_replicas()
+            state.replica = random.choice(replicas) if replicas else DEFAULT_DB_ALIAS
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 기본 DB 의 사본이므로 어느 쪽에서 읽은 객체끼리든 연결할 수 있다.
+        aliases = {DEFAULT_DB_ALIAS, *get_replicas()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
@@ -0,0 +1,217 @@
+"""
+프로젝트 공용 미들웨어
+"""
+import mimetypes
+import os
+import posixpath
+from email.utils import formatdate
+from urllib.parse import unquote
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import MiddlewareNotUsed, SuspiciousFileOperation
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.http import parse_http_date_safe
+
+from .db_router import begin_request, current_state, end_request, get_replicas, is_pinned, pin_to_primary
+
+# 해시가 붙은 파일은 내용이 바뀌면 이름도 바뀌므로 영구 캐시해도 안전하다.
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+DEFAULT_CACHE_CONTROL = 'public, max-age=60'
+
+# Accept-Encoding 우선순위: brotli > gzip
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+
+def parse_accept_encoding(header):
+    """
+    Accept-Encoding 헤더 → {인코딩: q 값}
+
+    'gzip;q=0.5, br' → {'gzip': 0.5, 'br': 1.0}. q 값이 잘못된 항목은 무시한다.
+    """
+    accepted = {}
+    for item in header.split(','):
+        encoding, *params = [part.strip() for part in item.split(';')]
+        if not encoding:
+            continue
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = None
+        if q is not None and 0 <= q <= 1:
+            accepted[encoding.lower()] = q
+    return accepted
+
+
+class StaticFilesMiddleware:
+    """
+    collectstatic 결과물(STATIC_ROOT)을 애플리케이션 안에서 직접 서빙
+
+    nginx 없이도 WSGI/ASGI 어느 쪽에서든 캐시 가능한 정적 파일을 내려준다.
+    - 해시 파일명은 immutable 1년 캐시, 그 외는 짧은 캐시 + ETag 재검증
+    - 사전 압축본(.br/.gz)이 있으면 Accept-Encoding 에 맞춰 선택
+    STATIC_ROOT 에 파일이 없으면 다음 핸들러로 넘긴다.
+    sync/async 양쪽을 지원하므로 ASGI 에서 async 뷰 앞에 두어도 스레드 전환이 생기지 않는다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        self.static_root = settings.STATIC_ROOT
+        self.static_prefix = '/' + settings.STATIC_URL.lstrip('/')
+        if not self.static_root or settings.STATIC_URL.startswith(('http://', 'https://', '//')):
+            raise MiddlewareNotUsed
+        self._immutable_names = None
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        response = self.process_request(request)
+        if response is not None:
+            return response
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        response = self.process_request(request)
+        if response is not None:
+            return response
+        return await self.get_response(request)
+
+    def process_request(self, request):
+        if request.method in ('GET', 'HEAD') and request.path_info.startswith(self.static_prefix):
+            return self.serve(request, request.path_info[len(self.static_prefix):])
+        return None
+
+    @property
+    def immutable_names(self):
+        """manifest 에 기록된 해시 파일명 집합 (최초 요청 시 한 번만 계산)"""
+        if self._immutable_names is None:
+            hashed_files = getattr(staticfiles_storage, 'hashed_files', None) or {}
+            self._immutable_names = set(hashed_files.values())
+        return self._immutable_names
+
+    def serve(self, request, name):
+        name = posixpath.normpath(unquote(name)).lstrip('/')
+        try:
+            path = safe_join(self.static_root, name)
+        except SuspiciousFileOperation:
+            return None
+        if not os.path.isfile(path):
+            return None
+
+        serve_path, encoding = self._negotiate_encoding(request, path)
+        stat = os.stat(path)
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{"-" + encoding if encoding else ""}"'
+        is_immutable = name in self.immutable_names
+        cache_control = IMMUTABLE_CACHE_CONTROL if is_immutable else DEFAULT_CACHE_CONTROL
+
+        if self._not_modified(request, etag, stat.st_mtime):
+            response = HttpResponseNotModified()
+            response['ETag'] = etag
+            response['Cache-Control'] = cache_control
+            return response
+
+        content_type, _ = mimetypes.guess_type(name)
+        response = FileResponse(
+            open(serve_path, 'rb'),
+            content_type=content_type or 'application/octet-stream',
+        )
+        if encoding:
+            response['Content-Encoding'] = encoding
+        if serve_path != path or any(os.path.exists(path + suffix) for _, suffix in ENCODINGS):
+            response['Vary'] = 'Accept-Encoding'
+        response['ETag'] = etag
+        response['Last-Modified'] = formatdate(stat.st_mtime, usegmt=True)
+        response['Cache-Control'] = cache_control
+        return response
+
+    def _not_modified(self, request, etag, mtime):
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match is not None:
+            return etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*'
+        if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+        return if_modified_since is not None and int(mtime) <= if_modified_since
+
+    def _negotiate_encoding(self, request, path):
+        """q 값이 가장 큰 압축본 선택 (같으면 ENCODINGS 순서, q=0 은 거부)"""
+        accepted = parse_accept_encoding(request.headers.get('Accept-Encoding', ''))
+        best = None
+        for encoding, suffix in ENCODINGS:
+            q = accepted.get(encoding, accepted.get('*', 0))
+            if q > 0 and (best is None or q > best[0]) and os.path.isfile(path + suffix):
+                best = (q, path + suffix, encoding)
+        if best is None:
+            return path, None
+        return best[1], best[2]
+
+
+class ReplicaRoutingMiddleware:
+    """
+    요청마다 읽기 복제본 라우팅 상태를 설정 (myproject.db_router)
+
+    @replica_reads 뷰의 GET/HEAD 요청이고 사용자가 기본 DB 에 고정돼 있지 않으면 읽기를 복제본으로 보낸다.
+    요청 중 쓰기가 있었으면 응답 후 사용자를 기본 DB 에 고정한다. (세션의 사용자 ID 기준)
+    세션을 읽으므로 SessionMiddleware 뒤에 둔다. DATABASE_REPLICAS 가 비어 있으면 사용하지 않는다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        if not get_replicas():
+            raise MiddlewareNotUsed
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        state, token = begin_request()
+        try:
+            response = self.get_response(request)
+        finally:
+            end_request(token)
+        if state.wrote:
+            self.pin_writer(request)
+        return response
+
+    async def __acall__(self, request):
+        state, token = begin_request()
+        try:
+            response = await self.get_response(request)
+        finally:
+            end_request(token)
+        if state.wrote:
+            await sync_to_async(self.pin_writer)(request)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        state = current_state()
+        if (
+            state is not None
+            and request.method in ('GET', 'HEAD')
+            and getattr(view_func, 'replica_reads', False)
+            and not is_pinned(self._user_id(request))
+        ):
+            state.use_replica = True
+        return None
+
+    def pin_writer(self, request):
+        pin_to_primary(self._user_id(request))
+
+    @staticmethod
+    def _user_id(request):
+        session = getattr(request, 'session', None)
+        return session.get(SESSION_KEY) if session is not None else None
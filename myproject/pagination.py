@@ -0,0 +1,54 @@
+"""
+대용량 테이블용 페이지네이터
+"""
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    필터가 없는 전체 목록이면 COUNT(*) 대신 DB 통계로 추정한 행 수를 사용
+
+    PointsHistory, Notification 처럼 계속 쌓이기만 하는 테이블은
+    관리자 목록을 열 때마다 전체 COUNT(*) 를 하는 비용이 크다.
+    추정치가 EXACT_COUNT_THRESHOLD 보다 작거나 검색/필터가 걸려 있으면 정확히 센다.
+
+    추정치는 실제보다 클 수 있다. (PostgreSQL/MySQL 은 마지막 통계 갱신 시점 기준,
+    SQLite 는 MAX(pk) 라 삭제된 행까지 센다) 그래서 마지막 몇 페이지는 비어 있을 수 있다.
+    Paginator 는 num_pages 이내의 빈 페이지를 오류 없이 돌려주므로 목록이 깨지지는 않는다.
+    """
+    EXACT_COUNT_THRESHOLD = 10000
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where:
+            return super().count
+
+        estimate = self._estimate(self.object_list)
+        if estimate is None or estimate < self.EXACT_COUNT_THRESHOLD:
+            return super().count
+        return estimate
+
+    def _estimate(self, queryset):
+        model = queryset.model
+        connection = connections[queryset.db]
+        table = model._meta.db_table
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE relname = %s', [table])
+            elif connection.vendor == 'mysql':
+                cursor.execute(
+                    'SELECT table_rows FROM information_schema.tables '
+                    'WHERE table_schema = DATABASE() AND table_name = %s',
+                    [table],
+                )
+            else:
+                # SQLite 등: 자동 증가 PK 의 최댓값을 근사치로 사용 (인덱스만 읽음, 삭제된 행만큼 크게 나옴)
+                pk_column = connection.ops.quote_name(model._meta.pk.column)
+                cursor.execute(f'SELECT MAX({pk_column}) FROM {connection.ops.quote_name(table)}')
+            row = cursor.fetchone()
+        if not row or row[0] is None or row[0] < 0:
+            return None
+        return int(row[0])
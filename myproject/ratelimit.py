@@ -0,0 +1,164 @@
+"""
+토큰 버킷 요청 제한
+
+settings.RATE_LIMITS 의 영역(scope)마다 사용자/IP 별 버킷을 두고, 요청 하나에 토큰 하나를 쓴다.
+버킷은 '개수/기간' 만큼 가득 차 있다가 기간 동안 일정한 속도로 다시 채워진다.
+상태(남은 토큰, 갱신 시각)는 Django 캐시에 두므로 공유 캐시를 쓰면 워커끼리도 공유된다.
+(get/set 이므로 동시 요청이 겹치면 한두 개 더 통과할 수 있다)
+
+데코레이터를 뷰의 가장 바깥에 두면 사용자 조회/뷰 쿼리 전에 거절한다.
+IP 버킷은 DB 없이, 사용자 버킷은 세션의 사용자 ID 로 확인한다.
+
+    RATE_LIMITS = {'meeting_join': {'user': '10/m', 'ip': '60/m'}}
+
+    @rate_limit('meeting_join')
+    @login_required
+    def meeting_join(request, meeting_id):
+        ...
+
+거절 횟수는 영역/종류별로 캐시에 누적되고 get_throttle_stats() 나
+`python manage.py throttle_stats` 로 확인한다.
+"""
+import logging
+import math
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {'s': 1, 'm': 60, 'h': 60 * 60, 'd': 60 * 60 * 24}
+KINDS = ('ip', 'user')
+THROTTLED_MESSAGE = '요청이 너무 많습니다. 잠시 후 다시 시도해주세요.'
+
+
+def parse_rate(rate):
+    """'10/m' → (버킷 크기, 초당 충전량)"""
+    try:
+        count, period = rate.split('/')
+        count = int(count)
+        seconds = PERIODS[period]
+    except (ValueError, KeyError):
+        raise ValueError(f'잘못된 요청 제한 형식입니다: {rate!r} (예: 10/m)')
+    if count <= 0:
+        raise ValueError(f'잘못된 요청 제한 형식입니다: {rate!r} (예: 10/m)')
+    return count, count / seconds
+
+
+def get_policies(scope):
+    """{kind: rate} (설정에 없는 영역은 제한하지 않음)"""
+    return getattr(settings, 'RATE_LIMITS', {}).get(scope, {})
+
+
+def _bucket_key(scope, kind, ident):
+    return f'ratelimit:{scope}:{kind}:{ident}'
+
+
+def _stats_key(scope, kind):
+    return f'ratelimit:throttled:{scope}:{kind}'
+
+
+def consume(key, rate, now=None):
+    """
+    버킷에서 토큰 하나를 꺼낸다. 반환: (허용 여부, 다시 시도할 때까지 남은 초)
+
+    거절할 때는 캐시에 쓰지 않는다.
+    """
+    capacity, refill = parse_rate(rate)
+    now = time.time() if now is None else now
+    state = cache.get(key)
+    tokens, updated = (capacity, now) if state is None else state
+    tokens = min(capacity, tokens + (now - updated) * refill)
+    if tokens < 1:
+        return False, (1 - tokens) / refill
+    # 가득 찰 때까지 걸리는 시간이 지나면 버킷은 다시 가득 찬 상태이므로 키를 버려도 된다.
+    cache.set(key, (tokens - 1, now), math.ceil(capacity / refill) + 1)
+    return True, 0
+
+
+def _client_ip(request):
+    return request.META.get('REMOTE_ADDR') or 'unknown'
+
+
+def _session_user_id(request):
+    session = getattr(request, 'session', None)
+    return session.get(SESSION_KEY) if session is not None else None
+
+
+def check(request, scope):
+    """
+    요청이 scope 의 제한에 걸리는지 확인. 반환: None(통과) 또는 (걸린 종류, 남은 초)
+    """
+    policies = get_policies(scope)
+    for kind in KINDS:
+        rate = policies.get(kind)
+        if rate is None:
+            continue
+        ident = _client_ip(request) if kind == 'ip' else _session_user_id(request)
+        if ident is None:
+            continue
+        allowed, retry_after = consume(_bucket_key(scope, kind, ident), rate)
+        if not allowed:
+            record_throttle(scope, kind)
+            logger.info('rate limited: scope=%s %s=%s', scope, kind, ident)
+            return kind, retry_after
+    return None
+
+
+def record_throttle(scope, kind):
+    key = _stats_key(scope, kind)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+def get_throttle_stats():
+    """{scope: {kind: 거절 횟수}} (설정된 영역 전체)"""
+    scopes = getattr(settings, 'RATE_LIMITS', {})
+    keys = {(scope, kind): _stats_key(scope, kind) for scope in scopes for kind in KINDS}
+    counts = cache.get_many(keys.values())
+    return {
+        scope: {kind: counts.get(keys[scope, kind], 0) for kind in KINDS}
+        for scope in scopes
+    }
+
+
+def reset_throttle_stats():
+    cache.delete_many([_stats_key(scope, kind) for scope in getattr(settings, 'RATE_LIMITS', {}) for kind in KINDS])
+
+
+def _throttled_response(request, retry_after):
+    wants_json = (
+        request.headers.get('x-requested-with') == 'XMLHttpRequest'
+        or 'application/json' in request.headers.get('Accept', '')
+    )
+    if wants_json:
+        response = JsonResponse({'error': THROTTLED_MESSAGE}, status=429)
+    else:
+        response = HttpResponse(THROTTLED_MESSAGE, status=429, content_type='text/plain; charset=utf-8')
+    response['Retry-After'] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+def rate_limit(scope, methods=None):
+    """
+    뷰 요청 제한 데코레이터 (다른 데코레이터보다 바깥에 둔다)
+
+    methods 를 주면 해당 메서드 요청만 제한한다. (예: 폼 화면 GET 은 제외하고 POST 만)
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            if methods is None or request.method in methods:
+                throttled = check(request, scope)
+                if throttled is not None:
+                    return _throttled_response(request, throttled[1])
+            return view(request, *args, **kwargs)
+        return wrapped
+    return decorator
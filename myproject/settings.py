@@ -38,6 +38,8 @@ INSTALLED_APPS = [
     'community',
     'mypage',
     'notification',
+    'outbox',
+    'dataio',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -48,10 +50,12 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'myproject.middleware.StaticFilesMiddleware',  # collectstatic 결과물 직접 서빙 (해시/압축/캐시 헤더)
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'myproject.middleware.ReplicaRoutingMiddleware',  # 읽기 전용 뷰의 읽기를 복제본으로 (DATABASE_REPLICAS 가 있을 때만)
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -62,8 +66,15 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'], # 전역 템플릿 디렉토리 설정
-        'APP_DIRS': True,
         'OPTIONS': {
+            # 컴파일된 템플릿을 프로세스 메모리에 두고 재사용한다. (APP_DIRS 는 loaders 와 함께 쓸 수 없음)
+            # 개발 서버는 템플릿 파일이 바뀌면 이 캐시를 비운다.
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
@@ -83,10 +94,54 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+    },
+    # 읽기 복제본 (myproject.db_router). 운영에서는 기본 DB 의 복제본 접속 정보로 바꾸고
+    # DATABASE_REPLICAS 에 추가한다. 로컬에서는 라우팅 테스트용 별도 SQLite 파일.
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db_replica.sqlite3',
+    },
+}
+DATABASE_ROUTERS = ['myproject.db_router.PrimaryReplicaRouter']
+# @replica_reads 뷰의 읽기를 보낼 별칭 목록. 비어 있으면 모든 읽기가 'default' 로 간다.
+DATABASE_REPLICAS = []
+# 쓰기 후 이 시간 동안 해당 사용자의 읽기를 'default' 로 고정 (read-your-writes)
+REPLICA_PIN_SECONDS = 5
+
+
+# Cache
+# 로컬/단일 프로세스 기본값. 여러 워커를 띄우면 Redis/Memcached 등 공유 캐시로 교체
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'moodgarden-default',
     }
 }
 
 
+# Outbox
+# 기본은 `python manage.py dispatch_events --loop` 를 별도로 실행해 처리한다.
+# 디스패처 없이 개발할 때만 True 로 켜면 커밋 직후 같은 프로세스(요청 안)에서 바로 처리한다.
+OUTBOX_EAGER_DISPATCH = False
+
+# 조건부 GET(ETag)에 섞이는 배포 버전 (myproject.conditional).
+# 템플릿이 바뀌는 배포마다 올리면 클라이언트가 가진 이전 ETag 가 무효화된다.
+RELEASE_VERSION = '2'
+
+# 지급 포인트를 기부 풀에 배분하는 정책 (donation.routing): 'split' / 'priority' / 'round_robin'
+DONATION_ROUTING_POLICY = 'split'
+
+# 요청 제한 (myproject.ratelimit). 영역마다 사용자/IP 별 토큰 버킷 '개수/기간' (기간: s, m, h, d)
+# 영역을 지우면 해당 뷰는 제한하지 않는다.
+RATE_LIMITS = {
+    'meeting_join': {'user': '10/m', 'ip': '60/m'},
+    'meeting_cancel': {'user': '10/m', 'ip': '60/m'},
+    'purchase_item': {'user': '20/m', 'ip': '120/m'},
+    'equip_item': {'user': '60/m', 'ip': '300/m'},
+    'submission_create': {'user': '5/m', 'ip': '30/m'},
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -108,6 +163,18 @@ AUTH_PASSWORD_VALIDATORS = [
 # 사용자 모델 설정
 AUTH_USER_MODEL = 'account.User'
 
+# 세션 사용자는 버전 캐시(account.user_cache)에서 가져온다.
+# ModelBackend 는 배포 전에 만들어진 세션(백엔드 경로가 세션에 저장됨)을 위해 남겨 둔다.
+AUTHENTICATION_BACKENDS = [
+    'account.backends.CachedModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
+# 세션은 캐시에서 읽고 DB 에 함께 기록한다. (캐시가 비워져도 로그인이 유지됨)
+# DB 조회를 완전히 없애려면 'django.contrib.sessions.backends.signed_cookies' 로 바꿀 수 있지만
+# 세션 내용이 클라이언트에 (서명만 된 채로) 노출되고 서버에서 세션을 끊을 수 없다.
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -126,6 +193,16 @@ LOGIN_URL = '/account/login/'
 
 STATIC_URL = 'static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
+STATIC_ROOT = BASE_DIR / 'staticfiles'  # collectstatic 결과물 (해시 파일명 + .gz/.br 압축본)
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'myproject.storage.CompressedManifestStaticFilesStorage',
+    },
+}
 
 # Media files (User uploaded files)
 MEDIA_URL = 'media/'
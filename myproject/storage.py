@@ -0,0 +1,61 @@
+"""
+정적 파일 스토리지
+
+collectstatic 시 파일명에 내용 해시를 붙이고(ManifestStaticFilesStorage),
+텍스트 계열 파일은 .gz / .br 압축본을 함께 만들어 둔다.
+압축본은 myproject.middleware.StaticFilesMiddleware 가 Accept-Encoding 에 맞춰 서빙한다.
+"""
+import gzip
+import os
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+try:
+    import brotli
+except ImportError:  # brotli 는 선택 의존성 (없으면 gzip 만 생성)
+    brotli = None
+
+# 이미 압축된 포맷(png, webp, jpg 등)은 다시 압축해도 이득이 없다.
+COMPRESSIBLE_EXTENSIONS = {
+    '.css', '.js', '.mjs', '.json', '.map', '.svg', '.txt', '.html', '.xml', '.ico',
+}
+# 이보다 작은 파일은 압축 헤더 오버헤드가 더 크다.
+MIN_COMPRESS_SIZE = 256
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """해시 파일명 + gzip/brotli 사전 압축본을 생성하는 스토리지"""
+
+    def stored_name(self, name):
+        # collectstatic 전(개발/테스트 환경)에는 manifest 가 비어 있으므로 원본 경로로 폴백
+        if not self.hashed_files:
+            return name
+        return super().stored_name(name)
+
+    def post_process(self, paths, dry_run=False, **options):
+        for name, hashed_name, processed in super().post_process(paths, dry_run, **options):
+            if not dry_run and hashed_name and not isinstance(processed, Exception):
+                self._compress(name)
+                self._compress(hashed_name)
+            yield name, hashed_name, processed
+
+    def _compress(self, name):
+        """압축 가능한 파일이면 .gz / .br 사본 생성 (크기가 줄어들 때만)"""
+        if os.path.splitext(name)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+            return
+        path = self.path(name)
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb') as fp:
+            content = fp.read()
+        if len(content) < MIN_COMPRESS_SIZE:
+            return
+
+        variants = [('.gz', gzip.compress(content, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            variants.append(('.br', brotli.compress(content, quality=11)))
+
+        for suffix, compressed in variants:
+            if len(compressed) < len(content):
+                with open(path + suffix, 'wb') as fp:
+                    fp.write(compressed)
@@ -29,6 +29,7 @@ urlpatterns = [
     path('mypage/', include('mypage.urls')),
     path('account/', include('account.urls')),
     path('notification/', include('notification.urls')),
+    path('dataio/', include('dataio.urls')),
 ]
 
 # 개발 환경에서 MEDIA 파일 서빙
@@ -1,4 +1,6 @@
 from django.contrib import admin
+from myproject.pagination import EstimatedCountPaginator
+
 from .models import Notification
 
 # Register your models here.
@@ -7,9 +9,14 @@ from .models import Notification
 class NotificationAdmin(admin.ModelAdmin):
     list_display = ['notification_id', 'user_id', 'notification_type', 'title', 'is_read', 'created_at']
     list_filter = ['notification_type', 'is_read', 'created_at']
+    list_select_related = ['user_id']
     search_fields = ['user_id__username', 'user_id__email', 'title', 'message']
     readonly_fields = ['notification_id', 'created_at']
+    autocomplete_fields = ['user_id', 'related_meeting_id', 'related_pool_id']
     date_hierarchy = 'created_at'
+    # 계속 쌓이는 알림 테이블: 전체 COUNT(*) 대신 추정치 사용
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     actions = ['mark_as_read', 'mark_as_unread']
     
     def mark_as_read(self, request, queryset):
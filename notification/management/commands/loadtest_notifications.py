@@ -0,0 +1,128 @@
+"""
+알림 폴링 API 부하 테스트
+
+실행 중인 서버(WSGI/ASGI)에 로그인 세션으로 동시 폴링 요청을 보내 처리량과 지연 시간을 잰다.
+--server-pid 를 주면 서버 프로세스(와 워커 스레드)의 RSS 도 함께 기록한다.
+
+    uvicorn myproject.asgi:application --port 8001 &
+    python manage.py loadtest_notifications --url http://127.0.0.1:8001 --username demo --server-pid $!
+
+    gunicorn myproject.wsgi:application --threads 32 --bind 127.0.0.1:8002 &
+    python manage.py loadtest_notifications --url http://127.0.0.1:8002 --username demo --server-pid $!
+"""
+import asyncio
+import statistics
+import time
+from importlib import import_module
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+ENDPOINTS = ('notification_count', 'notification_list_api')
+
+
+def read_rss_kb(pid):
+    """/proc/<pid>/status 의 (VmRSS, VmHWM) KB. 읽을 수 없으면 (None, None)."""
+    values = {}
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                key, _, rest = line.partition(':')
+                if key in ('VmRSS', 'VmHWM'):
+                    values[key] = int(rest.split()[0])
+    except OSError:
+        return None, None
+    return values.get('VmRSS'), values.get('VmHWM')
+
+
+async def fetch(host, port, path, cookie):
+    """HTTP/1.1 GET 한 번 (Connection: close). (status, 소요 시간 초) 반환."""
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(
+        f'GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\nCookie: {cookie}\r\n'
+        f'Accept: application/json\r\nConnection: close\r\n\r\n'.encode()
+    )
+    await writer.drain()
+    status_line = await reader.readline()
+    await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    status = int(status_line.split()[1]) if status_line else 0
+    return status, time.perf_counter() - started
+
+
+class Command(BaseCommand):
+    help = '알림 폴링 API 에 동시 요청을 보내 처리량/지연 시간/서버 메모리를 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000', help='서버 주소')
+        parser.add_argument('--username', required=True, help='폴링할 사용자 (세션을 직접 발급)')
+        parser.add_argument('--endpoint', choices=ENDPOINTS, default='notification_count')
+        parser.add_argument('--concurrency', type=int, default=100, help='동시 연결 수')
+        parser.add_argument('--requests', type=int, default=2000, help='총 요청 수')
+        parser.add_argument('--server-pid', type=int, help='메모리 사용량을 기록할 서버 프로세스 PID')
+
+    def handle(self, *args, **options):
+        if options['concurrency'] < 1 or options['requests'] < 1:
+            raise CommandError('--concurrency 와 --requests 는 1 이상이어야 합니다.')
+        url = urlsplit(options['url'])
+        if url.scheme != 'http' or not url.hostname:
+            raise CommandError('--url 은 http://host:port 형식이어야 합니다.')
+
+        cookie = f'{settings.SESSION_COOKIE_NAME}={self._session_key(options["username"])}'
+        path = reverse(options['endpoint'])
+        pid = options['server_pid']
+        rss_before, _ = read_rss_kb(pid) if pid else (None, None)
+
+        started = time.perf_counter()
+        results = asyncio.run(self._run(
+            url.hostname, url.port or 80, path, cookie, options['concurrency'], options['requests']
+        ))
+        elapsed = time.perf_counter() - started
+
+        latencies = sorted(latency for _, latency in results)
+        failures = sum(1 for status, _ in results if status != 200)
+        self.stdout.write(f'{options["endpoint"]}: {len(results)}건 / {elapsed:.2f}s '
+                          f'= {len(results) / elapsed:.1f} req/s (동시 {options["concurrency"]}, 실패 {failures})')
+        self.stdout.write(f'지연 시간 p50 {statistics.median(latencies) * 1000:.1f}ms, '
+                          f'p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:.1f}ms, '
+                          f'max {latencies[-1] * 1000:.1f}ms')
+        if pid:
+            rss_after, peak = read_rss_kb(pid)
+            if rss_after is None:
+                self.stderr.write(self.style.WARNING(f'PID {pid} 의 메모리 정보를 읽을 수 없습니다.'))
+            else:
+                self.stdout.write(f'서버 RSS {rss_before / 1024:.1f}MB → {rss_after / 1024:.1f}MB '
+                                  f'(peak {peak / 1024:.1f}MB)')
+
+    def _session_key(self, username):
+        """로그인 폼을 거치지 않고 해당 사용자의 세션을 만든다."""
+        User = get_user_model()
+        try:
+            user = User.objects.get(username=username)
+        except User.DoesNotExist:
+            raise CommandError(f'사용자를 찾을 수 없습니다: {username}')
+        session = import_module(settings.SESSION_ENGINE).SessionStore()
+        session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.save()
+        return session.session_key
+
+    async def _run(self, host, port, path, cookie, concurrency, total):
+        queue = iter(range(total))
+        results = []
+
+        async def worker():
+            for _ in queue:
+                try:
+                    results.append(await fetch(host, port, path, cookie))
+                except OSError:
+                    results.append((0, 0.0))
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return results
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notification', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='notification_type',
+            field=models.CharField(choices=[('ai_approved', 'AI 자동 승인'), ('admin_review', '관리자 검토 대기'), ('admin_rejected', '인증 반려'), ('points_earned', '포인트 지급'), ('donation_completed', '기부 목표 달성'), ('submission_reminder', '인증 제출 요청'), ('submission_expired', '인증 기한 만료')], max_length=30),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:20
+# 0001_initial 의 수동 인덱스 이름을 모델(Meta.indexes)이 만드는 자동 이름으로 맞춘다.
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notification', '0002_meeting_lifecycle'),
+    ]
+
+    operations = [
+        migrations.RenameIndex(
+            model_name='notification',
+            new_name='notificatio_user_id_d569bc_idx',
+            old_name='notification_user_id_is_read_idx',
+        ),
+    ]
@@ -11,6 +11,8 @@ class Notification(models.Model):
         ('admin_rejected', '인증 반려'),
         ('points_earned', '포인트 지급'),
         ('donation_completed', '기부 목표 달성'),
+        ('submission_reminder', '인증 제출 요청'),
+        ('submission_expired', '인증 기한 만료'),
     ]
     
     notification_id = models.AutoField(primary_key=True)
@@ -1,5 +1,47 @@
+import asyncio
+
+from asgiref.sync import iscoroutinefunction
 from django.test import TestCase
+from django.urls import reverse
+
+from account.models import User
+
+from . import views
+from .models import Notification
+
+
+class NotificationApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='n@example.com', username='n', password='pw')
+        other = User.objects.create_user(email='o@example.com', username='o', password='pw')
+        Notification.objects.bulk_create(
+            [Notification(user_id=cls.user, notification_type='system', title=f'알림 {i}', message='내용',
+                          is_read=i < 3) for i in range(12)]
+            + [Notification(user_id=other, notification_type='system', title='남의 알림', message='내용')]
+        )
+
+    def test_views_are_native_async(self):
+        self.assertTrue(iscoroutinefunction(views.notification_count))
+        self.assertTrue(iscoroutinefunction(views.notification_list_api))
+
+    async def test_requires_login(self):
+        response = await self.async_client.get(reverse('notification_count'))
+        self.assertEqual(response.status_code, 302)
 
-# Create your tests here.
+    async def test_count_and_list(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse('notification_count'))
+        self.assertEqual(response.json(), {'count': 9})
 
+        response = await self.async_client.get(reverse('notification_list_api'))
+        notifications = response.json()['notifications']
+        self.assertEqual(len(notifications), 10)
+        self.assertNotIn('남의 알림', {n['title'] for n in notifications})
 
+    async def test_concurrent_polls(self):
+        await self.async_client.aforce_login(self.user)
+        responses = await asyncio.gather(
+            *(self.async_client.get(reverse('notification_count')) for _ in range(20))
+        )
+        self.assertEqual({r.json()['count'] for r in responses}, {9})
@@ -1,28 +1,35 @@
-from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
+from myproject.db_router import replica_reads
 from .models import Notification
 
 # Create your views here.
+# 헤더의 알림 배지가 주기적으로 폴링하는 API 이므로 ASGI 에서 스레드를 점유하지 않도록
+# async 뷰로 작성한다. (login_required 는 async 뷰를 그대로 지원하며 request.auser() 로 인증)
 
+
+@replica_reads
 @login_required
-def notification_count(request):
+async def notification_count(request):
     """읽지 않은 알림 개수 API"""
-    count = Notification.objects.filter(
-        user_id=request.user,
+    user = await request.auser()
+    count = await Notification.objects.filter(
+        user_id=user,
         is_read=False
-    ).count()
-    
+    ).acount()
+
     return JsonResponse({'count': count})
 
 
+@replica_reads
 @login_required
-def notification_list_api(request):
+async def notification_list_api(request):
     """알림 목록 API (AJAX용)"""
+    user = await request.auser()
     notifications = Notification.objects.filter(
-        user_id=request.user
+        user_id=user
     ).order_by('-created_at')[:10]
-    
+
     data = [{
         'id': n.notification_id,
         'type': n.notification_type,
@@ -30,6 +37,6 @@ def notification_list_api(request):
         'message': n.message,
         'is_read': n.is_read,
         'created_at': n.created_at.strftime('%Y-%m-%d %H:%M'),
-    } for n in notifications]
-    
+    } async for n in notifications]
+
     return JsonResponse({'notifications': data})
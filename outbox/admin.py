@@ -0,0 +1,30 @@
+from django.contrib import admin
+
+from myproject.pagination import EstimatedCountPaginator
+
+from .models import DeadLetter, HandlerCheckpoint, OutboxEvent
+
+# Register your models here.
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ['event_id', 'event_type', 'created_at']
+    list_filter = ['event_type', 'created_at']
+    readonly_fields = ['event_id', 'event_type', 'payload', 'created_at']
+    date_hierarchy = 'created_at'
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(HandlerCheckpoint)
+class HandlerCheckpointAdmin(admin.ModelAdmin):
+    list_display = ['handler_name', 'last_event_id', 'attempts', 'last_error', 'updated_at']
+    readonly_fields = ['updated_at']
+
+
+@admin.register(DeadLetter)
+class DeadLetterAdmin(admin.ModelAdmin):
+    list_display = ['dead_letter_id', 'handler_name', 'event_id', 'created_at']
+    list_filter = ['handler_name']
+    readonly_fields = ['handler_name', 'event_id', 'error', 'created_at']
+    raw_id_fields = ['event_id']
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class OutboxConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'outbox'
+
+    def ready(self):
+        # 각 앱의 handlers.py 에서 이벤트 핸들러를 등록한다.
+        from django.utils.module_loading import autodiscover_modules
+        autodiscover_modules('handlers')
@@ -0,0 +1,106 @@
+"""
+아웃박스 이벤트 디스패처
+
+핸들러마다 HandlerCheckpoint 를 두고, 체크포인트 이후의 이벤트를 batch_size 개씩 전달한다.
+핸들러 실행과 체크포인트 갱신은 같은 트랜잭션이므로 DB 만 건드리는 핸들러는 한 번만 반영되고,
+실패하면 롤백 후 다음 실행에서 같은 묶음을 다시 받는다(at-least-once).
+한 핸들러가 실패해도 다른 핸들러는 계속 진행한다.
+
+체크포인트는 myproject.cursor 로 옮기므로 늦게 커밋된 트랜잭션의 이벤트도 건너뛰지 않는다.
+같은 묶음이 max_attempts 번 연속 실패하면 이벤트를 하나씩 다시 전달하고, 혼자서도 실패하는
+이벤트(poison event)는 DeadLetter 에 남기고 건너뛴다.
+"""
+import logging
+import time
+
+from django.db import transaction
+from django.db.models import F
+
+from myproject.cursor import next_ids
+
+from .events import get_handlers
+from .models import DeadLetter, HandlerCheckpoint, OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+MAX_ATTEMPTS = 5
+
+
+def dispatch_pending(batch_size=DEFAULT_BATCH_SIZE, handler_names=None, max_attempts=MAX_ATTEMPTS):
+    """
+    모든(또는 지정한) 핸들러에 밀린 이벤트를 전달
+
+    반환: {handler_name: {'events': 처리한 이벤트 수, 'skipped': 건너뛴 이벤트 수,
+                          'seconds': 소요 시간, 'error': 오류 메시지 or None}}
+    """
+    stats = {}
+    for name, registered in sorted(get_handlers().items()):
+        if handler_names and name not in handler_names:
+            continue
+        started = time.monotonic()
+        processed, skipped, error = _dispatch_handler(registered, batch_size, max_attempts)
+        stats[name] = {
+            'events': processed, 'skipped': skipped, 'seconds': time.monotonic() - started, 'error': error,
+        }
+    return stats
+
+
+def _dispatch_handler(registered, batch_size, max_attempts):
+    processed = skipped = 0
+    while True:
+        try:
+            with transaction.atomic():
+                checkpoint, _ = HandlerCheckpoint.objects.select_for_update().get_or_create(
+                    handler_name=registered.name
+                )
+                # 번호 구간 확인에는 모든 타입의 이벤트가 필요하다.
+                ids, (last_event_id, gaps) = next_ids(
+                    OutboxEvent.objects.all(), 'event_id', checkpoint.last_event_id, checkpoint.gaps, batch_size
+                )
+                if not ids and gaps == checkpoint.gaps:
+                    return processed, skipped, None
+                events = list(
+                    OutboxEvent.objects.filter(event_id__in=ids, event_type__in=registered.event_types)
+                    .order_by('event_id')
+                )
+
+                failed = 0
+                if events and checkpoint.attempts >= max_attempts:
+                    failed = _deliver_one_by_one(registered, events)
+                elif events:
+                    registered.func(events)
+
+                checkpoint.last_event_id = last_event_id
+                checkpoint.gaps = gaps
+                checkpoint.attempts = 0
+                checkpoint.last_error = ''
+                checkpoint.save(update_fields=['last_event_id', 'gaps', 'attempts', 'last_error', 'updated_at'])
+        except Exception as e:
+            logger.exception('outbox handler %s failed', registered.name)
+            HandlerCheckpoint.objects.get_or_create(handler_name=registered.name)
+            HandlerCheckpoint.objects.filter(handler_name=registered.name).update(
+                attempts=F('attempts') + 1, last_error=f'{type(e).__name__}: {e}'[:2000]
+            )
+            return processed, skipped, str(e)
+
+        processed += len(events) - failed
+        skipped += failed
+
+
+def _deliver_one_by_one(registered, events):
+    """연속 실패한 묶음을 이벤트 하나씩 전달. 실패한 이벤트는 DeadLetter 로 남기고 건너뛴 수를 반환."""
+    skipped = 0
+    for event in events:
+        try:
+            with transaction.atomic():
+                registered.func([event])
+        except Exception as e:
+            logger.exception('outbox handler %s skipped event #%s', registered.name, event.event_id)
+            DeadLetter.objects.get_or_create(
+                handler_name=registered.name,
+                event_id=event,
+                defaults={'error': f'{type(e).__name__}: {e}'[:2000]},
+            )
+            skipped += 1
+    return skipped
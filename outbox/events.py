@@ -0,0 +1,61 @@
+"""
+도메인 이벤트 발행/핸들러 등록
+
+상태 변경 코드는 publish() 로 이벤트를 같은 트랜잭션 안에서 OutboxEvent 에 기록만 하고,
+알림·기부 풀 갱신 같은 후속 작업은 dispatch_events 명령(outbox.dispatcher)이
+등록된 핸들러에 묶음으로 전달한다.
+
+    from outbox.events import handler
+
+    @handler('points_granted', name='community.points_notifications')
+    def send_points_notifications(events):
+        ...
+"""
+from collections import namedtuple
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import OutboxEvent
+
+EVENT_TYPES = {choice for choice, _ in OutboxEvent.EVENT_TYPE_CHOICES}
+
+Handler = namedtuple('Handler', ['name', 'event_types', 'func'])
+
+_handlers = {}
+
+
+def handler(*event_types, name=None):
+    """이벤트 핸들러 등록 데코레이터. 핸들러는 OutboxEvent 리스트를 받는다."""
+    unknown = set(event_types) - EVENT_TYPES
+    if unknown:
+        raise ValueError(f'알 수 없는 이벤트 타입입니다: {", ".join(sorted(unknown))}')
+
+    def decorator(func):
+        handler_name = name or f'{func.__module__}.{func.__name__}'
+        _handlers[handler_name] = Handler(handler_name, tuple(event_types), func)
+        return func
+    return decorator
+
+
+def get_handlers():
+    return dict(_handlers)
+
+
+def publish(event_type, **payload):
+    """이벤트 하나를 기록 (호출한 쪽의 트랜잭션에 포함됨)"""
+    return publish_many(event_type, [payload])[0]
+
+
+def publish_many(event_type, payloads):
+    """같은 타입의 이벤트 여러 개를 bulk_create 로 기록"""
+    if event_type not in EVENT_TYPES:
+        raise ValueError(f'알 수 없는 이벤트 타입입니다: {event_type}')
+    events = OutboxEvent.objects.bulk_create(
+        [OutboxEvent(event_type=event_type, payload=payload) for payload in payloads]
+    )
+    if events and getattr(settings, 'OUTBOX_EAGER_DISPATCH', False):
+        # 개발 환경: 별도 디스패처 없이 커밋 직후 바로 처리
+        from .dispatcher import dispatch_pending
+        transaction.on_commit(dispatch_pending)
+    return events
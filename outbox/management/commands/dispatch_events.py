@@ -0,0 +1,51 @@
+"""
+아웃박스 이벤트 디스패치
+
+    python manage.py dispatch_events                 # 밀린 이벤트를 한 번 처리 (cron)
+    python manage.py dispatch_events --loop --interval 1
+    python manage.py dispatch_events --handler donation.credit_pools
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from outbox.dispatcher import DEFAULT_BATCH_SIZE, MAX_ATTEMPTS, dispatch_pending
+from outbox.events import get_handlers
+
+
+class Command(BaseCommand):
+    help = '아웃박스에 쌓인 도메인 이벤트를 등록된 핸들러에 묶음으로 전달합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='핸들러 호출 한 번에 전달할 이벤트 수')
+        parser.add_argument('--max-attempts', type=int, default=MAX_ATTEMPTS,
+                            help='같은 묶음이 이만큼 연속 실패하면 하나씩 다시 전달하고 실패한 이벤트는 건너뜀')
+        parser.add_argument('--handler', action='append', dest='handlers', help='특정 핸들러만 실행 (여러 번 지정 가능)')
+        parser.add_argument('--loop', action='store_true', help='종료하지 않고 계속 실행')
+        parser.add_argument('--interval', type=float, default=1.0, help='--loop 에서 한 바퀴 사이 대기 시간(초)')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size 는 1 이상이어야 합니다.')
+        if options['max_attempts'] < 1:
+            raise CommandError('--max-attempts 는 1 이상이어야 합니다.')
+        unknown = set(options['handlers'] or []) - set(get_handlers())
+        if unknown:
+            raise CommandError(f'등록되지 않은 핸들러: {", ".join(sorted(unknown))}')
+
+        while True:
+            stats = dispatch_pending(
+                batch_size=options['batch_size'],
+                max_attempts=options['max_attempts'],
+                handler_names=options['handlers'],
+            )
+            for name, stat in stats.items():
+                if stat['skipped']:
+                    self.stderr.write(self.style.WARNING(f'{name}: {stat["skipped"]}건 건너뜀 (DeadLetter 확인)'))
+                if stat['error']:
+                    self.stderr.write(self.style.ERROR(f'{name}: {stat["events"]}건 처리 후 실패 - {stat["error"]}'))
+                elif stat['events'] or not options['loop']:
+                    self.stdout.write(f'{name}: {stat["events"]}건 ({stat["seconds"]:.2f}s)')
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
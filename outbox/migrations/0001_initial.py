@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HandlerCheckpoint',
+            fields=[
+                ('handler_name', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('last_event_id', models.BigIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'outbox_handler_checkpoint',
+            },
+        ),
+        migrations.CreateModel(
+            name='OutboxEvent',
+            fields=[
+                ('event_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('event_type', models.CharField(choices=[('points_granted', '포인트 지급'), ('submission_approved', '인증 승인'), ('submission_rejected', '인증 반려'), ('pool_completed', '기부 목표 달성')], max_length=50)),
+                ('payload', models.JSONField(default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'outbox_event',
+                'ordering': ['event_id'],
+                'indexes': [models.Index(fields=['event_type', 'event_id'], name='outbox_even_event_t_e56952_idx')],
+            },
+        ),
+    ]
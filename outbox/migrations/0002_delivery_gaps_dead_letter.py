@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('outbox', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='handlercheckpoint',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0, help_text='같은 묶음의 연속 실패 횟수'),
+        ),
+        migrations.AddField(
+            model_name='handlercheckpoint',
+            name='gaps',
+            field=models.JSONField(blank=True, default=list, help_text='[[시작, 끝, 발견 시각], ...] (myproject.cursor)'),
+        ),
+        migrations.CreateModel(
+            name='DeadLetter',
+            fields=[
+                ('dead_letter_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('handler_name', models.CharField(max_length=100)),
+                ('error', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('event_id', models.ForeignKey(db_column='event_id', on_delete=django.db.models.deletion.CASCADE, related_name='dead_letters', to='outbox.outboxevent')),
+            ],
+            options={
+                'db_table': 'outbox_dead_letter',
+                'ordering': ['-created_at'],
+                'unique_together': {('handler_name', 'event_id')},
+            },
+        ),
+    ]
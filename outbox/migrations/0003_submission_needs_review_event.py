@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('outbox', '0002_delivery_gaps_dead_letter'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='outboxevent',
+            name='event_type',
+            field=models.CharField(choices=[('points_granted', '포인트 지급'), ('submission_approved', '인증 승인'), ('submission_rejected', '인증 반려'), ('submission_needs_review', '관리자 검토 대기'), ('pool_completed', '기부 목표 달성')], max_length=50),
+        ),
+    ]
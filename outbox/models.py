@@ -0,0 +1,61 @@
+from django.db import models
+
+# Create your models here.
+
+class OutboxEvent(models.Model):
+    """도메인 이벤트 아웃박스 (상태 변경과 같은 트랜잭션에서 기록)"""
+    EVENT_TYPE_CHOICES = [
+        ('points_granted', '포인트 지급'),
+        ('submission_approved', '인증 승인'),
+        ('submission_rejected', '인증 반려'),
+        ('submission_needs_review', '관리자 검토 대기'),
+        ('pool_completed', '기부 목표 달성'),
+    ]
+    
+    event_id = models.BigAutoField(primary_key=True)
+    event_type = models.CharField(max_length=50, choices=EVENT_TYPE_CHOICES)
+    payload = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'outbox_event'
+        ordering = ['event_id']
+        indexes = [
+            models.Index(fields=['event_type', 'event_id']),  # 핸들러별 미처리 이벤트 조회
+        ]
+    
+    def __str__(self):
+        return f"#{self.event_id} {self.event_type}"
+
+
+class HandlerCheckpoint(models.Model):
+    """핸들러별 처리 위치 (마지막으로 처리한 event_id + 아직 커밋되지 않았을 수 있는 번호 구간)"""
+    handler_name = models.CharField(max_length=100, primary_key=True)
+    last_event_id = models.BigIntegerField(default=0)
+    gaps = models.JSONField(default=list, blank=True, help_text='[[시작, 끝, 발견 시각], ...] (myproject.cursor)')
+    attempts = models.PositiveIntegerField(default=0, help_text='같은 묶음의 연속 실패 횟수')
+    last_error = models.TextField(blank=True, default='')
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'outbox_handler_checkpoint'
+    
+    def __str__(self):
+        return f"{self.handler_name} @ {self.last_event_id}"
+
+
+class DeadLetter(models.Model):
+    """핸들러가 하나씩 다시 전달해도 실패해 건너뛴 이벤트"""
+    dead_letter_id = models.BigAutoField(primary_key=True)
+    handler_name = models.CharField(max_length=100)
+    event_id = models.ForeignKey(OutboxEvent, on_delete=models.CASCADE, related_name='dead_letters', db_column='event_id')
+    error = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'outbox_dead_letter'
+        ordering = ['-created_at']
+        unique_together = ['handler_name', 'event_id']
+
+    def __str__(self):
+        return f"{self.handler_name} #{self.event_id_id}"
@@ -0,0 +1,149 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from account.models import User
+from community.models import CommunityMeeting, MeetingParticipant
+from community.tasks import grant_points_for_meeting
+from donation.models import DonationHistory, DonationPool
+from myproject.cursor import GAP_TIMEOUT_SECONDS, next_ids
+
+from . import events as outbox_events
+from .dispatcher import dispatch_pending
+from .events import handler, publish
+from .models import DeadLetter, HandlerCheckpoint, OutboxEvent
+
+
+class OutboxDispatchTests(TestCase):
+    """아웃박스 디스패처 테스트"""
+
+    def setUp(self):
+        self.host = User.objects.create_user(email='host@example.com', username='host', password='pw')
+        self.member = User.objects.create_user(email='m@example.com', username='m', password='pw')
+        self.meeting = CommunityMeeting.objects.create(
+            host_id=self.host, title='산책', description='d', location_name='공원',
+            location_coords='37.5,127.0', meeting_date=timezone.now() + timedelta(days=1),
+        )
+        MeetingParticipant.objects.create(meeting_id=self.meeting, user_id=self.member)
+
+    def test_points_flow_through_to_pool_and_hall_of_fame(self):
+        pool = DonationPool.objects.create(title='간식 기부', goal_points=200)
+
+        grant_points_for_meeting(self.meeting)
+        pool.refresh_from_db()
+        self.assertEqual(pool.current_points, 0)  # 아직 디스패치 전
+
+        dispatch_pending()  # points_granted → 풀 적립 → pool_completed 발행
+        dispatch_pending()  # pool_completed → 명예의 전당
+
+        pool.refresh_from_db()
+        self.assertEqual((pool.current_points, pool.status), (200, 'completed'))
+        self.assertEqual(DonationHistory.objects.filter(pool_id=pool).count(), 2)
+
+        # 다시 실행해도 체크포인트 이후 이벤트가 없으므로 중복 적립되지 않는다.
+        dispatch_pending()
+        pool.refresh_from_db()
+        self.assertEqual(pool.current_points, 200)
+
+    def test_failing_handler_retries_without_blocking_others(self):
+        calls = []
+
+        @handler('pool_completed', name='test.flaky')
+        def flaky(events):
+            calls.append([event.event_id for event in events])
+            if len(calls) == 1:
+                raise RuntimeError('boom')
+
+        try:
+            event = publish('pool_completed', pool_id=0)
+            with self.assertLogs('outbox.dispatcher', 'ERROR'):
+                stats = dispatch_pending()
+            self.assertEqual(stats['test.flaky']['error'], 'boom')
+            self.assertIsNone(stats['donation.hall_of_fame']['error'])
+            self.assertIn('boom', HandlerCheckpoint.objects.get(handler_name='test.flaky').last_error)
+
+            stats = dispatch_pending()
+            self.assertEqual(stats['test.flaky']['events'], 1)
+            self.assertEqual(calls, [[event.event_id], [event.event_id]])
+        finally:
+            outbox_events._handlers.pop('test.flaky', None)
+
+    def test_late_committed_event_is_not_skipped(self):
+        received = []
+
+        @handler('pool_completed', name='test.recorder')
+        def recorder(events):
+            received.extend(event.payload['pool_id'] for event in events)
+
+        try:
+            _, late, last = [publish('pool_completed', pool_id=i) for i in range(3)]
+            # 번호만 받고 아직 커밋되지 않은 트랜잭션의 이벤트
+            late_id = late.event_id
+            late.delete()
+            dispatch_pending(handler_names=['test.recorder'])
+            self.assertEqual(received, [0, 2])
+            checkpoint = HandlerCheckpoint.objects.get(handler_name='test.recorder')
+            self.assertEqual(checkpoint.last_event_id, last.event_id)
+            self.assertEqual([gap[:2] for gap in checkpoint.gaps], [[late_id, late_id]])
+
+            OutboxEvent.objects.create(event_id=late_id, event_type='pool_completed', payload={'pool_id': 1})
+            dispatch_pending(handler_names=['test.recorder'])
+            self.assertEqual(received, [0, 2, 1])
+            self.assertEqual(HandlerCheckpoint.objects.get(handler_name='test.recorder').gaps, [])
+        finally:
+            outbox_events._handlers.pop('test.recorder', None)
+
+    def test_poison_event_is_dead_lettered_after_max_attempts(self):
+        delivered = []
+
+        @handler('pool_completed', name='test.poison')
+        def poison(events):
+            if any(event.payload['pool_id'] == 'bad' for event in events):
+                raise ValueError('bad payload')
+            delivered.extend(event.event_id for event in events)
+
+        try:
+            good = publish('pool_completed', pool_id=1)
+            bad = publish('pool_completed', pool_id='bad')
+            with self.assertLogs('outbox.dispatcher', 'ERROR'):
+                for _ in range(2):
+                    stats = dispatch_pending(handler_names=['test.poison'], max_attempts=2)
+                    self.assertEqual(stats['test.poison']['error'], 'bad payload')
+                stats = dispatch_pending(handler_names=['test.poison'], max_attempts=2)
+
+            self.assertEqual(
+                (stats['test.poison']['events'], stats['test.poison']['skipped'], stats['test.poison']['error']),
+                (1, 1, None),
+            )
+            self.assertEqual(delivered, [good.event_id])
+            dead = DeadLetter.objects.get()
+            self.assertEqual((dead.handler_name, dead.event_id_id), ('test.poison', bad.event_id))
+            self.assertEqual(HandlerCheckpoint.objects.get(handler_name='test.poison').attempts, 0)
+        finally:
+            outbox_events._handlers.pop('test.poison', None)
+
+    def test_unknown_event_type_is_rejected(self):
+        with self.assertRaises(ValueError):
+            publish('nope')
+        self.assertFalse(OutboxEvent.objects.exists())
+
+
+class GapCursorTests(TestCase):
+    """myproject.cursor 의 번호 구간 추적"""
+
+    def test_expired_gaps_are_dropped(self):
+        first = OutboxEvent.objects.create(event_type='pool_completed')
+        OutboxEvent.objects.filter(pk=first.pk).delete()
+        second = OutboxEvent.objects.create(event_type='pool_completed')
+
+        ids, (last_id, gaps) = next_ids(OutboxEvent.objects.all(), 'event_id', first.pk - 1, [], 10, now=1000)
+        self.assertEqual((ids, last_id), ([second.pk], second.pk))
+        self.assertEqual(gaps, [[first.pk, first.pk, 1000]])
+
+        self.assertEqual(next_ids(OutboxEvent.objects.all(), 'event_id', last_id, gaps, 10, now=1001)[1][1], gaps)
+        with self.assertLogs('myproject.cursor', 'WARNING'):
+            self.assertEqual(
+                next_ids(OutboxEvent.objects.all(), 'event_id', last_id, gaps, 10, now=1000 + GAP_TIMEOUT_SECONDS),
+                ([], (last_id, [])),
+            )